@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+Activity Log for REO Dashboard
+Append-only log of indexer status changes: one JSON object per line, plus a small
+metadata file that is rewritten on every run. Appending and reading never load or
+rewrite the whole history.
+
+Every run that logs changes gets a run ID, and an index records the byte offset and
+time at which each run's changes start, so readers can seek straight to the changes
+of recent runs.
+
+compact() moves the changes of older months out of this hot log into monthly partition
+files (optionally gzip-compressed), each with a small index by address.
+"""
+
+import glob
+import gzip
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import serialization
+
+# Status changes, one JSON object per line
+DEFAULT_LOG_FILE = 'activity_log_indexers_status_changes.jsonl'
+
+# last_check, last_oracle_update_time, the last run ID and the number of entries in the log
+DEFAULT_METADATA_FILE = 'activity_log_indexers_status_changes_metadata.json'
+
+# One line per run with changes: {"run_id", "logged_at", "offset", "count"}
+DEFAULT_INDEX_FILE = 'activity_log_indexers_status_changes_index.jsonl'
+
+# Single-document log written by earlier versions, converted on first use
+LEGACY_LOG_FILE = 'activity_log_indexers_status_changes.json'
+
+# Monthly partitions of compacted history: status_changes_<YYYY-MM>.jsonl[.gz] and .index.json
+DEFAULT_ARCHIVE_DIR = 'activity_log_archive'
+PARTITION_PREFIX = 'status_changes_'
+
+# Months (including the current one) whose changes stay in the hot log
+DEFAULT_HOT_MONTHS = 1
+
+
+def _write_json_atomic(path: str, data: dict) -> None:
+    """Write a JSON file through a temporary file, so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    serialization.dump_file(tmp_path, data)
+    os.replace(tmp_path, path)
+
+
+def migrate_legacy_log(log_file: str = DEFAULT_LOG_FILE, metadata_file: str = DEFAULT_METADATA_FILE, legacy_file: str = LEGACY_LOG_FILE) -> bool:
+    """
+    Convert the single-document JSON log of earlier versions to the JSONL log.
+    Does nothing if the JSONL log already exists or there is no legacy log.
+
+    Returns:
+        True if a legacy log was converted
+    """
+    if os.path.exists(log_file) or not os.path.exists(legacy_file):
+        return False
+
+    legacy = serialization.load_file(legacy_file)
+    changes = legacy.get("status_changes", [])
+
+    with open(log_file, 'wb') as f:
+        for change in changes:
+            f.write(serialization.dumps(change, pretty=False) + b'\n')
+    _write_json_atomic(metadata_file, dict(legacy.get("metadata", {}), total_entries=len(changes)))
+    print(f"✓ Converted {legacy_file} to {log_file} ({len(changes)} entries)")
+    return True
+
+
+def load_metadata(metadata_file: str = DEFAULT_METADATA_FILE) -> dict:
+    """Return the log's metadata (empty if the log has not been written yet)."""
+    if not os.path.exists(metadata_file):
+        return {}
+    return serialization.load_file(metadata_file)
+
+
+def _read_jsonl(path: str) -> Iterator[dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield serialization.loads(line)
+            except serialization.DECODE_ERRORS:
+                print(f"⚠ Skipping unreadable line in {path}")
+
+
+def append_changes(changes: List[dict], metadata: dict, log_file: str = DEFAULT_LOG_FILE, metadata_file: str = DEFAULT_METADATA_FILE, index_file: str = DEFAULT_INDEX_FILE) -> Tuple[int, int]:
+    """
+    Append a run's status changes to the log, index them and replace the log's metadata.
+
+    Args:
+        changes: Status change entries (address, previous_status, new_status, date_status_change)
+        metadata: Run metadata (last_check, last_oracle_update_time)
+        log_file: Path to the JSONL log
+        metadata_file: Path to the metadata file
+        index_file: Path to the run index
+
+    Returns:
+        Tuple of (run ID, total number of entries in the log)
+    """
+    migrate_legacy_log(log_file, metadata_file)
+    previous_metadata = load_metadata(metadata_file)
+    run_id = previous_metadata.get("last_run_id", 0) + 1
+    logged_at = int(time.time())
+    total_entries = previous_metadata.get("total_entries")
+    if total_entries is None:
+        total_entries = sum(1 for _ in read_changes(log_file))
+
+    if changes:
+        # Terminate a line left unfinished by an interrupted run, so it cannot swallow the next entry
+        if os.path.exists(log_file) and os.path.getsize(log_file) > 0:
+            with open(log_file, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                unterminated = f.read(1) != b'\n'
+        else:
+            unterminated = False
+        with open(log_file, 'ab') as f:
+            if unterminated:
+                f.write(b'\n')
+            offset = f.tell()
+            for change in changes:
+                f.write(serialization.dumps(dict(change, run_id=run_id, logged_at=logged_at), pretty=False) + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        # The index is written after the log, so an indexed offset always points at complete entries
+        with open(index_file, 'ab') as f:
+            f.write(serialization.dumps({"run_id": run_id, "logged_at": logged_at, "offset": offset, "count": len(changes)}, pretty=False) + b'\n')
+
+    total_entries += len(changes)
+    _write_json_atomic(metadata_file, dict(metadata, last_run_id=run_id, total_entries=total_entries))
+    return run_id, total_entries
+
+
+def read_changes(log_file: str = DEFAULT_LOG_FILE, addresses: Optional[Iterable[str]] = None) -> Iterator[dict]:
+    """
+    Stream status changes from the log in the order they were logged.
+
+    A line that cannot be parsed (e.g. one cut short by a crash) is skipped.
+
+    Args:
+        log_file: Path to the JSONL log
+        addresses: Only yield changes of these addresses (optional)
+
+    Yields:
+        Status change entries
+    """
+    if not os.path.exists(log_file):
+        return
+
+    wanted = {address.lower() for address in addresses} if addresses is not None else None
+    for change in _read_jsonl(log_file):
+        if wanted is None or change.get("address", "").lower() in wanted:
+            yield change
+
+
+def find_run_offset(after_run_id: int, index_file: str = DEFAULT_INDEX_FILE) -> Optional[int]:
+    """
+    Look up where the changes of the runs after a run start in the log.
+
+    Returns:
+        Byte offset of the first change logged after after_run_id, or None if there is none
+    """
+    if not os.path.exists(index_file):
+        return None
+    for entry in _read_jsonl(index_file):
+        if entry.get("run_id", 0) > after_run_id:
+            return entry["offset"]
+    return None
+
+
+def read_changes_since(after_run_id: int, log_file: str = DEFAULT_LOG_FILE, index_file: str = DEFAULT_INDEX_FILE, archive_dir: str = DEFAULT_ARCHIVE_DIR) -> Iterator[dict]:
+    """
+    Stream the status changes of the runs after a run, seeking past older history
+    with the run index instead of reading the log from the start.
+
+    Runs that compact() already moved into the archive are read from their partitions
+    (only those whose run ID range reaches past after_run_id), so no change is skipped.
+
+    Args:
+        after_run_id: Last run whose changes are not wanted (0 for all runs)
+        log_file: Path to the JSONL log
+        index_file: Path to the run index
+        archive_dir: Directory of the monthly partitions
+
+    Yields:
+        Status change entries, each with its run_id and logged_at
+    """
+    if os.path.isdir(archive_dir):
+        for partition in list_partitions(archive_dir):
+            last_run_id = partition.get("last_run_id")
+            if last_run_id is None or last_run_id <= after_run_id:
+                continue
+            for change in read_partition(partition, archive_dir):
+                if change.get("run_id", 0) > after_run_id:
+                    yield change
+
+    offset = find_run_offset(after_run_id, index_file)
+    if offset is None or not os.path.exists(log_file):
+        return
+
+    with open(log_file, 'rb') as f:
+        f.seek(offset)
+        for raw_line in f:
+            line = raw_line.decode('utf-8').strip()
+            if not line:
+                continue
+            try:
+                change = serialization.loads(line)
+            except serialization.DECODE_ERRORS:
+                print(f"⚠ Skipping unreadable line in {log_file}")
+                continue
+            if change.get("run_id", 0) > after_run_id:
+                yield change
+
+
+# ========== Compaction ==========
+
+
+def _change_month(change: dict) -> Optional[str]:
+    """Month (YYYY-MM) a change belongs to, from its date or else the time it was logged."""
+    date = change.get("date_status_change")
+    if isinstance(date, str) and len(date) >= 7 and date[4] == '-':
+        return date[:7]
+    if change.get("logged_at"):
+        return datetime.fromtimestamp(change["logged_at"], tz=timezone.utc).strftime('%Y-%m')
+    return None
+
+
+def _first_hot_month(hot_months: int, now: Optional[float] = None) -> str:
+    """First month (YYYY-MM) that stays in the hot log."""
+    current = datetime.fromtimestamp(now if now is not None else time.time(), tz=timezone.utc)
+    month_index = current.year * 12 + current.month - 1 - max(hot_months - 1, 0)
+    return f"{month_index // 12:04d}-{month_index % 12 + 1:02d}"
+
+
+def _partition_paths(archive_dir: str, month: str, compress: bool) -> Tuple[str, str]:
+    base = os.path.join(archive_dir, f"{PARTITION_PREFIX}{month}")
+    return base + ('.jsonl.gz' if compress else '.jsonl'), base + '.index.json'
+
+
+def _open_partition(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class _PartitionWriter:
+    """Writes one monthly partition and its address index, merging an existing partition."""
+
+    def __init__(self, archive_dir: str, month: str, compress: bool):
+        self.month = month
+        self.path, self.index_path = _partition_paths(archive_dir, month, compress)
+        self.tmp_path = f"{self.path}.tmp"
+        self.index: Dict[str, List[int]] = {}
+        self.entries = 0
+        self.run_ids: List[int] = []
+        self.existing_lines = set()
+        if compress:
+            self.file = gzip.open(self.tmp_path, 'wt', encoding='utf-8')
+        else:
+            self.file = open(self.tmp_path, 'w', encoding='utf-8')
+
+        # Keep whatever an earlier compaction archived for this month (in either format)
+        self.data_paths = [_partition_paths(archive_dir, month, gz)[0] for gz in (True, False)]
+        for existing_path in self.data_paths:
+            if os.path.exists(existing_path):
+                with _open_partition(existing_path, 'r') as f:
+                    for line in f:
+                        if line.strip():
+                            self.write(line.strip())
+
+    def write(self, line: str) -> None:
+        # A change archived by an interrupted compaction is still in the hot log; keep one copy
+        if line in self.existing_lines:
+            return
+        self.existing_lines.add(line)
+        try:
+            change = serialization.loads(line)
+        except serialization.DECODE_ERRORS:
+            return
+        self.index.setdefault(change.get("address", "").lower(), []).append(self.entries)
+        if change.get("run_id") is not None:
+            self.run_ids.append(change["run_id"])
+        self.file.write(line + '\n')
+        self.entries += 1
+
+    def close(self) -> None:
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        # Remove the other format's file if the compression setting changed
+        for other_path in self.data_paths:
+            if other_path != self.path and os.path.exists(other_path):
+                os.remove(other_path)
+        _write_json_atomic(self.index_path, {
+            "month": self.month,
+            "file": os.path.basename(self.path),
+            "entries": self.entries,
+            "first_run_id": min(self.run_ids) if self.run_ids else None,
+            "last_run_id": max(self.run_ids) if self.run_ids else None,
+            "addresses": self.index,
+        })
+
+
+def compact(hot_months: int = DEFAULT_HOT_MONTHS, archive_dir: str = DEFAULT_ARCHIVE_DIR, compress: bool = True, log_file: str = DEFAULT_LOG_FILE, index_file: str = DEFAULT_INDEX_FILE, metadata_file: str = DEFAULT_METADATA_FILE, now: Optional[float] = None) -> Dict[str, int]:
+    """
+    Move the changes of months older than the hot window into monthly partitions.
+
+    The hot log is streamed once: older changes go to their month's partition, the rest to
+    a new hot log that replaces the old one, and the run index is rebuilt for the new
+    offsets, and total_entries in the metadata is set to the entries left in the hot log.
+    Partitions are written before the hot log is replaced, so an interrupted compaction
+    never loses changes and can simply be run again. Do not run it while
+    generate_dashboard.py is appending to the log.
+
+    Args:
+        hot_months: Number of months, including the current one, kept in the hot log
+        archive_dir: Directory of the monthly partitions
+        compress: If True, partitions are gzip-compressed
+        log_file: Path to the JSONL log
+        index_file: Path to the run index
+        metadata_file: Path to the metadata file
+        now: Current Unix time (defaults to the system clock)
+
+    Returns:
+        Dictionary mapping each partition written to its number of entries
+    """
+    migrate_legacy_log(log_file, metadata_file)
+    if not os.path.exists(log_file):
+        return {}
+
+    first_hot_month = _first_hot_month(hot_months, now)
+    os.makedirs(archive_dir, exist_ok=True)
+    writers: Dict[str, _PartitionWriter] = {}
+    run_index: List[dict] = []
+    moved = 0
+    kept = 0
+    hot_tmp = f"{log_file}.tmp"
+
+    with open(log_file, 'rb') as source, open(hot_tmp, 'wb') as hot:
+        for raw_line in source:
+            line = raw_line.decode('utf-8').strip()
+            if not line:
+                continue
+            try:
+                change = serialization.loads(line)
+            except serialization.DECODE_ERRORS:
+                print(f"⚠ Skipping unreadable line in {log_file}")
+                continue
+
+            month = _change_month(change)
+            if month is not None and month < first_hot_month:
+                if month not in writers:
+                    writers[month] = _PartitionWriter(archive_dir, month, compress)
+                writers[month].write(line)
+                moved += 1
+                continue
+
+            run_id = change.get("run_id")
+            if run_id is not None:
+                if run_index and run_index[-1]["run_id"] == run_id:
+                    run_index[-1]["count"] += 1
+                else:
+                    run_index.append({"run_id": run_id, "logged_at": change.get("logged_at"), "offset": hot.tell(), "count": 1})
+            hot.write((line + '\n').encode('utf-8'))
+            kept += 1
+        hot.flush()
+        os.fsync(hot.fileno())
+
+    if not moved:
+        os.remove(hot_tmp)
+        return {}
+
+    for writer in writers.values():
+        writer.close()
+    os.replace(hot_tmp, log_file)
+    index_tmp = f"{index_file}.tmp"
+    with open(index_tmp, 'wb') as f:
+        for entry in run_index:
+            f.write(serialization.dumps(entry, pretty=False) + b'\n')
+    os.replace(index_tmp, index_file)
+    if os.path.exists(metadata_file):
+        _write_json_atomic(metadata_file, dict(load_metadata(metadata_file), total_entries=kept))
+
+    print(f"✓ Compacted {moved} entries from {log_file} into {len(writers)} partition(s) in {archive_dir}")
+    return {month: writer.entries for month, writer in sorted(writers.items())}
+
+
+def list_partitions(archive_dir: str = DEFAULT_ARCHIVE_DIR) -> List[dict]:
+    """Return the index of every monthly partition, oldest month first."""
+    partitions = []
+    for index_path in sorted(glob.glob(os.path.join(archive_dir, f"{PARTITION_PREFIX}*.index.json"))):
+        partitions.append(serialization.load_file(index_path))
+    return partitions
+
+
+def read_partition(partition: dict, archive_dir: str = DEFAULT_ARCHIVE_DIR, addresses: Optional[Iterable[str]] = None) -> Iterator[dict]:
+    """
+    Stream the changes of a monthly partition, using its address index to pick lines.
+
+    Args:
+        partition: Partition index, as returned by list_partitions()
+        archive_dir: Directory of the monthly partitions
+        addresses: Only yield changes of these addresses (optional)
+    """
+    wanted_lines = None
+    if addresses is not None:
+        wanted_lines = set()
+        for address in addresses:
+            wanted_lines.update(partition.get("addresses", {}).get(address.lower(), []))
+        if not wanted_lines:
+            return
+
+    with _open_partition(os.path.join(archive_dir, partition["file"]), 'r') as f:
+        for line_number, line in enumerate(f):
+            if wanted_lines is None or line_number in wanted_lines:
+                yield serialization.loads(line)
+
+
+def read_history(addresses: Optional[Iterable[str]] = None, log_file: str = DEFAULT_LOG_FILE, archive_dir: str = DEFAULT_ARCHIVE_DIR) -> Iterator[dict]:
+    """
+    Stream the complete history: the archived partitions, oldest first, then the hot log.
+
+    Partitions whose index does not list any of the addresses are not opened.
+
+    Args:
+        addresses: Only yield changes of these addresses (optional)
+        log_file: Path to the JSONL log
+        archive_dir: Directory of the monthly partitions
+    """
+    addresses = list(addresses) if addresses is not None else None
+    if os.path.isdir(archive_dir):
+        for partition in list_partitions(archive_dir):
+            yield from read_partition(partition, archive_dir, addresses)
+    yield from read_changes(log_file, addresses)
+
+
+if __name__ == '__main__':
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    archived = compact(
+        hot_months=int(os.getenv("ACTIVITY_LOG_HOT_MONTHS", str(DEFAULT_HOT_MONTHS))),
+        archive_dir=os.getenv("ACTIVITY_LOG_ARCHIVE_DIR", DEFAULT_ARCHIVE_DIR),
+        compress=os.getenv("ACTIVITY_LOG_ARCHIVE_GZIP", "true").lower() not in ("false", "0", "no"),
+    )
+    if archived:
+        for month, entries in archived.items():
+            print(f"  - {month}: {entries} entries")
+    else:
+        print("ℹ️ Nothing to compact")
@@ -4,13 +4,15 @@ Announcement Script - Send update notifications to existing subscribers
 This script sends a one-time announcement about new features to all active subscribers.
 """
 
-import json
 import os
 import asyncio
 from telegram import Bot
 from telegram.error import TelegramError
 from dotenv import load_dotenv
 
+import serialization
+import state_store
+
 # Load environment variables
 load_dotenv()
 
@@ -53,18 +55,23 @@ You can now choose to receive notifications only for indexers you care about:
 
 
 def load_subscribers():
-    """Load active subscribers from JSON file."""
+    """Load active subscribers from JSON file (or the state database when STATE_DB is set)."""
+    store = state_store.get_store()
+    if store is not None:
+        active = store.get_active_subscribers()
+        print(f"✅ Loaded {len(active)} active subscriber(s) from {store.db_path}")
+        return active
+    
     if not os.path.exists(SUBSCRIBERS_FILE):
         print(f"❌ Subscribers file not found: {SUBSCRIBERS_FILE}")
         return []
     
     try:
-        with open(SUBSCRIBERS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Return only active subscribers
-            active = [sub for sub in data.get("subscribers", []) if sub.get("active", False)]
-            print(f"✅ Loaded {len(active)} active subscriber(s)")
-            return active
+        data = serialization.load_file(SUBSCRIBERS_FILE)
+        # Return only active subscribers
+        active = [sub for sub in data.get("subscribers", []) if sub.get("active", False)]
+        print(f"✅ Loaded {len(active)} active subscriber(s)")
+        return active
     except Exception as e:
         print(f"❌ Error loading subscribers: {e}")
         return []
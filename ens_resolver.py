@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+ENS Resolver for REO Dashboard
+Resolves the ENS name of indexer addresses through the ENS subgraph, preferring the
+primary name set in the address's reverse record.
+"""
+
+from typing import Dict, List, Optional
+
+from Crypto.Hash import keccak
+
+import subgraph_client
+
+# Reverse records live under <address>.addr.reverse
+REVERSE_SUFFIX = 'addr.reverse'
+
+# The ENS subgraph shows labels it could not decode as [labelhash]
+UNKNOWN_LABEL_MARKER = '['
+
+REVERSE_DOMAINS_QUERY = """
+query ReverseDomains($first: Int!, $lastId: String!, $nodes: [String!]) {
+  domains(first: $first, where: {id_in: $nodes, id_gt: $lastId}, orderBy: id, orderDirection: asc) {
+    id
+    resolver {
+      id
+    }
+  }
+}
+"""
+
+NAME_CHANGED_QUERY = """
+query PrimaryNames($first: Int!, $lastId: String!, $resolvers: [String!]) {
+  nameChangeds(first: $first, where: {resolver_in: $resolvers, id_gt: $lastId}, orderBy: id, orderDirection: asc) {
+    id
+    name
+    blockNumber
+    resolver {
+      id
+    }
+  }
+}
+"""
+
+FORWARD_DOMAINS_QUERY = """
+query ForwardDomains($first: Int!, $lastId: String!, $addresses: [String!]) {
+  domains(first: $first, where: {resolvedAddress_in: $addresses, id_gt: $lastId}, orderBy: id, orderDirection: asc) {
+    id
+    name
+    resolvedAddress {
+      id
+    }
+  }
+}
+"""
+
+
+def _keccak(data: bytes) -> bytes:
+    return keccak.new(digest_bits=256, data=data).digest()
+
+
+def namehash(name: str) -> str:
+    """
+    Compute the ENS namehash of a name (EIP-137).
+
+    Args:
+        name: ENS name (e.g. 'vitalik.eth')
+
+    Returns:
+        0x-prefixed namehash, the id of the name's Domain in the ENS subgraph
+    """
+    node = b'\x00' * 32
+    if name:
+        for label in reversed(name.split('.')):
+            node = _keccak(node + _keccak(label.encode()))
+    return '0x' + node.hex()
+
+
+def reverse_node(address: str) -> str:
+    """Namehash of an address's reverse record (<address>.addr.reverse)."""
+    address_hex = address.lower()[2:] if address.startswith('0x') else address.lower()
+    return namehash(f"{address_hex}.{REVERSE_SUFFIX}")
+
+
+def _fetch_all(ens_url: str, graphql_query: str, entity: str, variables: dict) -> List[dict]:
+    entities: List[dict] = []
+    for page in subgraph_client.paginate(ens_url, graphql_query, entity, variables=variables, prefetch=False):
+        entities.extend(page)
+    return entities
+
+
+def _is_displayable(name: Optional[str]) -> bool:
+    return bool(name) and UNKNOWN_LABEL_MARKER not in name
+
+
+def _pick_fallback(names: List[str]) -> Optional[str]:
+    """Deterministic choice among forward-resolving names: shortest first, then alphabetical."""
+    candidates = sorted(name for name in names if _is_displayable(name))
+    return min(candidates, key=len) if candidates else None
+
+
+def get_primary_names(ens_url: str, addresses: List[str]) -> Dict[str, str]:
+    """
+    Get the primary names set in the addresses' reverse records (unverified).
+
+    Returns:
+        Dictionary mapping lowercase addresses to the name of their latest NameChanged event
+    """
+    nodes = {reverse_node(address): address.lower() for address in addresses}
+    domains = _fetch_all(ens_url, REVERSE_DOMAINS_QUERY, "domains", {"nodes": list(nodes)})
+
+    resolvers = {
+        domain["resolver"]["id"]: nodes[domain["id"]]
+        for domain in domains
+        if domain.get("resolver") and domain["id"] in nodes
+    }
+    if not resolvers:
+        return {}
+
+    # The latest NameChanged event of a reverse resolver is the current primary name
+    latest: Dict[str, dict] = {}
+    for event in _fetch_all(ens_url, NAME_CHANGED_QUERY, "nameChangeds", {"resolvers": list(resolvers)}):
+        resolver_id = (event.get("resolver") or {}).get("id")
+        if resolver_id not in resolvers:
+            continue
+        current = latest.get(resolver_id)
+        if current is None or (int(event["blockNumber"]), event["id"]) > (int(current["blockNumber"]), current["id"]):
+            latest[resolver_id] = event
+
+    return {
+        resolvers[resolver_id]: event["name"]
+        for resolver_id, event in latest.items()
+        if event.get("name")
+    }
+
+
+def resolve_names(ens_url: str, addresses: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Resolve the ENS name of every address.
+
+    The primary name from the reverse record wins when it resolves forward to the same
+    address. Otherwise one of the names resolving to the address is picked deterministically.
+    All queries are paged completely, so addresses with many domains cannot crowd out others.
+
+    Args:
+        ens_url: ENS subgraph query URL
+        addresses: Addresses to resolve
+
+    Returns:
+        Dictionary mapping every lowercase address to its ENS name, or None if it has none
+
+    Raises:
+        requests.RequestException, RuntimeError: If a subgraph query fails
+    """
+    addresses = [address.lower() for address in addresses]
+
+    forward: Dict[str, List[str]] = {address: [] for address in addresses}
+    for domain in _fetch_all(ens_url, FORWARD_DOMAINS_QUERY, "domains", {"addresses": addresses}):
+        resolved = ((domain.get("resolvedAddress") or {}).get("id") or "").lower()
+        if resolved in forward and domain.get("name"):
+            forward[resolved].append(domain["name"])
+
+    # Primary names are only trusted when the name resolves back to the same address,
+    # i.e. when it is among the address's fully paged forward domains
+    primary = get_primary_names(ens_url, addresses)
+
+    names: Dict[str, Optional[str]] = {}
+    for address in addresses:
+        name = primary.get(address)
+        if _is_displayable(name) and name in forward[address]:
+            names[address] = name
+        else:
+            names[address] = _pick_fallback(forward[address])
+    return names
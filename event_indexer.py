@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Event Indexer for REO Dashboard
+Incrementally indexes the oracle contract's renewal events, so per-indexer renewal
+times and renewal transactions come from logs instead of per-indexer contract reads.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from Crypto.Hash import keccak
+
+import rpc_client
+import serialization
+
+# Event emitted by the oracle for every indexer it renews (indexer is the first indexed argument)
+DEFAULT_RENEWAL_EVENT = 'IndexerEligibilityRenewed(address,address)'
+
+# State file holding the last processed block and the latest renewal of every indexer
+EVENT_STATE_FILE = 'eligibility_events.json'
+
+# eth_getLogs block range: grows while requests succeed, halves when the provider refuses one
+DEFAULT_LOG_RANGE = 10000
+MAX_LOG_RANGE = 500000
+
+
+def event_topic(signature: str) -> str:
+    """
+    Compute the topic0 of an event.
+
+    Args:
+        signature: Canonical event signature (e.g. 'IndexerEligibilityRenewed(address,address)')
+
+    Returns:
+        0x-prefixed keccak256 hash of the signature
+    """
+    return '0x' + keccak.new(digest_bits=256, data=signature.encode()).hexdigest()
+
+
+def load_event_state(state_file: str = EVENT_STATE_FILE) -> Optional[dict]:
+    """Load the indexer state from a previous run, or None if there is none."""
+    try:
+        if os.path.exists(state_file):
+            return serialization.load_file(state_file)
+    except Exception as e:
+        print(f"⚠ Could not load event state from {state_file}: {e}")
+    return None
+
+
+def save_event_state(state: dict, state_file: str = EVENT_STATE_FILE) -> None:
+    """Persist the indexer state for the next run."""
+    try:
+        serialization.dump_file(state_file, state)
+        print(f"✓ Event state saved to {state_file} (block {state['last_processed_block']})")
+    except Exception as e:
+        print(f"⚠ Could not save event state to {state_file}: {e}")
+
+
+def find_deployment_block(rpc_endpoint: str, contract_address: str, latest_block: int) -> Optional[int]:
+    """
+    Find the block the contract was deployed in with a binary search on eth_getCode.
+    Requires an RPC endpoint that serves historical state (archive node).
+
+    Returns:
+        Deployment block number or None if error
+    """
+    code = rpc_client.rpc_call(rpc_endpoint, "eth_getCode", [contract_address, hex(latest_block)])
+    if not code or code == '0x':
+        return None
+
+    low, high = 0, latest_block
+    while low < high:
+        middle = (low + high) // 2
+        code = rpc_client.rpc_call(rpc_endpoint, "eth_getCode", [contract_address, hex(middle)])
+        if code is None:
+            return None
+        if code != '0x':
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _get_logs(rpc_endpoint: str, contract_address: str, topic: str, from_block: int, to_block: int) -> Optional[List[dict]]:
+    return rpc_client.rpc_call(rpc_endpoint, "eth_getLogs", [{
+        "address": contract_address,
+        "topics": [topic],
+        "fromBlock": hex(from_block),
+        "toBlock": hex(to_block),
+    }], timeout=30)
+
+
+def fetch_logs(rpc_endpoint: str, contract_address: str, topic: str, from_block: int, to_block: int, log_range: int = DEFAULT_LOG_RANGE) -> Optional[List[dict]]:
+    """
+    Fetch all logs of an event between two blocks (inclusive).
+
+    Ranges adapt to the provider: a range that fails (too many results, response too
+    large, timeout) is split in half and retried, and the range grows again after
+    successful requests.
+
+    Returns:
+        List of log objects in block order, or None if a single block could not be fetched
+    """
+    logs: List[dict] = []
+    start = from_block
+    current_range = max(1, log_range)
+
+    while start <= to_block:
+        end = min(to_block, start + current_range - 1)
+        chunk = _get_logs(rpc_endpoint, contract_address, topic, start, end)
+        if chunk is None:
+            if end == start:
+                print(f"⚠ Could not fetch logs for block {start}")
+                return None
+            current_range = max(1, (end - start + 1) // 2)
+            print(f"  ⚠ eth_getLogs failed for {end - start + 1:,} blocks, splitting range to {current_range:,}")
+            continue
+
+        logs.extend(chunk)
+        print(f"  Scanned blocks {start:,} to {end:,} ({len(chunk)} events)")
+        start = end + 1
+        current_range = min(MAX_LOG_RANGE, current_range * 2)
+
+    return logs
+
+
+def _get_block_timestamps(rpc_endpoint: str, logs: List[dict]) -> Dict[str, int]:
+    """Timestamps of the blocks containing the logs (taken from the log when the provider includes it)."""
+    timestamps: Dict[str, int] = {}
+    for log in logs:
+        block_hex = log.get("blockNumber")
+        if not block_hex or block_hex in timestamps:
+            continue
+        if log.get("blockTimestamp"):
+            timestamps[block_hex] = int(log["blockTimestamp"], 16)
+            continue
+        block = rpc_client.rpc_call(rpc_endpoint, "eth_getBlockByNumber", [block_hex, False])
+        if isinstance(block, dict) and block.get("timestamp"):
+            timestamps[block_hex] = int(block["timestamp"], 16)
+    return timestamps
+
+
+def _renewals_up_to(renewals: Dict[str, dict], to_block: int) -> Dict[str, dict]:
+    """Keep the renewals at or before a block, so they match reads pinned to that block."""
+    filtered = {address: renewal for address, renewal in renewals.items() if renewal.get("block_number", 0) <= to_block}
+    if len(filtered) < len(renewals):
+        print(f"  {len(renewals) - len(filtered)} indexers last renewed after block {to_block:,}, left out of the history")
+    return filtered
+
+
+def update_renewal_history(rpc_endpoint: str, contract_address: str, block: str = 'latest', event_signature: str = DEFAULT_RENEWAL_EVENT, start_block: Optional[int] = None, state_file: str = EVENT_STATE_FILE) -> Optional[Dict[str, dict]]:
+    """
+    Bring the renewal history up to date and return the latest renewal of every indexer.
+
+    Only logs after the last processed block are fetched, so the cost of a run grows with
+    the number of new events rather than the number of indexers.
+
+    Args:
+        rpc_endpoint: RPC endpoint URL
+        contract_address: The oracle contract address
+        block: Block tag or hex block number to index up to (the run's snapshot block)
+        event_signature: Canonical signature of the renewal event
+        start_block: Block to start from on the first run (defaults to the contract's deployment block)
+        state_file: Path to the state file
+
+    Returns:
+        Dictionary mapping lowercase indexer address to {'renewal_time', 'tx_hash', 'block_number'},
+        or None if the history could not be brought up to date. Renewals after the snapshot
+        block are left out (the history may already be ahead of it, e.g. on a rerun pinned to
+        an earlier block), so those indexers are read from the contract at the snapshot block.
+    """
+    topic = event_topic(event_signature)
+
+    if block == 'latest':
+        to_block = rpc_client.get_block_number(rpc_endpoint)
+        if to_block is None:
+            return None
+    else:
+        to_block = int(block, 16)
+
+    state = load_event_state(state_file)
+    if state and (state.get("contract", "").lower() != contract_address.lower() or state.get("event_topic") != topic):
+        print("⚠ Event state belongs to a different contract or event, rebuilding")
+        state = None
+
+    if state is None:
+        if start_block is None:
+            print("Finding contract deployment block...")
+            start_block = find_deployment_block(rpc_endpoint, contract_address, to_block)
+            if start_block is None:
+                print("⚠ Could not find contract deployment block (set ELIGIBILITY_EVENTS_START_BLOCK)")
+                return None
+        state = {
+            "contract": contract_address,
+            "event_signature": event_signature,
+            "event_topic": topic,
+            "last_processed_block": start_block - 1,
+            "renewals": {},
+        }
+
+    renewals: Dict[str, dict] = state["renewals"]
+    from_block = state["last_processed_block"] + 1
+    if from_block > to_block:
+        print(f"✓ Renewal history already up to date at block {state['last_processed_block']}")
+        return _renewals_up_to(renewals, to_block)
+
+    print(f"Fetching {event_signature} events from block {from_block:,} to {to_block:,}...")
+    logs = fetch_logs(rpc_endpoint, contract_address, topic, from_block, to_block)
+    if logs is None:
+        return None
+
+    logs = [log for log in logs if not log.get("removed") and len(log.get("topics", [])) > 1]
+    logs.sort(key=lambda log: (int(log["blockNumber"], 16), int(log.get("logIndex", "0x0"), 16)))
+    timestamps = _get_block_timestamps(rpc_endpoint, logs)
+
+    for log in logs:
+        block_hex = log["blockNumber"]
+        if block_hex not in timestamps:
+            print(f"⚠ Could not get timestamp of block {int(block_hex, 16)}")
+            return None
+        indexer = '0x' + log["topics"][1][-40:].lower()
+        renewals[indexer] = {
+            "renewal_time": timestamps[block_hex],
+            "tx_hash": log.get("transactionHash", ""),
+            "block_number": int(block_hex, 16),
+        }
+
+    state["last_processed_block"] = to_block
+    save_event_state(state, state_file)
+    print(f"✓ Processed {len(logs)} renewal events, history covers {len(renewals)} indexers")
+    return _renewals_up_to(renewals, to_block)
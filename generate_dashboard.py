@@ -6,17 +6,41 @@ This script reads indexer data from indexers.txt and generates a static HTML das
 with sortable table and search functionality.
 """
 
+import hashlib
 import os
-import json
 import requests
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from dotenv import load_dotenv
 
+import activity_log
+import ens_resolver
+import event_indexer
+import http_client
+import rpc_client
+import serialization
+import state_store
+import subgraph_client
+import template_engine
+
 # Version of the dashboard generator
 VERSION = "0.0.15"
 
+# Page template in templates/, rendered by generate_html_dashboard()
+DASHBOARD_TEMPLATE = 'dashboard.html'
+
+# The page loads its indexer data from <DATA_FILE_PREFIX>.<content hash>.json next to index.html
+DATA_FILE_PREFIX = 'indexers'
+
+# Time of the last run, kept out of the hashed data file so the data (and the page) only change with the indexers
+STATUS_FILE = 'last_update.json'
+
+# Fingerprinted files kept on disk per kind: the current one and the previous one, which a page cached by a browser may still load
+FINGERPRINTED_FILES_KEPT = 2
+
 # Import telegram notifier (will be skipped if module not available)
 try:
     import telegram_notifier
@@ -27,7 +51,7 @@ except ImportError:
 
 def get_last_transaction_from_json(json_file: str = 'last_transaction.json') -> Optional[dict]:
     """
-    Read the last transaction data from a local JSON file.
+    Read the last transaction data from a local JSON file (or the state database when STATE_DB is set).
     
     Args:
         json_file: Path to the JSON file containing transaction data
@@ -36,11 +60,18 @@ def get_last_transaction_from_json(json_file: str = 'last_transaction.json') ->
         Dictionary with transaction data or None if file doesn't exist or is invalid
     """
     try:
+        store = state_store.get_store()
+        if store is not None:
+            data = store.get_last_transaction()
+            if data:
+                print(f"Loaded transaction data from {store.db_path}")
+            else:
+                print(f"No transaction stored in {store.db_path}, will try API fallback...")
+            return data
         if os.path.exists(json_file):
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                print(f"Loaded transaction data from {json_file}")
-                return data
+            data = serialization.load_file(json_file)
+            print(f"Loaded transaction data from {json_file}")
+            return data
         else:
             print(f"{json_file} not found, will try API fallback...")
             return None
@@ -51,7 +82,8 @@ def get_last_transaction_from_json(json_file: str = 'last_transaction.json') ->
 
 def save_transaction_to_json(transaction_data: dict, json_file: str = 'last_transaction.json') -> None:
     """
-    Save transaction data to a local JSON file with a timestamp of when the script ran.
+    Save transaction data to a local JSON file (or the state database when STATE_DB is set)
+    with a timestamp of when the script ran.
     
     Args:
         transaction_data: Dictionary with transaction data
@@ -67,9 +99,14 @@ def save_transaction_to_json(transaction_data: dict, json_file: str = 'last_tran
         data_to_save['last_script_run'] = current_timestamp
         data_to_save['last_script_run_readable'] = current_readable
         
+        store = state_store.get_store()
+        if store is not None:
+            store.save_transaction(data_to_save, saved_at=current_timestamp)
+            print(f"✓ Transaction data saved to {store.db_path} with timestamp")
+            return
+        
         # Save to file
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data_to_save, f, indent=2)
+        serialization.dump_file(json_file, data_to_save)
         
         print(f"✓ Transaction data saved to {json_file} with timestamp")
     except Exception as e:
@@ -102,7 +139,7 @@ def get_last_transaction(contract_address: str, api_key: str) -> Optional[dict]:
 
     try:
         print(f"Fetching latest transaction from Arbiscan API (Etherscan V2)...")
-        response = requests.get(base_url, params=params, timeout=15)
+        response = http_client.get(base_url, params=params, timeout=15)
         response.raise_for_status()  # Raise error for bad status codes
         data = response.json()
 
@@ -134,29 +171,31 @@ def get_last_transaction(contract_address: str, api_key: str) -> Optional[dict]:
         return None
 
 
-def get_last_transaction_via_rpc(contract_address: str, rpc_endpoint: str) -> Optional[dict]:
+# Blocks walked back by the block scan used when the endpoint does not serve historical state
+# (Arbitrum Sepolia produces a block about every 250ms, so 50,000 blocks are roughly 3-4 hours)
+RPC_SCAN_WINDOW_BLOCKS = 50000
+
+
+def get_last_transaction_via_rpc(contract_address: str, rpc_endpoint: str, block: str = 'latest') -> Optional[dict]:
     """
-    Get the last transaction touching the contract using an RPC endpoint.
-    Strategy: Scan recent blocks and find transactions where 'to' == contract address.
-    Skips eth_getLogs entirely as it causes 413 errors on contracts with many events.
+    Get the last oracle update transaction of the contract using an RPC endpoint.
+    Strategy: getLastOracleUpdateTime() only changes when the oracle submits an update, so the
+    first block holding the current value is found by an exponential + binary search on that
+    value at historical blocks (O(log n) eth_calls, requires an archive-capable endpoint).
+    Arbitrum produces several blocks per second, and a later update in the same second leaves
+    the value unchanged, so every block with the update's timestamp is checked and the last
+    transaction to the contract whose receipt succeeded and emitted a contract event is taken.
+    If historical state is unavailable or no transaction is confirmed, the recent blocks are
+    scanned for the last transaction to the contract instead.
     Returns a dict with 'hash', 'blockNumber' (as decimal string), and 'timeStamp' (as decimal string) or None.
+    
+    Args:
+        contract_address: The contract address
+        rpc_endpoint: RPC endpoint URL
+        block: Block tag or hex block number to search back from
     """
     def rpc_call(method: str, params: list) -> Optional[dict]:
-        try:
-            response = requests.post(
-                rpc_endpoint,
-                json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
-                timeout=15,
-            )
-            response.raise_for_status()
-            data = response.json()
-            if isinstance(data, dict) and data.get("error"):
-                print(f"RPC error for {method}: {data['error']}")
-                return None
-            return data.get("result")
-        except Exception as e:
-            print(f"RPC exception for {method}: {e}")
-            return None
+        return rpc_client.rpc_call(rpc_endpoint, method, params)
 
     def hex_to_dec_str(hex_str: Optional[str]) -> str:
         try:
@@ -164,77 +203,151 @@ def get_last_transaction_via_rpc(contract_address: str, rpc_endpoint: str) -> Op
         except Exception:
             return "0"
 
-    try:
-        print("Fetching latest block number...")
-        latest_hex = rpc_call("eth_blockNumber", [])
-        if not latest_hex:
+    # Function selector for getLastOracleUpdateTime(), padded to 32 bytes
+    function_selector = '0xbe626dd2' + '0' * 56
+    contract = contract_address.lower()
+
+    def oracle_update_time_at(block_num: int) -> Optional[int]:
+        result = rpc_client.eth_call(rpc_endpoint, contract_address, function_selector, block=hex(block_num))
+        if result is None:
             return None
-        latest_int = int(latest_hex, 16)
-        print(f"Latest block: {latest_int}")
+        # An empty result means the contract was not deployed yet at that block
+        return int(result, 16) if result != '0x' else 0
 
-        # Scan recent blocks for transactions to the contract
-        # Based on QuickNode guide: iterate backwards from latest block
-        # On Arbitrum Sepolia, blocks are ~250ms apart
-        # 50,000 blocks = roughly 3-4 hours of history
-        scan_window = 50000
-        starting_block = max(0, latest_int - scan_window)
-        
-        print(f"Searching for last transaction to {contract_address}")
-        print(f"Scanning blocks {starting_block} to {latest_int} ({scan_window:,} blocks)...")
-        
-        # Iterate backwards from latest block to find most recent transaction
-        for i in range(scan_window):
-            block_num = latest_int - i
-            if block_num < starting_block:
+    def get_block(block_num: int) -> Optional[dict]:
+        # Block with FULL transaction objects (True flag)
+        block_data = rpc_call("eth_getBlockByNumber", [hex(block_num), True])
+        return block_data if isinstance(block_data, dict) else None
+
+    def transactions_to_contract(block_data: dict) -> List[dict]:
+        transactions = block_data.get("transactions") or []
+        if not isinstance(transactions, list):
+            return []
+        return [
+            tx for tx in transactions
+            if isinstance(tx, dict) and (tx.get("to") or "").lower() == contract
+        ]
+
+    def is_confirmed_update(tx: dict) -> bool:
+        receipt = rpc_call("eth_getTransactionReceipt", [tx.get("hash")])
+        if not isinstance(receipt, dict) or receipt.get("status") != "0x1":
+            return False
+        return any((log.get("address") or "").lower() == contract for log in receipt.get("logs") or [])
+
+    def result_for(tx: dict, block_data: dict) -> dict:
+        tx_hash = tx.get("hash", "")
+        block_number = hex_to_dec_str(block_data.get("number"))
+        timestamp = hex_to_dec_str(block_data.get("timestamp"))
+
+        print(f"\n✓ Found latest transaction!")
+        print(f"  Hash: {tx_hash}")
+        print(f"  Block: {block_number}")
+        print(f"  Timestamp: {timestamp}")
+
+        dt = datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
+        print(f"  Date: {dt.strftime('%Y-%m-%d %H:%M:%S UTC')}")
+
+        return {
+            "hash": tx_hash,
+            "blockNumber": block_number,
+            "timeStamp": timestamp,
+        }
+
+    def find_update_block(latest_int: int, target: int) -> Optional[int]:
+        """Return the first block holding the current oracle update time (None if historical state is unavailable)."""
+        print(f"Searching for the block of the last oracle update to {contract_address}...")
+        calls = 1
+
+        # Exponential search backwards for a block before the update (where the value differs)
+        high = latest_int  # Known to hold the current value
+        step = 1
+        low = None
+        while high > 0:
+            candidate = max(0, latest_int - step)
+            value = oracle_update_time_at(candidate)
+            calls += 1
+            if value is None:
+                print(f"⚠ Could not read oracle update time at block {candidate}: the endpoint may not serve historical state (archive node needed)")
+                return None
+            if value != target:
+                low = candidate
                 break
-            
-            # Get block with FULL transaction objects (True flag)
-            block = rpc_call("eth_getBlockByNumber", [hex(block_num), True])
-            if not isinstance(block, dict):
-                continue
-            
-            timestamp_hex = block.get("timestamp")
-            transactions = block.get("transactions") or []
-            
-            if not isinstance(transactions, list):
+            high = candidate
+            step *= 2
+        if low is None:
+            print("Oracle update time never changed, no update block found")
+            return None
+
+        # Binary search for the first block holding the current value
+        while high - low > 1:
+            middle = (low + high) // 2
+            value = oracle_update_time_at(middle)
+            calls += 1
+            if value is None:
+                print(f"⚠ Could not read oracle update time at block {middle}: the endpoint may not serve historical state (archive node needed)")
+                return None
+            if value == target:
+                high = middle
+            else:
+                low = middle
+        print(f"✓ Oracle update time first set in block {high} after {calls} calls")
+        return high
+
+    def find_confirmed_update(first_block: int, latest_int: int, target: int) -> Optional[dict]:
+        """Return the last confirmed update among the blocks with the update's timestamp, starting at first_block."""
+        found = None
+        for block_num in range(first_block, latest_int + 1):
+            block_data = get_block(block_num)
+            if block_data is None:
+                break
+            if int(block_data.get("timestamp") or "0x0", 16) != target:
+                break
+            for tx in transactions_to_contract(block_data):
+                if is_confirmed_update(tx):
+                    found = (tx, block_data)
+        if found is None:
+            print(f"⚠ No successful update transaction to {contract_address} found in the blocks with timestamp {target}")
+            return None
+        return result_for(*found)
+
+    def scan_recent_blocks(latest_int: int) -> Optional[dict]:
+        """Walk back from the latest block to the last transaction to the contract."""
+        starting_block = max(0, latest_int - RPC_SCAN_WINDOW_BLOCKS)
+        print(f"Scanning blocks {starting_block} to {latest_int} for the last transaction to {contract_address}...")
+        for block_num in range(latest_int, starting_block - 1, -1):
+            block_data = get_block(block_num)
+            if block_data is None:
                 continue
-            
-            # Check each transaction in the block
-            for tx in transactions:
-                if not isinstance(tx, dict):
-                    continue
-                
-                to_addr = (tx.get("to") or "").lower()
-                from_addr = (tx.get("from") or "").lower()
-                
-                # Check if transaction involves our contract (to or from)
-                if (to_addr and to_addr == contract_address.lower()) or \
-                   (from_addr and from_addr == contract_address.lower()):
-                    tx_hash = tx.get("hash", "")
-                    block_number = hex_to_dec_str(block.get("number"))
-                    timestamp = hex_to_dec_str(timestamp_hex)
-                    
-                    print(f"\n✓ Found latest transaction!")
-                    print(f"  Hash: {tx_hash}")
-                    print(f"  Block: {block_number}")
-                    print(f"  Timestamp: {timestamp}")
-                    
-                    from datetime import datetime, timezone
-                    dt = datetime.fromtimestamp(int(timestamp), tz=timezone.utc)
-                    print(f"  Date: {dt.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-                    
-                    return {
-                        "hash": tx_hash,
-                        "blockNumber": block_number,
-                        "timeStamp": timestamp,
-                    }
-            
-            # Progress indicator every 500 blocks
-            if i > 0 and i % 500 == 0:
-                print(f"  Scanned {i:,} blocks...", end='\r')
-        
-        print(f"\nNo transactions found in last {scan_window:,} blocks")
+            matching = transactions_to_contract(block_data)
+            if matching:
+                # The last transaction to the contract in the block is the latest one
+                return result_for(matching[-1], block_data)
+        print(f"No transaction to {contract_address} found in the last {RPC_SCAN_WINDOW_BLOCKS:,} blocks")
         return None
+
+    try:
+        if block == 'latest':
+            print("Fetching latest block number...")
+            latest_hex = rpc_call("eth_blockNumber", [])
+            if not latest_hex:
+                return None
+            latest_int = int(latest_hex, 16)
+        else:
+            latest_int = int(block, 16)
+        print(f"Latest block: {latest_int}")
+
+        target = oracle_update_time_at(latest_int)
+        if not target:
+            print("Could not read last oracle update time, no update to search for")
+            return None
+
+        update_block = find_update_block(latest_int, target)
+        if update_block is not None:
+            result = find_confirmed_update(update_block, latest_int, target)
+            if result is not None:
+                return result
+        print("⚠ Falling back to a block scan for the last oracle update transaction")
+        return scan_recent_blocks(latest_int)
     except Exception as e:
         print(f"Error in get_last_transaction_via_rpc: {e}")
         import traceback
@@ -242,13 +355,14 @@ def get_last_transaction_via_rpc(contract_address: str, rpc_endpoint: str) -> Op
         return None
 
 
-def get_oracle_update_time(contract_address: str, rpc_endpoint: str) -> Optional[int]:
+def get_oracle_update_time(contract_address: str, rpc_endpoint: str, block: str = 'latest') -> Optional[int]:
     """
     Get the last oracle update time from the contract by calling getLastOracleUpdateTime().
     
     Args:
         contract_address: The contract address
         rpc_endpoint: RPC endpoint URL
+        block: Block tag or hex block number to read the value at
         
     Returns:
         Unix timestamp of last oracle update or None if error
@@ -258,39 +372,28 @@ def get_oracle_update_time(contract_address: str, rpc_endpoint: str) -> Optional
         # keccak256("getLastOracleUpdateTime()") = 0xbe626dd2...
         function_selector = '0xbe626dd2' + '0' * 56  # Padded to 32 bytes
         
-        payload = {
-            'jsonrpc': '2.0',
-            'method': 'eth_call',
-            'params': [{
-                'to': contract_address,
-                'data': function_selector
-            }, 'latest'],
-            'id': 1
-        }
-        
-        response = requests.post(rpc_endpoint, json=payload, timeout=10)
-        result = response.json()
+        result = rpc_client.eth_call(rpc_endpoint, contract_address, function_selector, block=block)
         
-        if 'result' in result and result['result'] != '0x':
-            timestamp = int(result['result'], 16)
+        if result and result != '0x':
+            timestamp = int(result, 16)
             print(f"Oracle update time retrieved: {timestamp}")
             return timestamp
         else:
-            error_msg = result.get('error', {}).get('message', 'Unknown error')
-            print(f"Error getting oracle update time: {error_msg}")
+            print(f"Error getting oracle update time: {'empty result' if result else 'call failed'}")
             return None
     except Exception as e:
         print(f"Exception getting oracle update time: {e}")
         return None
 
 
-def get_eligibility_period(contract_address: str, rpc_endpoint: str) -> Optional[int]:
+def get_eligibility_period(contract_address: str, rpc_endpoint: str, block: str = 'latest') -> Optional[int]:
     """
     Get the eligibility period from the contract by calling getEligibilityPeriod().
     
     Args:
         contract_address: The contract address
         rpc_endpoint: RPC endpoint URL
+        block: Block tag or hex block number to read the value at
         
     Returns:
         Eligibility period in seconds or None if error
@@ -300,59 +403,67 @@ def get_eligibility_period(contract_address: str, rpc_endpoint: str) -> Optional
         # keccak256("getEligibilityPeriod()") = 0xd0a5379e...
         function_selector = '0xd0a5379e' + '0' * 56  # Padded to 32 bytes
         
-        payload = {
-            'jsonrpc': '2.0',
-            'method': 'eth_call',
-            'params': [{
-                'to': contract_address,
-                'data': function_selector
-            }, 'latest'],
-            'id': 1
-        }
-        
-        response = requests.post(rpc_endpoint, json=payload, timeout=10)
-        result = response.json()
+        result = rpc_client.eth_call(rpc_endpoint, contract_address, function_selector, block=block)
         
-        if 'result' in result and result['result'] != '0x':
-            period = int(result['result'], 16)
+        if result and result != '0x':
+            period = int(result, 16)
             print(f"Eligibility period retrieved: {period} seconds")
             return period
         else:
-            error_msg = result.get('error', {}).get('message', 'Unknown error')
-            print(f"Error getting eligibility period: {error_msg}")
+            print(f"Error getting eligibility period: {'empty result' if result else 'call failed'}")
             return None
     except Exception as e:
         print(f"Exception getting eligibility period: {e}")
         return None
 
 
-def save_ens_cache(ens_mapping: dict, cache_file: str = 'ens_resolution.json') -> None:
+# How long a resolved ENS name, and a "no ENS name" result, stay valid in the cache
+DEFAULT_ENS_CACHE_TTL_HOURS = 168
+DEFAULT_ENS_NEGATIVE_TTL_HOURS = 24
+
+
+def save_ens_cache(ens_mapping: dict, cache_file: str = 'ens_resolution.json', entries: Optional[dict] = None) -> None:
     """
     Save ENS resolution data to a cache file.
     
     Args:
         ens_mapping: Dictionary mapping addresses (lowercase) to ENS names
         cache_file: Path to the cache file
+        entries: Per-address cache entries ({"name": str or None, "resolved_at": unix time});
+                 built from ens_mapping with the current time if not given
     """
     try:
         current_timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
         
+        if entries is None:
+            now = int(time.time())
+            entries = {address: {"name": name, "resolved_at": now} for address, name in ens_mapping.items()}
+        
         ens_resolved_count = len([name for name in ens_mapping.values() if name])
         
+        store = state_store.get_store()
+        if store is not None:
+            store.save_ens_entries(entries)
+            print(f"✓ ENS cache updated and saved to {store.db_path}")
+            print(f"  - Addresses updated: {len(entries)}")
+            print(f"  - ENS names resolved: {ens_resolved_count}")
+            return
+        
         cache_data = {
             "metadata": {
                 "retrieved": current_timestamp,
-                "total_count": len(ens_mapping),
+                "total_count": len(entries),
                 "ens_resolved": ens_resolved_count
             },
-            "ens_resolutions": ens_mapping
+            # Kept for readers of the plain address -> name mapping
+            "ens_resolutions": ens_mapping,
+            "entries": entries
         }
         
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, indent=2)
+        serialization.dump_file(cache_file, cache_data)
         
         print(f"✓ ENS cache updated and saved to {cache_file}")
-        print(f"  - Total addresses: {len(ens_mapping)}")
+        print(f"  - Total addresses: {len(entries)}")
         print(f"  - ENS names resolved: {ens_resolved_count}")
     except Exception as e:
         print(f"❌ Error saving ENS cache to {cache_file}: {e}")
@@ -369,12 +480,23 @@ def load_ens_cache(cache_file: str = 'ens_resolution.json') -> Optional[dict]:
         Dictionary mapping addresses (lowercase) to ENS names, or None if cache doesn't exist
     """
     try:
+        store = state_store.get_store()
+        if store is not None:
+            entries = store.load_ens_entries()
+            if not entries:
+                print(f"No ENS cache entries in {store.db_path}")
+                return None
+            ens_mapping = {address: entry["name"] for address, entry in entries.items() if entry.get("name")}
+            print(f"✓ Loaded ENS cache from {store.db_path}")
+            print(f"  - Total entries: {len(entries)}")
+            print(f"  - ENS resolved: {len(ens_mapping)}")
+            return ens_mapping
+        
         if not os.path.exists(cache_file):
             print(f"ENS cache file {cache_file} not found")
             return None
         
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = serialization.load_file(cache_file)
         
         ens_mapping = data.get("ens_resolutions", {})
         metadata = data.get("metadata", {})
@@ -390,10 +512,176 @@ def load_ens_cache(cache_file: str = 'ens_resolution.json') -> Optional[dict]:
         return None
 
 
-def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexers.json', use_cached_ens: bool = False, contract_address: Optional[str] = None, rpc_endpoint: Optional[str] = None, transaction_hash: Optional[str] = None) -> bool:
+# Number of addresses per ENS subgraph query, concurrent ENS queries, and retries per query
+ENS_BATCH_SIZE = 100
+DEFAULT_ENS_WORKERS = 4
+ENS_BATCH_RETRIES = 2
+
+
+def resolve_ens_batch(ens_url: str, batch_addresses: List[str], batch_number: int, retries: int = ENS_BATCH_RETRIES) -> Optional[dict]:
+    """
+    Resolve ENS names for one batch of addresses through the ENS subgraph.
+    Primary names from reverse records are preferred (see ens_resolver.resolve_names).
+    The batch is retried with backoff when a query fails, including GraphQL errors.
+    
+    Args:
+        ens_url: ENS subgraph query URL
+        batch_addresses: Lowercase addresses to resolve
+        batch_number: Batch number used in log messages
+        retries: Number of retries after a failed query
+        
+    Returns:
+        Dictionary mapping addresses (lowercase) to ENS names (None for addresses without one),
+        or None if the batch failed
+    """
+    for attempt in range(retries + 1):
+        try:
+            return ens_resolver.resolve_names(ens_url, batch_addresses)
+        except Exception as e:
+            if attempt >= retries:
+                print(f"⚠ Error querying ENS for batch {batch_number}: {e}")
+                return None
+            delay = http_client.backoff_delay(attempt)
+            print(f"⚠ ENS query failed for batch {batch_number}, retrying in {delay:.1f}s: {e}")
+            time.sleep(delay)
+
+
+def load_ens_cache_entries(cache_file: str = 'ens_resolution.json') -> dict:
+    """
+    Load the per-address ENS cache entries.
+    Caches written before entries existed are converted, using their retrieval time as resolved_at.
+    
+    Args:
+        cache_file: Path to the cache file
+        
+    Returns:
+        Dictionary mapping addresses (lowercase) to {"name": str or None, "resolved_at": unix time}
+    """
+    try:
+        store = state_store.get_store()
+        if store is not None:
+            return store.load_ens_entries()
+        
+        if not os.path.exists(cache_file):
+            return {}
+        
+        data = serialization.load_file(cache_file)
+        
+        if "entries" in data:
+            return data["entries"]
+        
+        try:
+            retrieved = datetime.strptime(data.get("metadata", {}).get("retrieved", ""), '%Y-%m-%d %H:%M:%S UTC')
+            resolved_at = int(retrieved.replace(tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            resolved_at = 0
+        return {
+            address: {"name": name, "resolved_at": resolved_at}
+            for address, name in data.get("ens_resolutions", {}).items()
+        }
+    except Exception as e:
+        print(f"Error loading ENS cache entries from {cache_file}: {e}")
+        return {}
+
+
+def is_ens_entry_fresh(entry: Optional[dict], now: int, ttl_hours: float, negative_ttl_hours: float) -> bool:
+    """Check whether a cache entry is still valid (names and misses have separate TTLs)."""
+    if not entry:
+        return False
+    ttl_hours = ttl_hours if entry.get("name") else negative_ttl_hours
+    return now - entry.get("resolved_at", 0) < ttl_hours * 3600
+
+
+class IndexerPipeline:
+    """
+    Carries the indexer set between the dashboard stages in memory.
+
+    Retrieval, the eligibility check, status change detection, the activity log and
+    the table renderer all work on the same `data` (this run) and `previous_data`
+    (the previous run) instead of each reloading and rewriting active_indexers.json.
+    The file is written once with save(). Files are only read when no earlier stage
+    produced the data, e.g. when retrieval was skipped.
+
+    When STATE_DB is set, runs are stored as snapshots in the state database instead
+    of active_indexers.json and its _previous_run backup.
+    """
+
+    def __init__(self, output_file: str = 'active_indexers.json', previous_file: Optional[str] = None):
+        self.output_file = output_file
+        self.previous_file = previous_file or output_file.replace('.json', '_previous_run.json')
+        self.store = state_store.get_store()
+        self.run_id: Optional[int] = None
+        # Stored run this run's data was read from (when no stage produced it)
+        self.source_run_id: Optional[int] = None
+        self.data: Optional[dict] = None
+        self.previous_data: Optional[dict] = None
+
+    def load(self) -> Optional[dict]:
+        """
+        Return this run's indexer data, reading the last stored run if no stage has produced it yet.
+
+        Data read from the state database is a starting point for this run: save() still stores
+        it as a new run, so the stored run and its logged status changes stay untouched.
+        """
+        if self.data is None:
+            if self.store is not None:
+                run_ids = self.store.get_run_ids(1)
+                if run_ids:
+                    print(f"Reading run {run_ids[0]} from {self.store.db_path}...")
+                    self.source_run_id = run_ids[0]
+                    self.data = self.store.load_run(self.source_run_id)
+            elif os.path.exists(self.output_file):
+                print(f"Reading indexer data from {self.output_file}...")
+                self.data = serialization.load_file(self.output_file)
+        return self.data
+
+    def load_last_run(self) -> Optional[dict]:
+        """Return the last stored run, before this run replaces it."""
+        if self.store is not None:
+            return self.store.load_run()
+        if os.path.exists(self.output_file):
+            return serialization.load_file(self.output_file)
+        return None
+
+    def backup_last_run(self) -> None:
+        """Copy the last stored run to previous_file (the state database keeps every run as a snapshot)."""
+        if self.store is None and os.path.exists(self.output_file):
+            shutil.copy(self.output_file, self.previous_file)
+            print(f"✓ Backed up previous run to {self.previous_file}")
+
+    def load_previous(self) -> dict:
+        """Return the previous run's indexer data (empty if there was no previous run)."""
+        if self.previous_data is None:
+            self.previous_data = {}
+            if self.store is not None:
+                if self.source_run_id is not None:
+                    # This run started from a stored run, so that run is the one to compare against
+                    self.previous_data = self.store.load_run(self.source_run_id) or {}
+                else:
+                    self.previous_data = self.store.load_previous_run(self.run_id) or {}
+            elif os.path.exists(self.previous_file):
+                print(f"Reading previous run from {self.previous_file}...")
+                self.previous_data = serialization.load_file(self.previous_file)
+        return self.previous_data
+
+    def save(self) -> bool:
+        """Write this run's indexer data to output_file (or store it as a run in the state database)."""
+        if self.data is None:
+            return False
+        if self.store is not None:
+            self.run_id = self.store.save_run(self.data, self.run_id)
+            print(f"✓ Results saved as run {self.run_id} in {self.store.db_path}")
+            return True
+        serialization.dump_file(self.output_file, self.data)
+        print(f"✓ Results written to {self.output_file}")
+        return True
+
+
+def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexers.json', use_cached_ens: bool = False, contract_address: Optional[str] = None, rpc_endpoint: Optional[str] = None, transaction_hash: Optional[str] = None, block: str = 'latest', ens_workers: int = DEFAULT_ENS_WORKERS, ens_ttl_hours: float = DEFAULT_ENS_CACHE_TTL_HOURS, ens_negative_ttl_hours: float = DEFAULT_ENS_NEGATIVE_TTL_HOURS, pipeline: Optional[IndexerPipeline] = None) -> bool:
     """
     Retrieve the list of active indexers with self stake > 0 from The Graph's network subgraph.
     ENS resolution can be cached or fetched from subgraph based on use_cached_ens parameter.
+    When fetching, only addresses that are new or whose cache entry has expired are queried.
     
     This function retrieves the list of active indexers. ENS names are either loaded from
     cache or fetched from the ENS subgraph, then saved separately.
@@ -405,6 +693,12 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         contract_address: The contract address to query oracle update time
         rpc_endpoint: RPC endpoint URL
         transaction_hash: Transaction hash to store in metadata (optional)
+        block: Block tag or hex block number to read contract metadata at
+        ens_workers: Number of ENS subgraph queries sent concurrently
+        ens_ttl_hours: How long a cached ENS name stays valid
+        ens_negative_ttl_hours: How long a cached "no ENS name" result stays valid
+        pipeline: Pipeline to hand the indexer set to; it is written to output_file
+            right away when not given
         
     Returns:
         True if successful, False otherwise
@@ -420,10 +714,10 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         network_url = f"https://gateway.thegraph.com/api/{graph_api_key}/subgraphs/id/{network_deployment_id}"
         ens_url = f"https://gateway.thegraph.com/api/{graph_api_key}/subgraphs/id/{ens_deployment_id}"
         
-        # GraphQL query to get indexers with self stake > 0
+        # GraphQL query to get indexers with self stake > 0, one id_gt cursor page at a time
         indexers_query = """
-        {
-          indexers(first: 1000, where: {stakedTokens_gt: "0"}) {
+        query ActiveIndexers($first: Int!, $lastId: String!) {
+          indexers(first: $first, where: {stakedTokens_gt: "0", id_gt: $lastId}, orderBy: id, orderDirection: asc) {
             id
             stakedTokens
             defaultDisplayName
@@ -431,38 +725,9 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         }
         """
         
-        print(f"Querying network subgraph for active indexers...")
-        
-        # Make the GraphQL request to network subgraph
-        response = requests.post(
-            network_url,
-            json={"query": indexers_query},
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Check for errors in the response
-        if "errors" in data:
-            print(f"GraphQL Error: {data['errors']}")
-            return False
-        
-        # Extract indexers from the response
-        indexers_raw = data.get("data", {}).get("indexers", [])
-        
-        if not indexers_raw:
-            print("No active indexers found with self stake > 0")
-            return False
-        
-        print(f"✓ Retrieved {len(indexers_raw)} active indexers")
-        
-        # Extract all addresses for ENS lookup
-        addresses = [indexer.get("id", "").lower() for indexer in indexers_raw]
-        
         # Determine ENS resolution strategy
         ens_mapping = {}
+        ens_entries = {}
         
         if use_cached_ens:
             print(f"Using cached ENS data...")
@@ -474,61 +739,64 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
                 use_cached_ens = False
         
         if not use_cached_ens:
-            # Query ENS subgraph to resolve names
-            print(f"Querying ENS subgraph for name resolution...")
-            
-            # Build ENS query - query in batches if needed
-            batch_size = 100
-            
-            for i in range(0, len(addresses), batch_size):
-                batch_addresses = addresses[i:i+batch_size]
-                
-                # Build the where clause for this batch
-                addresses_filter = '", "'.join(batch_addresses)
-                ens_query = f"""
-                {{
-                  domains(first: 1000, where: {{resolvedAddress_in: ["{addresses_filter}"]}}) {{
-                    name
-                    resolvedAddress {{
-                      id
-                    }}
-                  }}
-                }}
-                """
+            ens_entries = load_ens_cache_entries()
+        
+        print(f"Querying network subgraph for active indexers...")
+        if not use_cached_ens:
+            print(f"Querying ENS subgraph for new and expired addresses as pages arrive...")
+        
+        # ENS batches are dispatched to a bounded worker pool as pages arrive
+        now = int(time.time())
+        batch_number = 0
+        ens_futures = {}
+        cached_count = 0
+        indexers_raw = []
+        
+        # Pages stream in while the next one is prefetched, so ENS lookups start
+        # before the whole indexer set has been downloaded
+        with ThreadPoolExecutor(max_workers=max(1, ens_workers)) as ens_executor:
+            for page in subgraph_client.paginate(network_url, indexers_query, "indexers"):
+                indexers_raw.extend(page)
+                print(f"  Retrieved {len(indexers_raw)} active indexers so far...")
                 
-                try:
-                    ens_response = requests.post(
-                        ens_url,
-                        json={"query": ens_query},
-                        headers={"Content-Type": "application/json"},
-                        timeout=30
-                    )
-                    ens_response.raise_for_status()
-                    
-                    ens_data = ens_response.json()
-                    
-                    if "errors" in ens_data:
-                        print(f"⚠ ENS query error for batch {i//batch_size + 1}: {ens_data['errors']}")
-                        continue
-                    
-                    # Map addresses to ENS names
-                    domains = ens_data.get("data", {}).get("domains", [])
-                    for domain in domains:
-                        resolved_addr = domain.get("resolvedAddress", {})
-                        if resolved_addr:
-                            addr_id = resolved_addr.get("id", "").lower()
-                            ens_name = domain.get("name", "")
-                            if addr_id and ens_name:
-                                ens_mapping[addr_id] = ens_name
-                    
-                except Exception as e:
-                    print(f"⚠ Error querying ENS for batch {i//batch_size + 1}: {e}")
+                if use_cached_ens:
                     continue
+                
+                # Extract this page's addresses that need an ENS lookup
+                page_addresses = [indexer.get("id", "").lower() for indexer in page]
+                addresses = [
+                    address for address in page_addresses
+                    if not is_ens_entry_fresh(ens_entries.get(address), now, ens_ttl_hours, ens_negative_ttl_hours)
+                ]
+                cached_count += len(page_addresses) - len(addresses)
+                for i in range(0, len(addresses), ENS_BATCH_SIZE):
+                    batch_number += 1
+                    batch_addresses = addresses[i:i+ENS_BATCH_SIZE]
+                    ens_futures[ens_executor.submit(resolve_ens_batch, ens_url, batch_addresses, batch_number)] = batch_addresses
             
-            print(f"✓ Resolved {len(ens_mapping)} ENS names")
+            # Merge batches as they complete; every address belongs to exactly one batch and
+            # its name is chosen deterministically, so completion order does not matter.
+            # Addresses of a failed batch keep their previous (expired) entry.
+            for completed, future in enumerate(as_completed(ens_futures), start=1):
+                batch_mapping = future.result()
+                if batch_mapping is not None:
+                    for address in ens_futures[future]:
+                        ens_entries[address] = {"name": batch_mapping.get(address), "resolved_at": now}
+                if completed % 10 == 0 or completed == len(ens_futures):
+                    print(f"  Resolved {completed}/{len(ens_futures)} ENS batches...")
+        
+        if not indexers_raw:
+            print("No active indexers found with self stake > 0")
+            return False
+        
+        print(f"✓ Retrieved {len(indexers_raw)} active indexers")
+        
+        if not use_cached_ens:
+            ens_mapping = {address: entry["name"] for address, entry in ens_entries.items() if entry.get("name")}
+            print(f"✓ Resolved {len(ens_mapping)} ENS names ({cached_count} addresses served from cache)")
             
             # Save ENS cache for future use
-            save_ens_cache(ens_mapping)
+            save_ens_cache(ens_mapping, entries=ens_entries)
         
         # Build the JSON structure (without ENS names)
         current_timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
@@ -538,9 +806,9 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         eligibility_period = None
         if contract_address and rpc_endpoint:
             print(f"Fetching last oracle update time from contract...")
-            last_oracle_update_time = get_oracle_update_time(contract_address, rpc_endpoint)
+            last_oracle_update_time = get_oracle_update_time(contract_address, rpc_endpoint, block=block)
             print(f"Fetching eligibility period from contract...")
-            eligibility_period = get_eligibility_period(contract_address, rpc_endpoint)
+            eligibility_period = get_eligibility_period(contract_address, rpc_endpoint, block=block)
         
         output_data = {
             "metadata": {
@@ -548,26 +816,31 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
                 "total_count": len(indexers_raw),
                 "last_oracle_update_time": last_oracle_update_time,
                 "eligibility_period": eligibility_period,
-                "transaction_hash": transaction_hash if transaction_hash else None
+                "transaction_hash": transaction_hash if transaction_hash else None,
+                "snapshot_block": int(block, 16) if block.startswith('0x') else None
             },
             "indexers": []
         }
         
+        save_output = pipeline is None
+        if pipeline is None:
+            pipeline = IndexerPipeline(output_file)
+        
         # Load previous run data to preserve last_renewed_on_tx
         previous_indexers_map = {}
-        backup_file = output_file.replace('.json', '_previous_run.json')
-        if os.path.exists(output_file):
-            try:
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    previous_data = json.load(f)
+        try:
+            previous_data = pipeline.load_last_run()
+            if previous_data is not None:
+                # Later stages compare against the previous run without reading the backup
+                pipeline.previous_data = previous_data
                 previous_indexers = previous_data.get("indexers", [])
                 previous_indexers_map = {
                     indexer.get("address", "").lower(): indexer.get("last_renewed_on_tx", "")
                     for indexer in previous_indexers
                 }
                 print(f"✓ Loaded {len(previous_indexers_map)} indexers from previous run")
-            except Exception as e:
-                print(f"⚠ Warning: Could not load previous file: {e}")
+        except Exception as e:
+            print(f"⚠ Warning: Could not load previous file: {e}")
         
         # Process each indexer without ENS name
         for indexer in indexers_raw:
@@ -589,18 +862,16 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
             output_data["indexers"].append(indexer_data)
         
         # Backup the previous run's file before writing the new one
-        if os.path.exists(output_file):
-            try:
-                shutil.copy(output_file, backup_file)
-                print(f"✓ Backed up previous run to {backup_file}")
-            except Exception as e:
-                print(f"⚠ Warning: Could not backup previous file: {e}")
-        
-        # Write to JSON file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
-        
-        print(f"✓ Results written to {output_file}")
+        try:
+            pipeline.backup_last_run()
+        except Exception as e:
+            print(f"⚠ Warning: Could not backup previous file: {e}")
+        
+        pipeline.data = output_data
+        if save_output:
+            pipeline.save()
+        else:
+            print(f"✓ Retrieved {len(output_data['indexers'])} indexers")
         return True
         
     except requests.exceptions.RequestException as e:
@@ -611,12 +882,39 @@ def retrieveActiveIndexers(graph_api_key: str, output_file: str = 'active_indexe
         return False
 
 
-def checkEligibility(contract_address: str, rpc_endpoint: str, input_file: str = 'active_indexers.json') -> bool:
+# Fields computed by checkEligibility, kept from the previous run when a contract read fails
+ELIGIBILITY_FIELDS = (
+    "is_eligible",
+    "status",
+    "eligibility_renewal_time",
+    "eligibility_renewal_time_readable",
+    "eligibility_renewal_time_short",
+    "eligible_until",
+    "eligible_until_readable",
+    "eligible_until_short",
+)
+
+
+def checkEligibility(contract_address: str, rpc_endpoint: str, input_file: str = 'active_indexers.json', batch_size: int = rpc_client.DEFAULT_BATCH_SIZE, use_multicall: bool = False, multicall_max_calldata_bytes: int = rpc_client.DEFAULT_MULTICALL_MAX_CALLDATA_BYTES, fused: bool = False, block: str = 'latest', concurrency: int = 1, previous_file: str = 'active_indexers_previous_run.json', renewal_history: Optional[Dict[str, dict]] = None, pipeline: Optional[IndexerPipeline] = None) -> bool:
     """
     Check eligibility for each indexer using a two-pass approach:
     1. First pass: Call isEligible(address) for all indexers and store the result
     2. Second pass: Only for eligible indexers, call getEligibilityRenewalTime(address)
     
+    Calls are packed into JSON-RPC batches of up to batch_size eth_calls per HTTP request,
+    optionally aggregated through Multicall3 so one eth_call covers hundreds of indexers.
+    In fused mode, isEligible and getEligibilityRenewalTime are requested for every indexer
+    in a single sweep, so Pass 2 no longer waits for Pass 1 to finish.
+    
+    All reads should be pinned to the same block as the metadata's last_oracle_update_time,
+    since Pass 3 compares the two values for exact equality.
+    
+    Indexers whose reads still fail after retries keep their status from the previous run.
+    
+    When a renewal history from the event indexer is given, renewal times and last_renewed_on_tx
+    come from the oracle's renewal events and getEligibilityRenewalTime is only called for
+    eligible indexers missing from the history.
+    
     Reads indexer addresses from the JSON file and updates each indexer's is_eligible 
     and eligibility_renewal_time fields.
     
@@ -624,157 +922,174 @@ def checkEligibility(contract_address: str, rpc_endpoint: str, input_file: str =
         contract_address: The contract address (0x9BED32d2b562043a426376b99d289fE821f5b04E)
         rpc_endpoint: RPC endpoint URL
         input_file: Path to the active_indexers.json file
+        batch_size: Maximum number of eth_calls per JSON-RPC batch (1 disables batching)
+        use_multicall: If True, aggregate the per-indexer calls through Multicall3 aggregate3
+        multicall_max_calldata_bytes: Maximum calldata size of a single aggregate3 call
+        fused: If True, fetch isEligible and renewal times for all indexers in one sweep
+        block: Block tag or hex block number all eligibility reads are pinned to
+        concurrency: Maximum number of RPC requests in flight (1 sends them sequentially)
+        previous_file: Path to the previous run's backup file, used when a contract read fails
+        renewal_history: Latest renewal per lowercase indexer address from event_indexer (optional)
+        pipeline: Pipeline carrying the indexer set in memory; input_file is read and
+            rewritten when not given
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Check if input file exists
-        if not os.path.exists(input_file):
-            print(f"⚠ {input_file} not found, skipping eligibility check")
-            return False
+        save_output = pipeline is None
+        if pipeline is None:
+            pipeline = IndexerPipeline(input_file, previous_file)
         
-        # Read the JSON file
-        print(f"Reading indexer data from {input_file}...")
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = pipeline.load()
+        if data is None:
+            print(f"⚠ {pipeline.output_file} not found, skipping eligibility check")
+            return False
         
         indexers = data.get("indexers", [])
         if not indexers:
             print("No indexers found in JSON file")
             return False
         
-        # ========== PASS 1: Check isEligible for all indexers ==========
-        print(f"Pass 1: Checking isEligible status for {len(indexers)} indexers...")
-        
         # Function selector for isEligible(address)
         # From contract: 0x66e305fd
         is_eligible_selector = '0x66e305fd'
         
+        # Function selector for getEligibilityRenewalTime(address)
+        # From contract: 0xd353402d
+        renewal_time_selector = '0xd353402d'
+        
+        def call_contract(call_data):
+            return rpc_client.eth_call_many(rpc_endpoint, contract_address, call_data, batch_size=batch_size, use_multicall=use_multicall, max_calldata_bytes=multicall_max_calldata_bytes, block=block, concurrency=concurrency)
+        
+        query_indexers = [indexer for indexer in indexers if indexer.get("address", "")]
+        
+        # Addresses whose contract reads still failed after retries
+        failed_addresses = set()
+        
+        # In fused mode both values are requested for every indexer in one sweep,
+        # so Pass 2 below reuses these results instead of waiting for Pass 1
+        fused_renewal_results = {}
+        fused = fused and renewal_history is None
+        if fused:
+            print(f"Pass 1+2: Fetching isEligible and eligibility renewal time for {len(query_indexers)} indexers in a single sweep...")
+            call_data = [rpc_client.encode_address_call(is_eligible_selector, indexer["address"]) for indexer in query_indexers]
+            call_data += [rpc_client.encode_address_call(renewal_time_selector, indexer["address"]) for indexer in query_indexers]
+            results = call_contract(call_data)
+            eligibility_results = results[:len(query_indexers)]
+            fused_renewal_results = {indexer["address"].lower(): result for indexer, result in zip(query_indexers, results[len(query_indexers):])}
+        
+        # ========== PASS 1: Check isEligible for all indexers ==========
+        print(f"Pass 1: Checking isEligible status for {len(indexers)} indexers...")
+        
         eligible_count = 0
         
-        # First pass: Check isEligible for each indexer
-        for i, indexer in enumerate(indexers):
-            address = indexer.get("address", "")
-            if not address:
-                continue
-            
-            try:
-                # Prepare the function call data
-                # Remove '0x' prefix from address and pad to 32 bytes (64 hex chars)
-                address_param = address[2:] if address.startswith('0x') else address
-                address_param = address_param.lower().zfill(64)
-                
-                data_payload = is_eligible_selector + address_param
-                
-                # Make the eth_call
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_call",
-                    "params": [
-                        {
-                            "to": contract_address,
-                            "data": data_payload
-                        },
-                        "latest"
-                    ]
-                }
-                
-                response = requests.post(rpc_endpoint, json=payload, timeout=10)
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                if "result" in result and result["result"] != "0x":
-                    # Parse the result (bool)
-                    # The result is a 32-byte hex string, bool is the last byte
-                    is_eligible = int(result["result"], 16) != 0
-                    indexer["is_eligible"] = is_eligible
-                    if is_eligible:
-                        eligible_count += 1
-                else:
-                    indexer["is_eligible"] = False
-                
-            except Exception as e:
-                print(f"⚠ Error checking isEligible for {address}: {e}")
+        # First pass: Check isEligible for each indexer, packed into JSON-RPC batches
+        if not fused:
+            eligibility_results = call_contract([rpc_client.encode_address_call(is_eligible_selector, indexer["address"]) for indexer in query_indexers])
+        
+        for indexer, result in zip(query_indexers, eligibility_results):
+            if result is rpc_client.REVERTED:
+                # A revert is the contract's answer, not a failed read: record the indexer as ineligible
+                print(f"⚠ isEligible reverted for {indexer['address']}, recording it as ineligible")
+                indexer["is_eligible"] = False
+            elif result is None:
+                print(f"⚠ Error checking isEligible for {indexer['address']}")
+                indexer["is_eligible"] = False
+                failed_addresses.add(indexer["address"].lower())
+            elif result != "0x":
+                # Parse the result (bool)
+                # The result is a 32-byte hex string, bool is the last byte
+                is_eligible = int(result, 16) != 0
+                indexer["is_eligible"] = is_eligible
+                if is_eligible:
+                    eligible_count += 1
+            else:
                 indexer["is_eligible"] = False
-                continue
-            
-            # Progress indicator every 10 indexers
-            if (i + 1) % 10 == 0:
-                print(f"  Processed {i + 1}/{len(indexers)} indexers...")
         
         print(f"✓ Pass 1 complete: {eligible_count} eligible indexers found")
         
         # ========== PASS 2: Get renewal times for eligible indexers ==========
         print(f"Pass 2: Getting eligibility renewal times for {eligible_count} eligible indexers...")
         
-        # Function selector for getEligibilityRenewalTime(address)
-        # From contract: 0xd353402d
-        renewal_time_selector = '0xd353402d'
-        
         updated_count = 0
-        processed_count = 0
         
         # Second pass: Get renewal time only for eligible indexers
-        for i, indexer in enumerate(indexers):
+        pass2_indexers = []
+        for indexer in indexers:
             # Skip if not eligible
             if not indexer.get("is_eligible", False):
                 indexer["eligibility_renewal_time"] = 0
                 continue
-            
-            address = indexer.get("address", "")
-            if not address:
-                continue
-            
-            try:
-                # Prepare the function call data
-                address_param = address[2:] if address.startswith('0x') else address
-                address_param = address_param.lower().zfill(64)
-                
-                data_payload = renewal_time_selector + address_param
-                
-                # Make the eth_call
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "eth_call",
-                    "params": [
-                        {
-                            "to": contract_address,
-                            "data": data_payload
-                        },
-                        "latest"
-                    ]
-                }
-                
-                response = requests.post(rpc_endpoint, json=payload, timeout=10)
-                response.raise_for_status()
-                
-                result = response.json()
-                
-                if "result" in result and result["result"] != "0x":
-                    # Parse the result (uint256 timestamp)
-                    renewal_time = int(result["result"], 16)
-                    indexer["eligibility_renewal_time"] = renewal_time
-                    updated_count += 1
-                else:
-                    indexer["eligibility_renewal_time"] = 0
-                
-            except Exception as e:
-                print(f"⚠ Error getting renewal time for {address}: {e}")
+            if indexer.get("address", ""):
+                pass2_indexers.append(indexer)
+        
+        if fused:
+            results = [fused_renewal_results.get(indexer["address"].lower()) for indexer in pass2_indexers]
+        elif renewal_history is not None:
+            # Renewal times come from the event history, encoded like the contract's uint256 result;
+            # only indexers missing from the history are read from the contract
+            missing = [indexer for indexer in pass2_indexers if indexer["address"].lower() not in renewal_history]
+            if missing:
+                print(f"  {len(missing)} eligible indexers missing from the event history, reading their renewal times from the contract")
+            missing_results = dict(zip(
+                [indexer["address"].lower() for indexer in missing],
+                call_contract([rpc_client.encode_address_call(renewal_time_selector, indexer["address"]) for indexer in missing]) if missing else [],
+            ))
+            results = [
+                hex(renewal_history[indexer["address"].lower()]["renewal_time"]) if indexer["address"].lower() in renewal_history
+                else missing_results.get(indexer["address"].lower())
+                for indexer in pass2_indexers
+            ]
+        else:
+            results = call_contract([rpc_client.encode_address_call(renewal_time_selector, indexer["address"]) for indexer in pass2_indexers])
+        
+        for indexer, result in zip(pass2_indexers, results):
+            if result is rpc_client.REVERTED:
+                print(f"⚠ getEligibilityRenewalTime reverted for {indexer['address']}, recording no renewal")
+                indexer["eligibility_renewal_time"] = 0
+            elif result is None:
+                print(f"⚠ Error getting renewal time for {indexer['address']}")
+                indexer["eligibility_renewal_time"] = 0
+                failed_addresses.add(indexer["address"].lower())
+            elif result != "0x":
+                # Parse the result (uint256 timestamp)
+                renewal_time = int(result, 16)
+                indexer["eligibility_renewal_time"] = renewal_time
+                updated_count += 1
+            else:
                 indexer["eligibility_renewal_time"] = 0
-                continue
-            
-            processed_count += 1
-            
-            # Progress indicator every 10 eligible indexers
-            if processed_count % 10 == 0:
-                print(f"  Processed {processed_count}/{eligible_count} eligible indexers...")
         
         print(f"✓ Pass 2 complete: {updated_count} renewal times updated")
         
+        # The event history knows the exact transaction that last renewed each indexer
+        if renewal_history is not None:
+            for indexer in query_indexers:
+                renewal = renewal_history.get(indexer["address"].lower())
+                if renewal and renewal.get("tx_hash"):
+                    indexer["last_renewed_on_tx"] = renewal["tx_hash"]
+        
+        # A failed read (transport error, timeout, rate limit) says nothing about eligibility, so
+        # keep the previous run's result for those indexers instead of reporting them as ineligible.
+        # Reverted calls are not failed reads and were recorded above.
+        carried_over = set()
+        if failed_addresses:
+            previous_data = pipeline.load_previous()
+            previous_indexers_map = {
+                indexer.get("address", "").lower(): indexer
+                for indexer in previous_data.get("indexers", [])
+            }
+            for indexer in indexers:
+                address = indexer.get("address", "").lower()
+                if address in failed_addresses and address in previous_indexers_map:
+                    previous_indexer = previous_indexers_map[address]
+                    for field in ELIGIBILITY_FIELDS:
+                        if field in previous_indexer:
+                            indexer[field] = previous_indexer[field]
+                    carried_over.add(address)
+        if failed_addresses:
+            print(f"⚠ Contract reads failed for {len(failed_addresses)} indexers, kept previous run's status for {len(carried_over)} of them")
+        
         # ========== PASS 3: Update status based on eligibility_renewal_time comparison ==========
         print(f"Pass 3: Updating status based on eligibility renewal time and grace period...")
         
@@ -792,6 +1107,17 @@ def checkEligibility(contract_address: str, rpc_endpoint: str, input_file: str =
         ineligible_status_count = 0
         
         for indexer in indexers:
+            # Indexers carried over from the previous run keep their previous status
+            if indexer.get("address", "").lower() in carried_over:
+                status = indexer.get("status", "ineligible")
+                if status == "eligible":
+                    eligible_status_count += 1
+                elif status == "grace":
+                    grace_status_count += 1
+                else:
+                    ineligible_status_count += 1
+                continue
+            
             eligibility_renewal_time = indexer.get("eligibility_renewal_time", 0)
             
             # Format eligibility_renewal_time to readable format (both short and full)
@@ -811,7 +1137,8 @@ def checkEligibility(contract_address: str, rpc_endpoint: str, input_file: str =
                 indexer["eligible_until_readable"] = ""
                 indexer["eligible_until_short"] = ""
                 # Update last_renewed_on_tx with current transaction hash when eligible
-                if transaction_hash:
+                # (unless it was already taken from the renewal events)
+                if transaction_hash and renewal_history is None:
                     indexer["last_renewed_on_tx"] = transaction_hash
                 eligible_status_count += 1
             elif eligibility_renewal_time != last_oracle_update_time and eligibility_period and eligibility_renewal_time > 0:
@@ -846,16 +1173,14 @@ def checkEligibility(contract_address: str, rpc_endpoint: str, input_file: str =
         print(f"  - Grace: {grace_status_count}")
         print(f"  - Ineligible: {ineligible_status_count}")
         
-        # Write updated data back to JSON file
-        with open(input_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        if save_output:
+            pipeline.save()
         
         print(f"✓ Eligibility check complete:")
         print(f"  - Total indexers: {len(indexers)}")
         print(f"  - Eligible indexers: {eligible_count}")
         print(f"  - Renewal times retrieved: {updated_count}")
         print(f"  - Status breakdown: {eligible_status_count} eligible, {grace_status_count} grace, {ineligible_status_count} ineligible")
-        print(f"✓ Results written to {input_file}")
         return True
         
     except Exception as e:
@@ -863,7 +1188,7 @@ def checkEligibility(contract_address: str, rpc_endpoint: str, input_file: str =
         return False
 
 
-def updateStatusChangeDates(current_file: str = 'active_indexers.json', previous_file: str = 'active_indexers_previous_run.json') -> bool:
+def updateStatusChangeDates(current_file: str = 'active_indexers.json', previous_file: str = 'active_indexers_previous_run.json', pipeline: Optional[IndexerPipeline] = None) -> bool:
     """
     Compare the current and previous run files to detect status changes.
     Updates the last_status_change_date field for indexers whose status has changed.
@@ -871,42 +1196,37 @@ def updateStatusChangeDates(current_file: str = 'active_indexers.json', previous
     Args:
         current_file: Path to the current active_indexers.json file
         previous_file: Path to the previous run's backup file
+        pipeline: Pipeline carrying both runs in memory; the files are read and
+            current_file rewritten when not given
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Check if current file exists
-        if not os.path.exists(current_file):
-            print(f"⚠ {current_file} not found, skipping status change detection")
-            return False
+        save_output = pipeline is None
+        if pipeline is None:
+            pipeline = IndexerPipeline(current_file, previous_file)
         
-        # Read current file
-        print(f"Reading current file: {current_file}...")
-        with open(current_file, 'r', encoding='utf-8') as f:
-            current_data = json.load(f)
+        current_data = pipeline.load()
+        if current_data is None:
+            print(f"⚠ {pipeline.output_file} not found, skipping status change detection")
+            return False
         
         current_indexers = current_data.get("indexers", [])
         if not current_indexers:
             print("No indexers found in current file")
             return False
         
-        # Try to read previous file
-        previous_indexers_map = {}
-        if os.path.exists(previous_file):
-            print(f"Reading previous file: {previous_file}...")
-            with open(previous_file, 'r', encoding='utf-8') as f:
-                previous_data = json.load(f)
-            
-            previous_indexers = previous_data.get("indexers", [])
-            # Create a map of address -> indexer data for quick lookup
-            previous_indexers_map = {
-                indexer.get("address", "").lower(): indexer 
-                for indexer in previous_indexers
-            }
-            print(f"✓ Loaded {len(previous_indexers_map)} indexers from previous run")
+        # Create a map of address -> previous run's indexer data for quick lookup
+        previous_indexers = pipeline.load_previous().get("indexers", [])
+        previous_indexers_map = {
+            indexer.get("address", "").lower(): indexer 
+            for indexer in previous_indexers
+        }
+        if previous_indexers_map:
+            print(f"✓ Compared against {len(previous_indexers_map)} indexers from previous run")
         else:
-            print(f"⚠ {previous_file} not found, treating all as new indexers")
+            print(f"⚠ No previous run found, treating all as new indexers")
         
         # Get current date in format like "21/Oct/2025"
         current_date = datetime.now(timezone.utc).strftime("%-d/%b/%Y")
@@ -940,15 +1260,13 @@ def updateStatusChangeDates(current_file: str = 'active_indexers.json', previous
                 indexer["last_status_change_date"] = ""
                 new_indexers_count += 1
         
-        # Write updated data back to current file
-        with open(current_file, 'w', encoding='utf-8') as f:
-            json.dump(current_data, f, indent=2)
+        if save_output:
+            pipeline.save()
         
         print(f"✓ Status change detection complete:")
         print(f"  - Status changed: {status_changed_count}")
         print(f"  - Status unchanged: {status_unchanged_count}")
         print(f"  - New indexers: {new_indexers_count}")
-        print(f"✓ Updated {current_file} with status change dates")
         return True
         
     except Exception as e:
@@ -956,28 +1274,30 @@ def updateStatusChangeDates(current_file: str = 'active_indexers.json', previous
         return False
 
 
-def logStatusChanges(current_file: str = 'active_indexers.json', previous_file: str = 'active_indexers_previous_run.json', log_file: str = 'activity_log_indexers_status_changes.json') -> bool:
+def logStatusChanges(current_file: str = 'active_indexers.json', previous_file: str = 'active_indexers_previous_run.json', log_file: str = activity_log.DEFAULT_LOG_FILE, metadata_file: str = activity_log.DEFAULT_METADATA_FILE, index_file: str = activity_log.DEFAULT_INDEX_FILE, pipeline: Optional[IndexerPipeline] = None) -> bool:
     """
     Track and log status changes for indexers in an activity log file.
-    Updates metadata on each run and appends status change entries.
+    Updates metadata on each run and appends status change entries tagged with the run's ID.
     
     Args:
         current_file: Path to the current active_indexers.json file
         previous_file: Path to the previous run's backup file
-        log_file: Path to the activity log file
+        log_file: Path to the activity log (JSONL, appended to)
+        metadata_file: Path to the activity log's metadata file (rewritten)
+        index_file: Path to the activity log's run index (appended to)
+        pipeline: Pipeline carrying both runs in memory; the files are read when not given
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Check if current file exists
-        if not os.path.exists(current_file):
-            print(f"⚠ {current_file} not found, skipping status change logging")
-            return False
+        if pipeline is None:
+            pipeline = IndexerPipeline(current_file, previous_file)
         
-        # Read current file
-        with open(current_file, 'r', encoding='utf-8') as f:
-            current_data = json.load(f)
+        current_data = pipeline.load()
+        if current_data is None:
+            print(f"⚠ {pipeline.output_file} not found, skipping status change logging")
+            return False
         
         current_indexers = current_data.get("indexers", [])
         current_metadata = current_data.get("metadata", {})
@@ -986,37 +1306,18 @@ def logStatusChanges(current_file: str = 'active_indexers.json', previous_file:
             print("No indexers found in current file")
             return False
         
-        # Try to read previous file
-        previous_indexers_map = {}
-        if os.path.exists(previous_file):
-            with open(previous_file, 'r', encoding='utf-8') as f:
-                previous_data = json.load(f)
-            
-            previous_indexers = previous_data.get("indexers", [])
-            # Create a map of address -> status for quick lookup
-            previous_indexers_map = {
-                indexer.get("address", "").lower(): indexer.get("status", "")
-                for indexer in previous_indexers
-            }
+        # Create a map of address -> previous run's status for quick lookup
+        previous_indexers = pipeline.load_previous().get("indexers", [])
+        previous_indexers_map = {
+            indexer.get("address", "").lower(): indexer.get("status", "")
+            for indexer in previous_indexers
+        }
         
-        # Load existing activity log or create new one
-        activity_log = {"metadata": {}, "status_changes": []}
-        if os.path.exists(log_file):
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    activity_log = json.load(f)
-                    # Ensure status_changes list exists
-                    if "status_changes" not in activity_log:
-                        activity_log["status_changes"] = []
-            except Exception as e:
-                print(f"⚠ Error reading existing log file, creating new one: {e}")
-                activity_log = {"metadata": {}, "status_changes": []}
-        
-        # Update metadata section (always overwrite)
+        # Metadata section (always overwritten)
         current_check = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
         last_oracle_update_time = current_metadata.get("last_oracle_update_time")
         
-        activity_log["metadata"] = {
+        log_metadata = {
             "last_check": current_check,
             "last_oracle_update_time": last_oracle_update_time
         }
@@ -1025,7 +1326,7 @@ def logStatusChanges(current_file: str = 'active_indexers.json', previous_file:
         current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         
         # Track status changes
-        changes_count = 0
+        new_changes = []
         
         for indexer in current_indexers:
             address = indexer.get("address", "").lower()
@@ -1042,18 +1343,30 @@ def logStatusChanges(current_file: str = 'active_indexers.json', previous_file:
                         "new_status": current_status,
                         "date_status_change": current_date
                     }
-                    activity_log["status_changes"].append(change_entry)
-                    changes_count += 1
-        
-        # Write updated activity log back to file
-        with open(log_file, 'w', encoding='utf-8') as f:
-            json.dump(activity_log, f, indent=2)
+                    new_changes.append(change_entry)
+        
+        store = state_store.get_store()
+        if store is not None:
+            # The changes belong to this run's snapshot, so it has to be stored first
+            if pipeline.run_id is None:
+                pipeline.save()
+            run_id = pipeline.run_id
+            log_metadata["last_run_id"] = run_id
+            # Append the changes and the metadata in one transaction
+            store.add_status_changes(new_changes, log_metadata, run_id)
+            total_entries = store.count_status_changes()
+            log_location = store.db_path
+        else:
+            # Append only this run's changes; the history is never reloaded or rewritten
+            run_id, total_entries = activity_log.append_changes(new_changes, log_metadata, log_file, metadata_file, index_file)
+            log_location = log_file
         
         print(f"✓ Activity log updated:")
         print(f"  - Last check: {current_check}")
-        print(f"  - Status changes detected: {changes_count}")
-        print(f"  - Total entries in log: {len(activity_log['status_changes'])}")
-        print(f"✓ Activity log saved to {log_file}")
+        print(f"  - Run: {run_id}")
+        print(f"  - Status changes detected: {len(new_changes)}")
+        print(f"  - Total entries in log: {total_entries}")
+        print(f"✓ Activity log saved to {log_location}")
         return True
         
     except Exception as e:
@@ -1095,13 +1408,14 @@ def read_indexers_data(filename: str = 'indexers.txt') -> List[Tuple[str, str]]:
     return indexers
 
 
-def renderIndexerTable(json_file: str = 'active_indexers.json') -> List[dict]:
+def renderIndexerTable(json_file: str = 'active_indexers.json', pipeline: Optional[IndexerPipeline] = None) -> List[dict]:
     """
     Read all indexers from the active_indexers.json file and merge with ENS data.
     Returns all indexers regardless of eligibility status.
     
     Args:
         json_file: Path to the active_indexers.json file
+        pipeline: Pipeline carrying the indexer set in memory (json_file is read when not given)
         
     Returns:
         List of dictionaries containing all indexer data with ENS names
@@ -1109,13 +1423,14 @@ def renderIndexerTable(json_file: str = 'active_indexers.json') -> List[dict]:
     all_indexers = []
     
     try:
-        if not os.path.exists(json_file):
+        if pipeline is None:
+            pipeline = IndexerPipeline(json_file)
+        
+        data = pipeline.load()
+        if data is None:
             print(f"⚠ {json_file} not found, no indexers to display")
             return []
         
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
         indexers = data.get("indexers", [])
         
         # Load ENS data from cache
@@ -1151,7 +1466,7 @@ def renderIndexerTable(json_file: str = 'active_indexers.json') -> List[dict]:
             
             all_indexers.append(indexer_with_ens)
         
-        print(f"✓ Loaded {len(all_indexers)} indexers from {json_file}")
+        print(f"✓ Loaded {len(all_indexers)} indexers for the table")
         print(f"  - Eligible: {eligible_count}")
         print(f"  - Grace: {grace_count}")
         print(f"  - Ineligible: {ineligible_count}")
@@ -1162,14 +1477,166 @@ def renderIndexerTable(json_file: str = 'active_indexers.json') -> List[dict]:
         return []
 
 
-def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: str, api_key: Optional[str] = None, rpc_endpoint: Optional[str] = None) -> str:
+# Status order of the table: eligible (0), grace (1), ineligible (2), anything else last
+STATUS_PRIORITY = {"eligible": 0, "grace": 1, "ineligible": 2}
+
+
+def _text(value) -> str:
+    """Return a field as a string for the page data (None becomes an empty string)."""
+    return "" if value is None else str(value)
+
+
+def build_indexer_data(all_indexers: List[dict], eligibility_period: Optional[int] = None) -> dict:
+    """
+    Build the page data: the displayed fields of every indexer, sorted by status, then by
+    ENS name (empty ENS last), plus the counters shown above the table.
+    
+    Indexer entries use the field names of active_indexers.json, with the ENS name added.
+    Nothing in it depends on the time of the run, so its hash only changes with the indexers.
+    
+    Args:
+        all_indexers: Indexers as returned by renderIndexerTable()
+        eligibility_period: Eligibility period in seconds from the contract (optional)
+        
+    Returns:
+        Page data, ready to serialize
+    """
+    def sort_key(indexer):
+        ens_name = indexer.get("ens_name", "")
+        return (STATUS_PRIORITY.get(indexer.get("status", "ineligible"), 3), ens_name.lower() if ens_name else "zzzzzzzzz")
+    
+    entries = []
+    counts = {"eligible": 0, "grace": 0, "ineligible": 0}
+    for indexer in sorted(all_indexers, key=sort_key):
+        status = indexer.get("status", "ineligible")
+        if status in counts:
+            counts[status] += 1
+        entries.append({
+            "address": _text(indexer.get("address", "")),
+            "ens_name": _text(indexer.get("ens_name", "")),
+            "status": _text(status),
+            "eligibility_renewal_time_short": _text(indexer.get("eligibility_renewal_time_short", "Never")),
+            "eligibility_renewal_time_readable": _text(indexer.get("eligibility_renewal_time_readable", "Never")),
+            "eligible_until_short": _text(indexer.get("eligible_until_short", "")),
+            "eligible_until_readable": _text(indexer.get("eligible_until_readable", "")),
+            "last_renewed_on_tx": _text(indexer.get("last_renewed_on_tx", "")),
+        })
+    
+    return {
+        "metadata": {
+            "total_count": len(entries),
+            "eligible_count": counts["eligible"],
+            "grace_count": counts["grace"],
+            "ineligible_count": counts["ineligible"],
+            "eligibility_period": eligibility_period,
+        },
+        "indexers": entries,
+    }
+
+
+def write_fingerprinted_file(content: bytes, prefix: str, extension: str, output_dir: str = '.') -> str:
+    """
+    Write content to <prefix>.<content hash>.<extension>, a name browsers can cache for good.
+    
+    The file is only written when its content changed. Older files of the same prefix and
+    extension are removed, keeping the FINGERPRINTED_FILES_KEPT most recent ones.
+    
+    Args:
+        content: File content
+        prefix: Start of the file name (e.g. 'indexers')
+        extension: File extension without the dot (e.g. 'json')
+        output_dir: Directory of index.html
+        
+    Returns:
+        File name, relative to output_dir
+    """
+    digest = hashlib.sha256(content).hexdigest()[:16]
+    file_name = f"{prefix}.{digest}.{extension}"
+    path = os.path.join(output_dir, file_name)
+    
+    if os.path.exists(path):
+        # Same content as an earlier run; mark it as the most recent file of its kind
+        os.utime(path)
+        print(f"✓ {file_name} unchanged")
+    else:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+        print(f"✓ Wrote {file_name} ({len(content)} bytes)")
+    
+    # Remove the files of older runs
+    old_files = [
+        name for name in os.listdir(output_dir)
+        if name.startswith(f"{prefix}.") and name.endswith(f".{extension}") and len(name) == len(file_name)
+    ]
+    old_files.sort(key=lambda name: os.path.getmtime(os.path.join(output_dir, name)), reverse=True)
+    for old_name in old_files[FINGERPRINTED_FILES_KEPT:]:
+        if old_name != file_name:
+            os.remove(os.path.join(output_dir, old_name))
+    
+    return file_name
+
+
+def write_data_file(data: dict, output_dir: str = '.') -> str:
+    """
+    Write the page data to a content-hashed file (indexers.<hash>.json).
+    
+    Args:
+        data: Page data from build_indexer_data()
+        output_dir: Directory of index.html
+        
+    Returns:
+        File name of the data file, relative to output_dir
+    """
+    return write_fingerprinted_file(serialization.dumps(data, pretty=False), DATA_FILE_PREFIX, 'json', output_dir)
+
+
+def write_status_file(retrieved: str, output_dir: str = '.') -> None:
+    """
+    Write the time of this run to STATUS_FILE, which the page loads without caching.
+    
+    Args:
+        retrieved: Time of this run, shown as the last update
+        output_dir: Directory of index.html
+    """
+    path = os.path.join(output_dir, STATUS_FILE)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(serialization.dumps({"retrieved": retrieved}, pretty=False))
+    os.replace(tmp_path, path)
+
+
+def write_asset(name: str, output_dir: str = '.', template_dir: str = template_engine.DEFAULT_TEMPLATE_DIR) -> str:
     """
-    Generate the HTML dashboard content.
+    Publish a static asset of the page (e.g. templates/app.css) as app.<hash>.css.
+    
+    Args:
+        name: File name of the asset in template_dir
+        output_dir: Directory of index.html
+        template_dir: Directory of the templates and assets
+        
+    Returns:
+        File name of the published asset, relative to output_dir
+    """
+    with open(os.path.join(template_dir, name), 'rb') as f:
+        content = f.read()
+    prefix, extension = os.path.splitext(name)
+    return write_fingerprinted_file(content, prefix, extension[1:], output_dir)
+
+
+def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: str, api_key: Optional[str] = None, rpc_endpoint: Optional[str] = None, block: str = 'latest', pipeline: Optional[IndexerPipeline] = None, output_dir: str = '.') -> str:
+    """
+    Generate the HTML dashboard content and write its data file and assets.
     
     Args:
         indexers: List of (address, ens_name) tuples (legacy parameter, not used)
         contract_address: The Sepolia contract address
         api_key: Arbiscan API key
+        rpc_endpoint: RPC endpoint URL
+        block: Block tag or hex block number to read contract values at
+        pipeline: Pipeline carrying the indexer set in memory (optional)
+        output_dir: Directory index.html is written to; the data file and assets are written next to it
         
     Returns:
         Complete HTML content as string
@@ -1178,7 +1645,7 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     
     # Load all indexers from JSON file
     print("Loading indexers for dashboard...")
-    all_indexers = renderIndexerTable()
+    all_indexers = renderIndexerTable(pipeline=pipeline)
     
     # Fetch last transaction data
     print("Fetching last transaction data...")
@@ -1188,6 +1655,11 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     if api_key:
         last_transaction = get_last_transaction(contract_address, api_key)
     
+    # Fallback: locate the last oracle update via RPC
+    if not last_transaction and rpc_endpoint:
+        print("⚠ Warning: Could not fetch transaction data from API, searching via RPC")
+        last_transaction = get_last_transaction_via_rpc(contract_address, rpc_endpoint, block=block)
+    
     # Fallback: load from local JSON file (cached data)
     if not last_transaction:
         print("⚠ Warning: Could not fetch fresh transaction data from API, using cached data")
@@ -1201,1360 +1673,32 @@ def generate_html_dashboard(indexers: List[Tuple[str, str]], contract_address: s
     print("Fetching oracle update time from contract...")
     oracle_update_time: Optional[int] = None
     if rpc_endpoint:
-        oracle_update_time = get_oracle_update_time(contract_address, rpc_endpoint)
+        oracle_update_time = get_oracle_update_time(contract_address, rpc_endpoint, block=block)
     
     # Fetch eligibility period from contract
     print("Fetching eligibility period from contract...")
     eligibility_period: Optional[int] = None
     if rpc_endpoint:
-        eligibility_period = get_eligibility_period(contract_address, rpc_endpoint)
-    
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Eligibility Dashboard</title>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Poppins', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #0C0A1D;
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        
-        .breadcrumb {{
-            max-width: 1200px;
-            margin: 0 auto 15px auto;
-            padding: 12px 20px;
-            background: rgba(12, 10, 29, 0.6);
-            border-radius: 8px;
-            border: 1px solid #9CA3AF;
-            color: #F8F6FF;
-            font-size: 14px;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .breadcrumb a {{
-            color: #9CA3AF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-        }}
-        
-        .breadcrumb a:hover {{
-            color: #F8F6FF;
-        }}
-        
-        .breadcrumb-separator {{
-            color: #9CA3AF;
-            margin: 0 4px;
-            font-weight: 300;
-        }}
-        
-        .home-icon {{
-            width: 16px;
-            height: 16px;
-            display: inline-block;
-            position: relative;
-        }}
-        
-        .home-icon::before {{
-            content: '';
-            position: absolute;
-            left: 50%;
-            top: 0;
-            transform: translateX(-50%);
-            width: 0;
-            height: 0;
-            border-left: 8px solid transparent;
-            border-right: 8px solid transparent;
-            border-bottom: 8px solid currentColor;
-        }}
-        
-        .home-icon::after {{
-            content: '';
-            position: absolute;
-            left: 2px;
-            bottom: 0;
-            width: 12px;
-            height: 9px;
-            background-color: currentColor;
-        }}
-        
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: #0C0A1D;
-            border-radius: 15px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-            overflow: hidden;
-            border: 1px solid #9CA3AF;
-        }}
-        
-        .header {{
-            background: #0C0A1D;
-            color: #F8F6FF;
-            padding: 30px;
-            border-bottom: 1px solid #9CA3AF;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }}
-        
-        .title-container {{
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }}
-        
-        .header-icon {{
-            width: 50px;
-            height: 50px;
-            object-fit: contain;
-        }}
-        
-        .header h1 {{
-            font-size: 2.2em;
-            margin: 0;
-            font-weight: 300;
-        }}
-        
-        .header .subtitle {{
-            font-size: 0.95em;
-            opacity: 0.9;
-            font-weight: 300;
-            white-space: nowrap;
-        }}
-        
-        .search-container {{
-            padding: 25px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-        
-        .search-wrapper {{
-            flex: 0 0 45%;
-            min-width: 300px;
-            max-width: 500px;
-        }}
-        
-        .search-box {{
-            width: 100%;
-            padding: 15px 20px;
-            border: 2px solid #9CA3AF;
-            border-radius: 25px;
-            font-size: 16px;
-            outline: none;
-            transition: all 0.3s ease;
-            background: #0C0A1D;
-            color: #F8F6FF;
-        }}
-        
-        .search-box:focus {{
-            border-color: #F8F6FF;
-            box-shadow: 0 0 0 3px rgba(248, 246, 255, 0.1);
-        }}
-        
-        .search-box::placeholder {{
-            color: #9CA3AF;
-        }}
-        
-        .filter-wrapper {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            flex-wrap: wrap;
-        }}
-        
-        .legend {{
-            padding: 20px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-        }}
-        
-        .legend-title {{
-            color: #F8F6FF;
-            font-size: 14px;
-            font-weight: 600;
-            margin-bottom: 10px;
-            text-align: center;
-        }}
-        
-        .legend-items {{
-            display: flex;
-            gap: 20px;
-            flex-wrap: wrap;
-            justify-content: center;
-        }}
-        
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-size: 13px;
-        }}
-        
-        .legend-badge {{
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-weight: 500;
-            font-size: 11px;
-        }}
-        
-        .legend-badge.good {{
-            background: rgba(34, 197, 94, 0.2);
-            color: #22c55e;
-            border: 1px solid #22c55e;
-        }}
-        
-        .legend-badge.grace {{
-            background: rgba(251, 191, 36, 0.2);
-            color: #fbbf24;
-            border: 1px solid #fbbf24;
-        }}
-        
-        .legend-badge.ineligible {{
-            background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-            border: 1px solid #ef4444;
-        }}
-        
-        .legend-description {{
-            color: #9CA3AF;
-        }}
-        
-        .gip-banner {{
-            padding: 15px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-            text-align: center;
-            font-size: 14px;
-            color: #9CA3AF;
-        }}
-        
-        .gip-banner a {{
-            color: #9CA3AF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }}
-        
-        .gip-banner a:hover {{
-            color: #F8F6FF;
-            text-decoration: underline;
-        }}
-        
-        .counters-section {{
-            padding: 25px 30px;
-            background: #0C0A1D;
-            border-bottom: 1px solid #9CA3AF;
-            display: flex;
-            justify-content: space-around;
-            align-items: center;
-            flex-wrap: wrap;
-            gap: 20px;
-        }}
-        
-        .counter-item {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: 8px;
-        }}
-        
-        .counter-label {{
-            color: #9CA3AF;
-            font-size: 14px;
-            font-weight: 500;
-            text-align: center;
-        }}
-        
-        .counter-value {{
-            color: #F8F6FF;
-            font-size: 32px;
-            font-weight: 600;
-            text-align: center;
-        }}
-        
-        .counter-value.eligible-count {{
-            color: #22c55e;
-        }}
-        
-        .counter-value.grace-count {{
-            color: #eab308;
-        }}
-        
-        .counter-value.ineligible-count {{
-            color: #ef4444;
-        }}
-        
-        .filter-label {{
-            color: #9CA3AF;
-            font-size: 14px;
-            font-weight: 500;
-            margin-right: 5px;
-        }}
-        
-        .filter-btn {{
-            padding: 6px 14px;
-            border-radius: 12px;
-            font-weight: 500;
-            font-size: 12px;
-            border: none;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            position: relative;
-        }}
-        
-        .filter-btn:hover {{
-            opacity: 0.8;
-            transform: translateY(-1px);
-        }}
-        
-        .filter-btn[data-tooltip]::after {{
-            content: attr(data-tooltip);
-            position: absolute;
-            bottom: 100%;
-            left: 50%;
-            transform: translateX(-50%);
-            margin-bottom: 8px;
-            padding: 8px 12px;
-            background: #1a1825;
-            color: #F8F6FF;
-            font-size: 12px;
-            font-weight: 400;
-            white-space: nowrap;
-            border-radius: 6px;
-            opacity: 0;
-            pointer-events: none;
-            transition: opacity 0.2s ease;
-            border: 1px solid #9CA3AF;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-            z-index: 1000;
-        }}
-        
-        .filter-btn[data-tooltip]:hover::after {{
-            opacity: 1;
-        }}
-        
-        .filter-btn[data-tooltip]::before {{
-            content: '';
-            position: absolute;
-            bottom: 100%;
-            left: 50%;
-            transform: translateX(-50%);
-            margin-bottom: 2px;
-            border: 6px solid transparent;
-            border-top-color: #9CA3AF;
-            opacity: 0;
-            pointer-events: none;
-            transition: opacity 0.2s ease;
-            z-index: 1000;
-        }}
-        
-        .filter-btn[data-tooltip]:hover::before {{
-            opacity: 1;
-        }}
-        
-        .filter-btn.eligible {{
-            background: rgba(34, 197, 94, 0.2);
-            color: #22c55e;
-            border: 1px solid #22c55e;
-        }}
-        
-        .filter-btn.eligible.active {{
-            background: #22c55e;
-            color: #0C0A1D;
-        }}
-        
-        .filter-btn.grace {{
-            background: rgba(251, 191, 36, 0.2);
-            color: #fbbf24;
-            border: 1px solid #fbbf24;
-        }}
-        
-        .filter-btn.grace.active {{
-            background: #fbbf24;
-            color: #0C0A1D;
-        }}
-        
-        .filter-btn.ineligible {{
-            background: rgba(239, 68, 68, 0.2);
-            color: #ef4444;
-            border: 1px solid #ef4444;
-        }}
-        
-        .filter-btn.ineligible.active {{
-            background: #ef4444;
-            color: #0C0A1D;
-        }}
-        
-        .filter-btn.reset {{
-            background: rgba(156, 163, 175, 0.2);
-            color: #9CA3AF;
-            border: 1px solid #9CA3AF;
-        }}
-        
-        .filter-btn.reset:hover {{
-            background: rgba(156, 163, 175, 0.3);
-        }}
-        
-        .table-container {{
-            padding: 0 30px 30px;
-            overflow-x: auto;
-        }}
-        
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-            background: #0C0A1D;
-            border-radius: 10px;
-            overflow: hidden;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.3);
-            border: 1px solid #9CA3AF;
-        }}
-        
-        th {{
-            background: #0C0A1D;
-            color: #9CA3AF;
-            padding: 20px 15px;
-            text-align: left;
-            font-weight: 600;
-            font-size: 14px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            cursor: pointer;
-            user-select: none;
-            position: relative;
-            border-bottom: 1px solid #9CA3AF;
-        }}
-        
-        th:hover {{
-            background: #1a1825;
-        }}
-        
-        th.sortable::after {{
-            content: ' ↕';
-            opacity: 0.5;
-            font-size: 12px;
-        }}
-        
-        th.sort-asc::after {{
-            content: ' ↑';
-            opacity: 1;
-        }}
-        
-        th.sort-desc::after {{
-            content: ' ↓';
-            opacity: 1;
-        }}
-        
-        td {{
-            padding: 18px 15px;
-            border-bottom: 1px solid #9CA3AF;
-            font-size: 14px;
-            color: #F8F6FF;
-        }}
-        
-        /* Date hover tooltip styles */
-        .date-hover {{
-            position: relative;
-            cursor: help;
-        }}
-        
-        .date-hover[data-full-date]:hover::after {{
-            content: attr(data-full-date);
-            position: absolute;
-            bottom: 100%;
-            left: 50%;
-            transform: translateX(-50%);
-            margin-bottom: 8px;
-            padding: 8px 12px;
-            background: #1a1825;
-            color: #F8F6FF;
-            font-size: 12px;
-            font-weight: 400;
-            white-space: nowrap;
-            border-radius: 6px;
-            border: 1px solid #9CA3AF;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);
-            z-index: 1000;
-            pointer-events: none;
-        }}
-        
-        .date-hover[data-full-date]:hover::before {{
-            content: '';
-            position: absolute;
-            bottom: 100%;
-            left: 50%;
-            transform: translateX(-50%);
-            margin-bottom: 2px;
-            border: 6px solid transparent;
-            border-top-color: #9CA3AF;
-            z-index: 1000;
-            pointer-events: none;
-        }}
-        
-        tr:hover {{
-            background-color: #1a1825;
-        }}
-        
-        tr:nth-child(even) {{
-            background-color: #0C0A1D;
-        }}
-        
-        tr:nth-child(even):hover {{
-            background-color: #1a1825;
-        }}
-        
-        .address {{
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            color: #F8F6FF;
-            word-break: break-all;
-        }}
-        
-        .address-link {{
-            text-decoration: none;
-            transition: opacity 0.3s ease;
-            display: inline-flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .address-link:hover .address {{
-            color: #9CA3AF;
-        }}
-        
-        .external-link-icon {{
-            width: 12px;
-            height: 12px;
-            opacity: 0.8;
-            transition: opacity 0.3s ease;
-            color: #9CA3AF;
-        }}
-        
-        .address-link:hover .external-link-icon {{
-            opacity: 1;
-        }}
-        
-        .ens-name {{
-            color: #F8F6FF;
-            font-weight: 500;
-        }}
-        
-        .empty-ens {{
-            color: #9CA3AF;
-            font-style: italic;
-        }}
-        
-        .stats {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 20px 30px;
-            background: #0C0A1D;
-            border-top: 1px solid #9CA3AF;
-            font-size: 14px;
-            color: #F8F6FF;
-        }}
-        
-        .total-count {{
-            font-weight: 600;
-            color: #F8F6FF;
-        }}
-        
-        .filtered-count {{
-            color: #F8F6FF;
-        }}
-        
-        .contract-info {{
-            background: #0C0A1D;
-            border-top: 1px solid #9CA3AF;
-        }}
-        
-        .contract-info-header {{
-            padding: 25px 30px;
-            cursor: pointer;
-            user-select: none;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            transition: background 0.3s ease;
-        }}
-        
-        .contract-info-header:hover {{
-            background: #1a1825;
-        }}
-        
-        .contract-info h3 {{
-            color: #F8F6FF;
-            font-size: 1.3em;
-            margin: 0;
-            font-weight: 500;
-        }}
-        
-        .contract-info-arrow {{
-            width: 20px;
-            height: 20px;
-            transition: transform 0.3s ease;
-            color: #9CA3AF;
-        }}
-        
-        .contract-info-arrow.expanded {{
-            transform: rotate(180deg);
-        }}
-        
-        .contract-info-content {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease;
-            padding: 0 30px;
-        }}
-        
-        .contract-info-content.expanded {{
-            max-height: 1000px;
-            padding: 0 30px 25px 30px;
-        }}
-        
-        .info-item {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 10px 0;
-            border-bottom: 1px solid #9CA3AF;
-        }}
-        
-        .info-item:last-child {{
-            border-bottom: none;
-        }}
-        
-        .info-label {{
-            color: #9CA3AF;
-            font-weight: 500;
-            font-size: 14px;
-        }}
-        
-        .info-value {{
-            color: #F8F6FF;
-            font-family: 'Courier New', monospace;
-            font-size: 13px;
-            word-break: break-all;
-            text-align: right;
-            max-width: 60%;
-        }}
-        
-        .transaction-hash {{
-            color: #F8F6FF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-            display: inline-flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        
-        .transaction-hash:hover {{
-            color: #9CA3AF;
-        }}
-        
-        .transaction-hash:hover .external-link-icon {{
-            opacity: 1;
-        }}
-        
-        .error-message {{
-            color: #9CA3AF;
-            font-style: italic;
-        }}
-        
-        .footer {{
-            padding: 20px 30px;
-            background: #0C0A1D;
-            color: #9CA3AF;
-            font-size: 14px;
-            margin-top: 0;
-        }}
-        
-        .footer-content {{
-            max-width: 1140px;
-            margin: 0 auto;
-        }}
-        
-        .footer-top {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 12px;
-            flex-wrap: wrap;
-            gap: 10px;
-        }}
-        
-        .footer-left {{
-            text-align: left;
-            flex: 0 0 auto;
-        }}
-        
-        .footer-right {{
-            text-align: right;
-            flex: 0 0 auto;
-        }}
-        
-        .footer a {{
-            color: #9CA3AF;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }}
-        
-        .footer a:hover {{
-            color: #F8F6FF;
-            text-decoration: underline;
-        }}
-        
-        .version {{
-            font-weight: 600;
-            color: #9CA3AF;
-        }}
-        
-        .footer-separator {{
-            color: #9CA3AF;
-        }}
-        
-        .github-icon {{
-            display: inline-block;
-            width: 16px;
-            height: 16px;
-            vertical-align: middle;
-            margin-right: 5px;
-        }}
-        
-        .bell-icon {{
-            fill: #F8F6FF;
-            width: 16px;
-            height: 16px;
-            vertical-align: middle;
-            margin-right: 5px;
-        }}
-        
-        @media (max-width: 768px) {{
-            .container {{
-                margin: 10px;
-                border-radius: 10px;
-            }}
-            
-            .header {{
-                padding: 20px;
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 15px;
-            }}
-            
-            .title-container {{
-                gap: 10px;
-            }}
-            
-            .header-icon {{
-                width: 40px;
-                height: 40px;
-            }}
-            
-            .header h1 {{
-                font-size: 1.8em;
-            }}
-            
-            .search-container, .table-container {{
-                padding: 20px;
-            }}
-            
-            .footer-top {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 12px;
-            }}
-            
-            .footer-left,
-            .footer-right {{
-                text-align: left;
-                width: 100%;
-            }}
-            
-            .counters-section {{
-                flex-direction: column;
-                padding: 20px;
-            }}
-            
-            .stats {{
-                flex-direction: column;
-                gap: 10px;
-                text-align: center;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="breadcrumb">
-        <a href="../index.html">
-            <span class="home-icon"></span>
-            <b>Home</b>
-        </a>
-        <span class="breadcrumb-separator">>></span>
-        <span>REO Eligibility Dashboard</span>
-    </div>
-    
-    <div class="container">
-        <div class="header">
-            <div class="title-container">
-                <img src="grt.png" alt="GRT" class="header-icon">
-                <h1>Eligibility Dashboard</h1>
-            </div>
-            <div class="subtitle">Last Update: {current_time}</div>
-        </div>"""
-    
-    # Calculate counters
-    total_indexers = len(all_indexers)
-    eligible_count = sum(1 for indexer in all_indexers if indexer.get("status") == "eligible")
-    grace_count = sum(1 for indexer in all_indexers if indexer.get("status") == "grace")
-    ineligible_count = sum(1 for indexer in all_indexers if indexer.get("status") == "ineligible")
-    
-    html_content += f"""
-        
-        <div class="gip-banner">
-            This dashboard is based on the <a href="https://forum.thegraph.com/t/gip-0079-indexer-rewards-eligibility-oracle/6734" target="_blank">GIP-0079: Indexer Rewards Eligibility Oracle</a>
-        </div>
-        
-        <div class="counters-section">
-            <div class="counter-item">
-                <span class="counter-label">Active Indexers:</span>
-                <span class="counter-value">{total_indexers}</span>
-            </div>
-            <div class="counter-item">
-                <span class="counter-label">Eligible Indexers:</span>
-                <span class="counter-value eligible-count">{eligible_count}</span>
-            </div>
-            <div class="counter-item">
-                <span class="counter-label">In Grace Period:</span>
-                <span class="counter-value grace-count">{grace_count}</span>
-            </div>
-            <div class="counter-item">
-                <span class="counter-label">Ineligible Indexers:</span>
-                <span class="counter-value ineligible-count">{ineligible_count}</span>
-            </div>
-        </div>
-        
-        <div class="search-container">
-            <div class="search-wrapper">
-                <input type="text" 
-                       class="search-box" 
-                       id="searchInput" 
-                       placeholder="Search by indexer address or ENS name..."
-                       autocomplete="off">
-            </div>
-            <div class="filter-wrapper">
-                <span class="filter-label">Filter by Status:</span>
-                <button class="filter-btn eligible" onclick="filterByStatus('eligible')" data-tooltip="Indexers that are eligible for rewards">eligible</button>"""
-    
-    # Add grace period tooltip if eligibility_period is available
-    grace_tooltip = ""
-    if eligibility_period:
-        days = int(eligibility_period / 86400)
-        grace_tooltip = f' data-tooltip="Grace period is {days} days"'
-    
-    html_content += f"""
-                <button class="filter-btn grace" onclick="filterByStatus('grace')"{grace_tooltip}>grace</button>
-                <button class="filter-btn ineligible" onclick="filterByStatus('ineligible')" data-tooltip="Indexers that are NOT eligible for rewards">ineligible</button>
-                <button class="filter-btn reset" onclick="resetFilter()" data-tooltip="Show All">Reset</button>
-            </div>
-        </div>
-        
-        <div class="table-container">
-            <table id="indexersTable">
-                <thead>
-                    <tr>
-                        <th class="sortable" data-column="0">Indexer Address</th>
-                        <th class="sortable" data-column="1">ENS Name</th>
-                        <th class="sortable" data-column="2">Status</th>
-                        <th class="sortable" data-column="3">Last Renewed</th>
-                        <th class="sortable" data-column="4">Eligible Until</th>
-                    </tr>
-                </thead>
-                <tbody id="tableBody">
-"""
-
-    # Sort indexers: first by status (eligible, grace, ineligible), then by ENS name
-    def sort_key(indexer):
-        status = indexer.get("status", "ineligible")
-        ens_name = indexer.get("ens_name", "")
-        # Status order: eligible (0), grace (1), ineligible (2), then by ENS (empty ENS last)
-        status_priority = {"eligible": 0, "grace": 1, "ineligible": 2}
-        return (status_priority.get(status, 3), ens_name.lower() if ens_name else "zzzzzzzzz")
-    
-    all_indexers_sorted = sorted(all_indexers, key=sort_key)
-
-    # Add table rows from sorted indexers
-    for i, indexer in enumerate(all_indexers_sorted, 1):
-        address = indexer.get("address", "")
-        ens_name = indexer.get("ens_name", "")
-        is_eligible = indexer.get("is_eligible", False)
-        ens_display = ens_name if ens_name else "No ENS"
-        ens_class = "ens-name" if ens_name else "empty-ens"
-        explorer_url = f"https://thegraph.com/explorer/profile/{address}?view=Indexing&chain=arbitrum-one"
-        
-        # Get date formats
-        eligibility_renewal_time_short = indexer.get("eligibility_renewal_time_short", "Never")
-        eligibility_renewal_time_readable = indexer.get("eligibility_renewal_time_readable", "Never")
-        eligible_until_short = indexer.get("eligible_until_short", "")
-        eligible_until_readable = indexer.get("eligible_until_readable", "")
-        last_renewed_on_tx = indexer.get("last_renewed_on_tx", "")
-        
-        # Set status badge based on eligibility
-        if is_eligible:
-            status_badge = '<span class="legend-badge good">eligible</span>'
-        else:
-            status_badge = '<span class="legend-badge ineligible">ineligible</span>'
-        
-        # Format Last Renewed cell with transaction link (no tooltip)
-        if eligibility_renewal_time_short == "Never":
-            last_renewed_cell = eligibility_renewal_time_short
-        else:
-            # If we have a transaction hash, make the date a link with external icon
-            if last_renewed_on_tx:
-                last_renewed_cell = f'<a href="https://sepolia.arbiscan.io/tx/{last_renewed_on_tx}" target="_blank" class="transaction-hash">{eligibility_renewal_time_short}<svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg></a>'
-            else:
-                last_renewed_cell = eligibility_renewal_time_short
-        
-        # Format Eligible Until cell with hover tooltip
-        if eligible_until_short:
-            eligible_until_cell = f'<span class="date-hover" data-full-date="{eligible_until_readable}">{eligible_until_short}</span>'
-        else:
-            eligible_until_cell = ""
-        
-        html_content += f"""                    <tr>
-                        <td><a href="{explorer_url}" target="_blank" class="address-link"><span class="address">{address}</span><svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg></a></td>
-                        <td><span class="{ens_class}">{ens_display}</span></td>
-                        <td>{status_badge}</td>
-                        <td>{last_renewed_cell}</td>
-                        <td>{eligible_until_cell}</td>
-                    </tr>
-"""
-
-    html_content += """                </tbody>
-            </table>
-        </div>
-        
-        <div class="stats">
-            <div class="total-count">Total Indexers: <span id="totalCount">""" + str(len(all_indexers)) + """</span></div>
-            <div class="filtered-count">Showing: <span id="filteredCount">""" + str(len(all_indexers)) + """</span></div>
-        </div>
-    </div>
-
-    <script>
-        // Table data
-        const originalData = [
-"""
-
-    # Sort indexers: first by status (eligible, grace, ineligible), then by ENS name
-    def sort_key(indexer):
-        status = indexer.get("status", "ineligible")
-        ens_name = indexer.get("ens_name", "")
-        # Status order: eligible (0), grace (1), ineligible (2), then by ENS (empty ENS last)
-        status_priority = {"eligible": 0, "grace": 1, "ineligible": 2}
-        return (status_priority.get(status, 3), ens_name.lower() if ens_name else "zzzzzzzzz")
+        eligibility_period = get_eligibility_period(contract_address, rpc_endpoint, block=block)
     
-    all_indexers_sorted = sorted(all_indexers, key=sort_key)
-
-    # Add JavaScript data from all indexers
-    for indexer in all_indexers_sorted:
-        address = indexer.get("address", "")
-        ens_name = indexer.get("ens_name", "")
-        status = indexer.get("status", "ineligible")
-        eligibility_renewal_time_short = indexer.get("eligibility_renewal_time_short", "Never")
-        eligibility_renewal_time_readable = indexer.get("eligibility_renewal_time_readable", "Never")
-        eligible_until_short = indexer.get("eligible_until_short", "")
-        eligible_until_readable = indexer.get("eligible_until_readable", "")
-        last_renewed_on_tx = indexer.get("last_renewed_on_tx", "")
-        
-        # Set status badge based on status
-        if status == "eligible":
-            status_badge = '<span class="legend-badge good">eligible</span>'
-        elif status == "grace":
-            status_badge = '<span class="legend-badge grace">grace</span>'
-        else:
-            status_badge = '<span class="legend-badge ineligible">ineligible</span>'
-        
-        html_content += f"""            ["{address}", "{ens_name}", '{status_badge}', "{eligibility_renewal_time_short}", "{eligibility_renewal_time_readable}", "{eligible_until_short}", "{eligible_until_readable}", "{status}", "{last_renewed_on_tx}"],
-"""
-
-    html_content += """        ];
-        
-        let currentData = [...originalData];
-        let sortColumn = -1;
-        let sortDirection = 'asc';
-        let activeFilter = null;
-        
-        // Search functionality
-        const searchInput = document.getElementById('searchInput');
-        const tableBody = document.getElementById('tableBody');
-        const totalCount = document.getElementById('totalCount');
-        const filteredCount = document.getElementById('filteredCount');
-        
-        // Apply both search and filter
-        function applyFilters() {
-            const searchTerm = searchInput.value.toLowerCase();
-            
-            currentData = originalData.filter(row => {
-                // Check search term
-                const matchesSearch = row[0].toLowerCase().includes(searchTerm) || 
-                                     row[1].toLowerCase().includes(searchTerm);
-                
-                // Check status filter (row[7] is the status string)
-                const matchesFilter = !activeFilter || row[7] === activeFilter;
-                
-                return matchesSearch && matchesFilter;
-            });
-            
-            renderTable();
-            updateStats();
-        }
-        
-        searchInput.addEventListener('input', applyFilters);
-        
-        // Filter by status functionality
-        function filterByStatus(status) {
-            // Toggle filter
-            if (activeFilter === status) {
-                activeFilter = null;
-                // Remove active class from all buttons
-                document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-            } else {
-                activeFilter = status;
-                // Remove active class from all buttons
-                document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-                // Add active class to clicked button
-                document.querySelector(`.filter-btn.${status}`).classList.add('active');
-            }
-            
-            applyFilters();
-        }
-        
-        // Reset filter
-        function resetFilter() {
-            activeFilter = null;
-            searchInput.value = '';
-            // Remove active class from all buttons
-            document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
-            applyFilters();
-        }
-        
-        // Sorting functionality
-        function sortTable(column) {
-            if (sortColumn === column) {
-                sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
-            } else {
-                sortColumn = column;
-                sortDirection = 'asc';
-            }
-            
-            // Special handling when sorting by ENS name column (index 1)
-            if (column === 1) {
-                // Separate rows with ENS from rows without ENS
-                const withENS = [];
-                const withoutENS = [];
-                
-                currentData.forEach(row => {
-                    const ens = row[1].toLowerCase();
-                    if (ens === '' || ens === 'no ens') {
-                        withoutENS.push(row);
-                    } else {
-                        withENS.push(row);
-                    }
-                });
-                
-                // Sort only the rows with ENS
-                withENS.sort((a, b) => {
-                    const aENS = a[1].toLowerCase();
-                    const bENS = b[1].toLowerCase();
-                    
-                    if (aENS < bENS) return sortDirection === 'asc' ? -1 : 1;
-                    if (aENS > bENS) return sortDirection === 'asc' ? 1 : -1;
-                    return 0;
-                });
-                
-                // Combine: sorted ENS rows + unsorted no-ENS rows at the end
-                if (sortDirection === 'asc') {
-                    currentData = [...withENS, ...withoutENS];
-                } else {
-                    // In descending order, put no-ENS at beginning
-                    currentData = [...withoutENS, ...withENS];
-                }
-                
-                renderTable();
-                updateSortHeaders();
-                return;
-            }
-            
-            // For all other columns, use regular sort
-            currentData.sort((a, b) => {
-                // Special handling when sorting by status column (index 2)
-                if (column === 2) {
-                    // Use the plain text status (row[7]) for sorting
-                    const aStatus = a[7].toLowerCase();
-                    const bStatus = b[7].toLowerCase();
-                    
-                    if (aStatus < bStatus) return sortDirection === 'asc' ? -1 : 1;
-                    if (aStatus > bStatus) return sortDirection === 'asc' ? 1 : -1;
-                    return 0;
-                }
-                
-                // For other columns, always maintain status priority first
-                // Status order: eligible (0), grace (1), ineligible (2)
-                const getStatusPriority = (statusString) => {
-                    if (statusString === 'eligible') return 0;
-                    if (statusString === 'grace') return 1;
-                    if (statusString === 'ineligible') return 2;
-                    return 3;
-                };
-                
-                const aStatusPriority = getStatusPriority(a[7]);
-                const bStatusPriority = getStatusPriority(b[7]);
-                
-                // If status priority differs, sort by priority
-                if (aStatusPriority !== bStatusPriority) {
-                    return aStatusPriority - bStatusPriority;
-                }
-                
-                // Within same status group, sort by the selected column
-                let aVal = a[column];
-                let bVal = b[column];
-                
-                // All columns are now text, so convert to lowercase for comparison
-                aVal = aVal.toLowerCase();
-                bVal = bVal.toLowerCase();
-                
-                if (aVal < bVal) return sortDirection === 'asc' ? -1 : 1;
-                if (aVal > bVal) return sortDirection === 'asc' ? 1 : -1;
-                return 0;
-            });
-            
-            renderTable();
-            updateSortHeaders();
-        }
-        
-        function renderTable() {
-            tableBody.innerHTML = '';
-            currentData.forEach((row, index) => {
-                const [address, ensName, status, lastRenewedShort, lastRenewedFull, eligibleUntilShort, eligibleUntilFull, statusString, lastRenewedOnTx] = row;
-                const ensDisplay = ensName || 'No ENS';
-                const ensClass = ensName ? 'ens-name' : 'empty-ens';
-                const explorerUrl = `https://thegraph.com/explorer/profile/${address}?view=Indexing&chain=arbitrum-one`;
-                
-                // Format Last Renewed cell with transaction link (no tooltip)
-                let lastRenewedCell;
-                if (lastRenewedShort === 'Never') {
-                    lastRenewedCell = lastRenewedShort;
-                } else {
-                    // If we have a transaction hash, make the date a link with external icon
-                    if (lastRenewedOnTx) {
-                        lastRenewedCell = `<a href="https://sepolia.arbiscan.io/tx/${lastRenewedOnTx}" target="_blank" class="transaction-hash">${lastRenewedShort}<svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg></a>`;
-                } else {
-                    lastRenewedCell = lastRenewedShort;
-                    }
-                }
-                
-                // Format Eligible Until cell with hover tooltip
-                let eligibleUntilCell = '';
-                if (eligibleUntilShort) {
-                    eligibleUntilCell = `<span class="date-hover" data-full-date="${eligibleUntilFull}">${eligibleUntilShort}</span>`;
-                }
-                
-                const rowHTML = `
-                    <tr>
-                        <td><a href="${explorerUrl}" target="_blank" class="address-link"><span class="address">${address}</span><svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg></a></td>
-                        <td><span class="${ensClass}">${ensDisplay}</span></td>
-                        <td>${status}</td>
-                        <td>${lastRenewedCell}</td>
-                        <td>${eligibleUntilCell}</td>
-                    </tr>
-                `;
-                tableBody.innerHTML += rowHTML;
-            });
-        }
-        
-        function updateSortHeaders() {
-            const headers = document.querySelectorAll('th.sortable');
-            headers.forEach((header, index) => {
-                header.className = 'sortable';
-                if (index === sortColumn) {
-                    header.classList.add(sortDirection === 'asc' ? 'sort-asc' : 'sort-desc');
-                }
-            });
-        }
-        
-        function updateStats() {
-            totalCount.textContent = originalData.length;
-            filteredCount.textContent = currentData.length;
-        }
-        
-        // Add click handlers to sortable headers
-        document.querySelectorAll('th.sortable').forEach((header, index) => {
-            header.addEventListener('click', () => sortTable(index));
-        });
-        
-        // Initialize
-        renderTable();
-        updateStats();
-    </script>
-"""
+    # The indexer data and counters go to a separate, content-hashed file the page fetches
+    data = build_indexer_data(all_indexers, eligibility_period)
+    data_file = write_data_file(data, output_dir)
+    write_status_file(current_time, output_dir)
     
-    # Add legend section before footer (commented out - using filter section instead)
-    # html_content += """
-    # <div class="legend">
-    #     <div class="legend-title">Status Legend</div>
-    #     <div class="legend-items">
-    #         <div class="legend-item">
-    #             <span class="legend-badge good">eligible</span>
-    #             <span class="legend-description">Indexer is eligible for rewards</span>
-    #         </div>
-    #         <div class="legend-item">
-    #             <span class="legend-badge grace">grace</span>
-    #             <span class="legend-description">Grace period active (coming soon)</span>
-    #         </div>
-    #         <div class="legend-item">
-    #             <span class="legend-badge ineligible">ineligible</span>
-    #             <span class="legend-description">Indexer is not eligible for rewards</span>
-    #         </div>
-    #     </div>
-    # </div>
-    # """
-    
-    # Add footer with version, GitHub link, and Telegram bot
-    html_content += f"""    
-    <div class="footer">
-        <div class="footer-content">
-            <div class="footer-top">
-                <div class="footer-left">
-                    <svg class="bell-icon" viewBox="0 0 24 24" fill="currentColor"><path d="M12 22c1.1 0 2-.9 2-2h-4c0 1.1.9 2 2 2zm6-6v-5c0-3.07-1.63-5.64-4.5-6.32V4c0-.83-.67-1.5-1.5-1.5s-1.5.67-1.5 1.5v.68C7.64 5.36 6 7.92 6 11v5l-2 2v1h16v-1l-2-2zm-2 1H8v-6c0-2.48 1.51-4.5 4-4.5s4 2.02 4 4.5v6z"/></svg><a href="https://t.me/reo_dashboard_bot" target="_blank">Subscribe to real-time notifications on Telegram</a>
-                </div>
-                <div class="footer-right">
-                    <span class="version">v{VERSION}</span>
-                    <span class="footer-separator">-</span>
-                    <svg class="github-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg><a href="https://github.com/graphprotocol/rewards-eligibility-oracle-dashboard" target="_blank">View repo on GitHub</a>
-                </div>
-            </div>
-        </div>
-    </div>
-    
-    <!-- Contract Information Section - Commented out as requested -->
-    """
+    # CSS and JS are published as fingerprinted files, only rewritten when they change
+    app_css = write_asset('app.css', output_dir)
+    app_js = write_asset('app.js', output_dir)
     
-    # Contract Information Section - Commented out as requested
-    # html_content += f"""
-    # <div class="contract-info">
-    #     <div class="contract-info-header" onclick="toggleContractInfo()">
-    #         <h3>Contract Information (FOR DEBUG ONLY - will be removed in the future)</h3>
-    #         <svg class="contract-info-arrow" id="contractInfoArrow" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-    #             <polyline points="6 9 12 15 18 9"></polyline>
-    #         </svg>
-    #     </div>
-    #     <div class="contract-info-content" id="contractInfoContent">
-    #         <div class="info-item">
-    #             <span class="info-label">Sepolia Contract on Arbitrum:</span>
-    #             <span class="info-value"><a href="https://sepolia.arbiscan.io/address/{contract_address}" target="_blank" class="transaction-hash">{contract_address}</a></span>
-    #         </div>"""
-    # 
-    # # Add oracle update time
-    # if oracle_update_time:
-    #     try:
-    #         oracle_readable_time = datetime.fromtimestamp(oracle_update_time, tz=timezone.utc).strftime("%d %b %Y at %H:%M:%S (UTC)")
-    #         html_content += f"""
-    #     <div class="info-item">
-    #         <span class="info-label">Last Oracle Update Time:</span>
-    #         <span class="info-value">{oracle_readable_time}</span>
-    #     </div>"""
-    #     except Exception as e:
-    #         print(f"Error formatting oracle update time: {e}")
-    #         html_content += """
-    #     <div class="info-item">
-    #         <span class="info-label">Last Oracle Update Time:</span>
-    #         <span class="info-value"><span class="error-message">Error formatting oracle update time</span></span>
-    #     </div>"""
-    # else:
-    #     html_content += """
-    #     <div class="info-item">
-    #         <span class="info-label">Last Oracle Update Time:</span>
-    #         <span class="info-value"><span class="error-message">Unable to fetch oracle update time</span></span>
-    #     </div>"""
-    # 
-    # # Add last transaction data (without transaction time)
-    # if last_transaction:
-    #     tx_hash = last_transaction.get('hash', 'N/A')
-    #     block_number = last_transaction.get('blockNumber', 'N/A')
-    #     
-    #     html_content += f"""
-    #     <div class="info-item">
-    #         <span class="info-label">Last Transaction ID:</span>
-    #         <span class="info-value"><a href="https://sepolia.arbiscan.io/tx/{tx_hash}" target="_blank" class="transaction-hash">{tx_hash}</a></span>
-    #     </div>
-    #     <div class="info-item">
-    #         <span class="info-label">Block Number:</span>
-    #         <span class="info-value">{block_number}</span>
-    #     </div>"""
-    # else:
-    #     html_content += """
-    #     <div class="info-item">
-    #         <span class="info-label">Last Transaction ID:</span>
-    #         <span class="info-value"><span class="error-message">Unable to fetch transaction data</span></span>
-    #     </div>"""
-    # 
-    # # Add eligibility period
-    # if eligibility_period:
-    #     # Convert seconds to days
-    #     days = eligibility_period / 86400
-    #     html_content += f"""
-    #     <div class="info-item">
-    #         <span class="info-label">Eligibility Period:</span>
-    #         <span class="info-value">{eligibility_period} seconds ({days:.1f} days)</span>
-    #     </div>"""
-    # else:
-    #     html_content += """
-    #     <div class="info-item">
-    #         <span class="info-label">Eligibility Period:</span>
-    #         <span class="info-value"><span class="error-message">Unable to fetch eligibility period</span></span>
-    #     </div>"""
-    # 
-    # html_content += """
-    #     </div>
-    # </div>
-    # 
-    # <script>
-    #     function toggleContractInfo() {
-    #         const content = document.getElementById('contractInfoContent');
-    #         const arrow = document.getElementById('contractInfoArrow');
-    #         content.classList.toggle('expanded');
-    #         arrow.classList.toggle('expanded');
-    #     }
-    # </script>
-    # """
-    
-    html_content += """
-</body>
-</html>"""
-
-    return html_content
+    # The page's markup lives in templates/dashboard.html
+    return template_engine.render(
+        DASHBOARD_TEMPLATE,
+        data_file=data_file,
+        status_file=STATUS_FILE,
+        app_css=app_css,
+        app_js=app_js,
+        version=VERSION,
+    )
 
 
 def main():
@@ -2584,14 +1728,55 @@ def main():
     use_cached_ens = os.getenv("USE_CACHED_ENS", "N").upper() == "Y"
     contract_address = os.getenv("CONTRACT_ADDRESS")
     api_key = os.getenv("ARBISCAN_API_KEY")
-    rpc_endpoint = os.getenv("RPC_ENDPOINT")
+    # RPC_ENDPOINTS takes a comma-separated list of interchangeable providers
+    rpc_endpoint = os.getenv("RPC_ENDPOINTS") or os.getenv("RPC_ENDPOINT")
+    rpc_batch_size = int(os.getenv("RPC_BATCH_SIZE", rpc_client.DEFAULT_BATCH_SIZE))
+    use_multicall = os.getenv("USE_MULTICALL", "Y").upper() == "Y"
+    multicall_max_calldata_bytes = int(os.getenv("MULTICALL_MAX_CALLDATA_BYTES", rpc_client.DEFAULT_MULTICALL_MAX_CALLDATA_BYTES))
+    fused_eligibility_fetch = os.getenv("FUSED_ELIGIBILITY_FETCH", "Y").upper() == "Y"
+    rpc_concurrency = int(os.getenv("RPC_CONCURRENCY", rpc_client.DEFAULT_CONCURRENCY))
+    eligibility_source = os.getenv("ELIGIBILITY_SOURCE", "contract").lower()
+    ens_workers = int(os.getenv("ENS_WORKERS", DEFAULT_ENS_WORKERS))
+    ens_ttl_hours = float(os.getenv("ENS_CACHE_TTL_HOURS", DEFAULT_ENS_CACHE_TTL_HOURS))
+    ens_negative_ttl_hours = float(os.getenv("ENS_NEGATIVE_TTL_HOURS", DEFAULT_ENS_NEGATIVE_TTL_HOURS))
+    
+    # Every network call goes through pooled keep-alive sessions (one per host)
+    http_client.configure(
+        pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", http_client.DEFAULT_POOL_MAXSIZE)),
+        rate_limit=float(os.getenv("HTTP_RATE_LIMIT", http_client.DEFAULT_RATE_LIMIT)),
+        max_retries=int(os.getenv("HTTP_MAX_RETRIES", http_client.DEFAULT_MAX_RETRIES)),
+    )
+    rpc_client.configure_endpoints(hedging=os.getenv("RPC_HEDGE", "Y").upper() == "Y")
+    
+    # Keep the run state in an SQLite database instead of the JSON files (opt-in)
+    if state_store.configure(os.getenv("STATE_DB")) is not None:
+        print(f"✓ Using state database {os.getenv('STATE_DB')}")
+    
+    # Pin every contract read of this run to one block, so a run can't straddle an oracle update
+    snapshot_block = None
+    if rpc_endpoint:
+        if os.getenv("SNAPSHOT_BLOCK"):
+            snapshot_block = int(os.getenv("SNAPSHOT_BLOCK"))
+        else:
+            snapshot_block = rpc_client.get_block_number(rpc_endpoint)
+        if snapshot_block is not None:
+            print(f"✓ Pinning contract reads to block {snapshot_block}")
+            rpc_client.load_call_cache()
+        else:
+            print("⚠ Could not resolve snapshot block, contract reads will use 'latest'")
+    block = rpc_client.block_tag(snapshot_block)
     
     # Get transaction hash first (before retrieving active indexers)
     # Always fetch fresh data, don't use cached JSON for initial metadata
     transaction_hash = None
-    if contract_address and api_key:
+    if contract_address and (api_key or rpc_endpoint):
         # Fetch transaction data via Arbiscan API
-        last_transaction = get_last_transaction(contract_address, api_key)
+        last_transaction = get_last_transaction(contract_address, api_key) if api_key else None
+        
+        # Fallback to locating the last oracle update via RPC
+        if not last_transaction and rpc_endpoint:
+            print("⚠ Warning: Could not fetch transaction data from API, searching via RPC")
+            last_transaction = get_last_transaction_via_rpc(contract_address, rpc_endpoint, block=block)
         
         # Fallback to cached JSON if API fails
         if not last_transaction:
@@ -2601,6 +1786,9 @@ def main():
         if last_transaction:
             transaction_hash = last_transaction.get("hash")
     
+    # The indexer set stays in memory between the stages below and is written once
+    pipeline = IndexerPipeline()
+    
     # Retrieve active indexers by querying network subgraph
     if graph_api_key and graph_api_key != "your_graph_api_key_here":
         print()
@@ -2613,7 +1801,7 @@ def main():
             print("   Fetching fresh ENS data from subgraph")
         print("=" * 60)
         print()
-        retrieveActiveIndexers(graph_api_key, use_cached_ens=use_cached_ens, contract_address=contract_address, rpc_endpoint=rpc_endpoint, transaction_hash=transaction_hash)
+        retrieveActiveIndexers(graph_api_key, use_cached_ens=use_cached_ens, contract_address=contract_address, rpc_endpoint=rpc_endpoint, transaction_hash=transaction_hash, block=block, ens_workers=ens_workers, ens_ttl_hours=ens_ttl_hours, ens_negative_ttl_hours=ens_negative_ttl_hours, pipeline=pipeline)
         print()
     else:
         print("⚠ GRAPH_API_KEY not set, skipping active indexers retrieval")
@@ -2635,7 +1823,7 @@ def main():
     if not api_key:
         missing_vars.append("ARBISCAN_API_KEY")
     if not rpc_endpoint:
-        missing_vars.append("RPC_ENDPOINT")
+        missing_vars.append("RPC_ENDPOINT (or RPC_ENDPOINTS)")
     
     if missing_vars:
         print("❌ Error: Required environment variables are missing:")
@@ -2649,16 +1837,35 @@ def main():
     print("✓ Configuration loaded successfully")
     print()
     
+    # Bring the renewal history up to date from the oracle's events (opt-in)
+    renewal_history = None
+    if eligibility_source == "events":
+        events_start_block = os.getenv("ELIGIBILITY_EVENTS_START_BLOCK")
+        renewal_history = event_indexer.update_renewal_history(
+            rpc_endpoint,
+            contract_address,
+            block=block,
+            event_signature=os.getenv("ELIGIBILITY_EVENT_SIGNATURE", event_indexer.DEFAULT_RENEWAL_EVENT),
+            start_block=int(events_start_block) if events_start_block else None,
+        )
+        if renewal_history is None:
+            print("⚠ Could not update renewal history from events, reading renewal times from the contract")
+        print()
+    
     # Check eligibility for each indexer by calling the contract
-    checkEligibility(contract_address, rpc_endpoint)
+    checkEligibility(contract_address, rpc_endpoint, batch_size=rpc_batch_size, use_multicall=use_multicall, multicall_max_calldata_bytes=multicall_max_calldata_bytes, fused=fused_eligibility_fetch, block=block, concurrency=rpc_concurrency, renewal_history=renewal_history, pipeline=pipeline)
     print()
     
     # Update status change dates by comparing with previous run
-    updateStatusChangeDates()
+    updateStatusChangeDates(pipeline=pipeline)
+    print()
+    
+    # Persist the indexer set once, before the activity log, the notifier and the dashboard use it
+    pipeline.save()
     print()
     
     # Log status changes to activity log
-    logStatusChanges()
+    logStatusChanges(pipeline=pipeline)
     print()
     
     # Send Telegram notifications about oracle update and status changes
@@ -2674,14 +1881,22 @@ def main():
         print("ℹ️ Telegram notifications disabled (module not available)")
         print()
     
-    html_content = generate_html_dashboard(indexers, contract_address=contract_address, api_key=api_key, rpc_endpoint=rpc_endpoint)
+    html_content = generate_html_dashboard(indexers, contract_address=contract_address, api_key=api_key, rpc_endpoint=rpc_endpoint, block=block, pipeline=pipeline)
     
     # Write to index.html
     with open('index.html', 'w', encoding='utf-8') as file:
         file.write(html_content)
     
     print("Dashboard generated successfully!")
-    print("Open 'index.html' in your browser to view the dashboard.")
+    print("The page loads its data with fetch(), so serve this directory over HTTP to view it:")
+    print("  python3 -m http.server 8000  ->  http://localhost:8000/index.html")
+    
+    # Keep this run's pinned eth_call results for retries and reruns at the same block
+    if snapshot_block is not None:
+        rpc_client.save_call_cache(block)
+    
+    rpc_client.print_endpoint_stats(rpc_endpoint)
+    http_client.close_sessions()
     
     # Log execution time
     end_time = datetime.now(timezone.utc)
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+HTTP Client for REO Dashboard
+Shared keep-alive HTTP sessions, rate limiting and retries used by every RPC,
+subgraph and explorer API call.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import httpx
+import requests
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Default connection pool sizes for each host session
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 16
+
+# Headers sent with every request (responses are compressed where the server supports it)
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+# Default initial request rate per host (requests per second); adapts at runtime
+DEFAULT_RATE_LIMIT = 20.0
+
+# Retry settings for transient failures (connection errors, 429 and 5xx responses)
+DEFAULT_MAX_RETRIES = 4
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 30.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_pool_connections = DEFAULT_POOL_CONNECTIONS
+_pool_maxsize = DEFAULT_POOL_MAXSIZE
+_rate_limit = DEFAULT_RATE_LIMIT
+_max_retries = DEFAULT_MAX_RETRIES
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_limiters: Dict[str, 'RateLimiter'] = {}
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter that adapts to the provider's limits.
+
+    The rate is halved whenever the host answers 429 and grows back slowly on every
+    successful response (additive increase, multiplicative decrease), so throughput
+    settles just under what the provider allows.
+    """
+
+    def __init__(self, rate: float, min_rate: float = 1.0, max_rate: Optional[float] = None):
+        self.rate = max(min_rate, rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else self.rate * 10
+        self.capacity = max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller has to wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self) -> None:
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + 0.1)
+
+    def on_throttle(self) -> None:
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            print(f"  ⚠ Rate limited, reducing request rate to {self.rate:.1f} req/s")
+
+
+def configure(pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE, rate_limit: float = DEFAULT_RATE_LIMIT, max_retries: int = DEFAULT_MAX_RETRIES) -> None:
+    """
+    Set the connection pool sizes, rate limit and retry count used for new host sessions.
+
+    Args:
+        pool_connections: Number of connection pools cached per session
+        pool_maxsize: Maximum number of keep-alive connections per pool
+        rate_limit: Initial request rate per host in requests per second
+        max_retries: Number of retries for transient failures
+    """
+    global _pool_connections, _pool_maxsize, _rate_limit, _max_retries
+    _pool_connections = max(1, pool_connections)
+    _pool_maxsize = max(1, pool_maxsize)
+    _rate_limit = rate_limit
+    _max_retries = max(0, max_retries)
+    close_sessions()
+
+
+def get_pool_maxsize() -> int:
+    """Return the configured maximum number of keep-alive connections per host."""
+    return _pool_maxsize
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Get the pooled keep-alive session for the host of a URL, creating it on first use.
+
+    Args:
+        url: Request URL (only scheme and host are used to select the session)
+
+    Returns:
+        requests.Session shared by all requests to that host
+    """
+    key = _host_key(url)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=_pool_connections, pool_maxsize=_pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+        return session
+
+
+def get_rate_limiter(url: str) -> RateLimiter:
+    """Get the rate limiter shared by all requests to the host of a URL."""
+    key = _host_key(url)
+    with _sessions_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(_rate_limit)
+            _limiters[key] = limiter
+        return limiter
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Return the delay before a retry: the server's Retry-After, else jittered exponential backoff."""
+    if retry_after is not None:
+        return min(retry_after, BACKOFF_MAX_SECONDS)
+    return random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def _should_retry(response, attempt: int, max_retries: int, limiter: RateLimiter) -> Optional[float]:
+    """Return the retry delay for a retryable response, or None if it should be returned."""
+    if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+        if response.status_code < 400:
+            limiter.on_success()
+        return None
+    if response.status_code == 429:
+        limiter.on_throttle()
+    delay = backoff_delay(attempt, parse_retry_after(response.headers.get("Retry-After")))
+    print(f"  ⚠ HTTP {response.status_code} from {_host_key(str(response.url))}, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+    return delay
+
+
+def request(method: str, url: str, max_retries: Optional[int] = None, **kwargs) -> requests.Response:
+    """
+    Send a request through the pooled session for the URL's host.
+
+    Requests are paced by the host's adaptive rate limiter. Connection errors, timeouts,
+    429 and 5xx responses are retried with jittered exponential backoff, honouring the
+    server's Retry-After header.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        max_retries: Override for the configured retry count (e.g. 0 when the caller fails over itself)
+
+    Returns:
+        The final response (which may still be an error response once retries run out)
+    """
+    session = get_session(url)
+    limiter = get_rate_limiter(url)
+    max_retries = _max_retries if max_retries is None else max_retries
+
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= max_retries:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"  ⚠ Request to {_host_key(url)} failed ({e.__class__.__name__}), retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+            time.sleep(delay)
+            continue
+
+        delay = _should_retry(response, attempt, max_retries, limiter)
+        if delay is None:
+            return response
+        time.sleep(delay)
+
+
+async def request_async(client, method: str, url: str, max_retries: Optional[int] = None, **kwargs):
+    """
+    Async counterpart of request() for an httpx.AsyncClient, sharing the same
+    per-host rate limiter and retry policy.
+    """
+    limiter = get_rate_limiter(url)
+    max_retries = _max_retries if max_retries is None else max_retries
+
+    for attempt in range(max_retries + 1):
+        await limiter.acquire_async()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt >= max_retries:
+                raise
+            delay = backoff_delay(attempt)
+            print(f"  ⚠ Request to {_host_key(url)} failed ({e.__class__.__name__}), retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay)
+            continue
+
+        delay = _should_retry(response, attempt, max_retries, limiter)
+        if delay is None:
+            return response
+        await asyncio.sleep(delay)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Send a POST request through the pooled session, rate limiter and retry policy."""
+    return request("POST", url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Send a GET request through the pooled session, rate limiter and retry policy."""
+    return request("GET", url, **kwargs)
+
+
+def close_sessions() -> None:
+    """Close all pooled sessions and their connections."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _limiters.clear()
@@ -0,0 +1,892 @@
+#!/usr/bin/env python3
+"""
+RPC Client for REO Dashboard
+JSON-RPC helpers used to read the Rewards Eligibility Oracle contract.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+import httpx
+import requests
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import http_client
+import serialization
+
+# Default number of eth_call requests packed into a single JSON-RPC batch
+DEFAULT_BATCH_SIZE = 50
+
+# Default number of concurrent in-flight RPC requests
+DEFAULT_CONCURRENCY = 4
+
+# Error message fragments used by providers when a batch is rejected for its size
+BATCH_TOO_LARGE_HINTS = ("batch", "too large", "too many", "exceed", "limit")
+
+# Error message fragments of rate limit and authentication errors, which smaller batches do not fix
+NOT_BATCH_SIZE_HINTS = ("rate", "too many requests", "per second", "credits", "quota", "unauthorized", "forbidden", "api key")
+
+# JSON-RPC error code providers use for rate limits ("limit exceeded", EIP-1474)
+LIMIT_EXCEEDED_CODE = -32005
+
+# JSON-RPC error code of an eth_call the contract reverted (EIP-1474)
+EXECUTION_REVERTED_CODE = 3
+
+# Result of a call the contract reverted. Unlike None (the call could not be made, e.g. a
+# timeout or rate limit), a revert is deterministic: repeating the call gives the same answer.
+REVERTED = object()
+
+# Multicall3 is deployed at the same address on all major chains, including Arbitrum Sepolia
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+# Function selector for aggregate3((address,bool,bytes)[])
+# keccak256("aggregate3((address,bool,bytes)[])") = 0x82ad56cb...
+AGGREGATE3_SELECTOR = '0x82ad56cb'
+
+# Default upper bound for the calldata size of a single aggregate3 call
+DEFAULT_MULTICALL_MAX_CALLDATA_BYTES = 32 * 1024
+
+# Results of eth_calls pinned to a block number, keyed by (block, contract, calldata).
+# State at a fixed block never changes, so these can be reused across retries and reruns.
+CALL_CACHE_FILE = 'rpc_call_cache.json'
+_call_cache: Dict[Tuple[str, str, str], str] = {}
+
+# Endpoint health tracking: latency EWMA weight, samples kept for the p95 hedge budget,
+# and how long an unhealthy endpoint is skipped before it gets another chance
+LATENCY_EWMA_ALPHA = 0.3
+LATENCY_WINDOW = 100
+MIN_HEDGE_SAMPLES = 10
+UNHEALTHY_SCORE = 0.5
+UNHEALTHY_COOLDOWN_SECONDS = 30.0
+
+_hedging = True
+_endpoint_pools: Dict[str, 'EndpointPool'] = {}
+_endpoint_pools_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+class RpcEndpoint:
+    """Latency and health statistics of a single RPC endpoint."""
+
+    def __init__(self, url: str):
+        self.url = url
+        # Only the host is printed, since provider URLs often embed an API key in the path
+        self.name = urlsplit(url).netloc or url
+        self.latency_ewma: Optional[float] = None
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.health = 1.0
+        self.last_failure = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    def record_success(self, latency: float) -> None:
+        with self.lock:
+            self.requests += 1
+            self.latencies.append(latency)
+            if self.latency_ewma is None:
+                self.latency_ewma = latency
+            else:
+                self.latency_ewma = LATENCY_EWMA_ALPHA * latency + (1 - LATENCY_EWMA_ALPHA) * self.latency_ewma
+            self.health = min(1.0, self.health * 0.8 + 0.2)
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.requests += 1
+            self.failures += 1
+            self.health *= 0.7
+            self.last_failure = time.monotonic()
+
+    def is_healthy(self) -> bool:
+        """Healthy endpoints take traffic; unhealthy ones are retried after a cooldown."""
+        return self.health >= UNHEALTHY_SCORE or time.monotonic() - self.last_failure > UNHEALTHY_COOLDOWN_SECONDS
+
+    def p95(self) -> Optional[float]:
+        """95th percentile latency in seconds, or None until enough samples are collected."""
+        with self.lock:
+            return _percentile(list(self.latencies), 0.95)
+
+
+def _percentile(samples: List[float], fraction: float) -> Optional[float]:
+    if len(samples) < MIN_HEDGE_SAMPLES:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _is_failover_response(response) -> bool:
+    return response.status_code in http_client.RETRY_STATUS_CODES
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _endpoint_pools_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=http_client.get_pool_maxsize(), thread_name_prefix="rpc-hedge")
+        return _hedge_executor
+
+
+class EndpointPool:
+    """
+    A set of interchangeable RPC endpoints with health scoring and latency tracking.
+
+    Each request goes to the fastest healthy endpoint and fails over to the next one on
+    connection errors, 429 and 5xx responses. When hedging is enabled and a request is
+    still running after its endpoint's p95 latency, a duplicate is sent to the next
+    endpoint and whichever answers first wins. Only read-only calls go through the pool,
+    so duplicates are harmless.
+    """
+
+    def __init__(self, urls: List[str], hedging: bool = True):
+        self.endpoints = [RpcEndpoint(url) for url in urls]
+        self.hedging = hedging
+
+    def ranked(self) -> List[RpcEndpoint]:
+        """Endpoints in the order they should be tried: healthy first, then by latency."""
+        # Endpoints without samples yet rank first, so every endpoint gets measured early
+        return sorted(self.endpoints, key=lambda e: (not e.is_healthy(), e.latency_ewma or 0.0, -e.health))
+
+    def hedge_budget(self, endpoint: RpcEndpoint) -> Optional[float]:
+        """
+        How long to wait for an endpoint before hedging: its own p95 latency, or the p95
+        across all endpoints while it has too few samples of its own.
+        """
+        if not self.hedging:
+            return None
+        budget = endpoint.p95()
+        if budget is None:
+            samples: List[float] = []
+            for other in self.endpoints:
+                with other.lock:
+                    samples.extend(other.latencies)
+            budget = _percentile(samples, 0.95)
+        return budget
+
+    def _attempt(self, endpoint: RpcEndpoint, max_retries: Optional[int], **kwargs) -> requests.Response:
+        started = time.monotonic()
+        try:
+            response = http_client.post(endpoint.url, max_retries=max_retries, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            endpoint.record_failure()
+            raise
+        if _is_failover_response(response):
+            endpoint.record_failure()
+        else:
+            endpoint.record_success(time.monotonic() - started)
+        return response
+
+    def _hedged_attempt(self, primary: RpcEndpoint, backup: RpcEndpoint, budget: float, **kwargs) -> requests.Response:
+        executor = _get_hedge_executor()
+        futures = {executor.submit(self._attempt, primary, 0, **kwargs): primary}
+        done, _ = wait(futures, timeout=budget)
+        if not done:
+            futures[executor.submit(self._attempt, backup, 0, **kwargs)] = backup
+
+        last_error: Optional[Exception] = None
+        last_response = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                if not _is_failover_response(response):
+                    return response
+                last_response = response
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def post(self, **kwargs) -> requests.Response:
+        """
+        Send a JSON-RPC POST to the best endpoint, failing over and hedging as needed.
+
+        Returns:
+            The first usable response (or the last error response if every endpoint failed)
+        """
+        if len(self.endpoints) == 1:
+            return self._attempt(self.endpoints[0], None, **kwargs)
+
+        ranked = self.ranked()
+        last_error: Optional[Exception] = None
+        for position, endpoint in enumerate(ranked):
+            backup = ranked[position + 1] if position + 1 < len(ranked) else None
+            budget = self.hedge_budget(endpoint) if backup is not None else None
+            try:
+                if budget is not None:
+                    response = self._hedged_attempt(endpoint, backup, budget, **kwargs)
+                else:
+                    response = self._attempt(endpoint, 0, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                print(f"  ⚠ RPC endpoint {endpoint.name} failed ({e.__class__.__name__}), failing over")
+                last_error = e
+                continue
+            if not _is_failover_response(response):
+                return response
+            print(f"  ⚠ RPC endpoint {endpoint.name} returned HTTP {response.status_code}, failing over")
+
+        # Every endpoint failed once; give the best one the full retry/backoff policy
+        print("  ⚠ All RPC endpoints failed, retrying the best one with backoff")
+        return self._attempt(self.ranked()[0], None, **kwargs)
+
+    async def _attempt_async(self, client, endpoint: RpcEndpoint, max_retries: Optional[int], **kwargs):
+        started = time.monotonic()
+        try:
+            response = await http_client.request_async(client, "POST", endpoint.url, max_retries=max_retries, **kwargs)
+        except httpx.TransportError:
+            endpoint.record_failure()
+            raise
+        if _is_failover_response(response):
+            endpoint.record_failure()
+        else:
+            endpoint.record_success(time.monotonic() - started)
+        return response
+
+    async def _hedged_attempt_async(self, client, primary: RpcEndpoint, backup: RpcEndpoint, budget: float, **kwargs):
+        tasks = [asyncio.ensure_future(self._attempt_async(client, primary, 0, **kwargs))]
+        done, _ = await asyncio.wait(tasks, timeout=budget)
+        if not done:
+            tasks.append(asyncio.ensure_future(self._attempt_async(client, backup, 0, **kwargs)))
+
+        last_error: Optional[Exception] = None
+        last_response = None
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        last_error = e
+                        continue
+                    if not _is_failover_response(response):
+                        return response
+                    last_response = response
+        finally:
+            # The slower duplicate is no longer needed
+            for task in pending:
+                task.cancel()
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    async def post_async(self, client, **kwargs):
+        """Async counterpart of post() for an httpx.AsyncClient."""
+        if len(self.endpoints) == 1:
+            return await self._attempt_async(client, self.endpoints[0], None, **kwargs)
+
+        ranked = self.ranked()
+        for position, endpoint in enumerate(ranked):
+            backup = ranked[position + 1] if position + 1 < len(ranked) else None
+            budget = self.hedge_budget(endpoint) if backup is not None else None
+            try:
+                if budget is not None:
+                    response = await self._hedged_attempt_async(client, endpoint, backup, budget, **kwargs)
+                else:
+                    response = await self._attempt_async(client, endpoint, 0, **kwargs)
+            except httpx.TransportError as e:
+                print(f"  ⚠ RPC endpoint {endpoint.name} failed ({e.__class__.__name__}), failing over")
+                continue
+            if not _is_failover_response(response):
+                return response
+            print(f"  ⚠ RPC endpoint {endpoint.name} returned HTTP {response.status_code}, failing over")
+
+        print("  ⚠ All RPC endpoints failed, retrying the best one with backoff")
+        return await self._attempt_async(client, self.ranked()[0], None, **kwargs)
+
+
+def parse_endpoints(rpc_endpoint: str) -> List[str]:
+    """Split a comma-separated list of RPC endpoint URLs."""
+    return [url.strip() for url in rpc_endpoint.split(',') if url.strip()]
+
+
+def configure_endpoints(hedging: bool = True) -> None:
+    """
+    Enable or disable hedged requests for multi-endpoint pools created from now on.
+
+    Args:
+        hedging: Send a duplicate request to the next endpoint once the p95 latency is exceeded
+    """
+    global _hedging
+    _hedging = hedging
+    with _endpoint_pools_lock:
+        _endpoint_pools.clear()
+
+
+def get_endpoint_pool(rpc_endpoint: str) -> EndpointPool:
+    """
+    Get the endpoint pool for an RPC endpoint setting, creating it on first use.
+
+    Args:
+        rpc_endpoint: RPC endpoint URL, or a comma-separated list of interchangeable URLs
+
+    Returns:
+        EndpointPool shared by all calls made with the same setting
+    """
+    with _endpoint_pools_lock:
+        pool = _endpoint_pools.get(rpc_endpoint)
+        if pool is None:
+            pool = EndpointPool(parse_endpoints(rpc_endpoint), hedging=_hedging)
+            _endpoint_pools[rpc_endpoint] = pool
+        return pool
+
+
+def print_endpoint_stats(rpc_endpoint: str) -> None:
+    """Print request count, failures, latency and health of every endpoint in the pool."""
+    pool = get_endpoint_pool(rpc_endpoint)
+    if len(pool.endpoints) < 2:
+        return
+    print("RPC endpoint statistics:")
+    for endpoint in pool.endpoints:
+        p95 = endpoint.p95()
+        ewma = f"{endpoint.latency_ewma * 1000:.0f}ms" if endpoint.latency_ewma is not None else "n/a"
+        p95_text = f"{p95 * 1000:.0f}ms" if p95 is not None else "n/a"
+        print(f"  - {endpoint.name}: {endpoint.requests} requests, {endpoint.failures} failures, latency {ewma} (p95 {p95_text}), health {endpoint.health:.2f}")
+
+
+def rpc_call(rpc_endpoint: str, method: str, params: list, timeout: int = 15) -> Optional[object]:
+    """
+    Execute a single JSON-RPC call through the endpoint pool.
+
+    Args:
+        rpc_endpoint: RPC endpoint URL (or comma-separated list of URLs)
+        method: JSON-RPC method name
+        params: JSON-RPC parameters
+        timeout: HTTP timeout in seconds
+
+    Returns:
+        The call's result or None if error
+    """
+    try:
+        response = get_endpoint_pool(rpc_endpoint).post(
+            json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        if isinstance(data, dict) and data.get("error"):
+            print(f"RPC error for {method}: {data['error']}")
+            return None
+        return data.get("result")
+    except Exception as e:
+        print(f"RPC exception for {method}: {e}")
+        return None
+
+
+def block_tag(block_number: Optional[int]) -> str:
+    """Return the JSON-RPC block parameter for a block number ('latest' if None)."""
+    return hex(block_number) if block_number is not None else 'latest'
+
+
+def get_block_number(rpc_endpoint: str, timeout: int = 15) -> Optional[int]:
+    """
+    Get the latest block number, used to pin every contract read of a run to one snapshot.
+
+    Args:
+        rpc_endpoint: RPC endpoint URL
+        timeout: HTTP timeout in seconds
+
+    Returns:
+        Latest block number or None if error
+    """
+    result = rpc_call(rpc_endpoint, "eth_blockNumber", [], timeout=timeout)
+    return int(result, 16) if result else None
+
+
+def _cache_key(block: str, contract_address: str, data: str) -> Optional[Tuple[str, str, str]]:
+    # Only reads pinned to a block number are cacheable
+    if not block.startswith('0x'):
+        return None
+    return (block, contract_address.lower(), data.lower())
+
+
+def load_call_cache(cache_file: str = CALL_CACHE_FILE) -> None:
+    """Load cached eth_call results from a previous run."""
+    try:
+        if not os.path.exists(cache_file):
+            return
+        entries = serialization.load_file(cache_file).get("entries", [])
+        for block, contract_address, data, result in entries:
+            _call_cache[(block, contract_address, data)] = result
+        print(f"✓ Loaded {len(entries)} cached eth_call results from {cache_file}")
+    except Exception as e:
+        print(f"⚠ Could not load eth_call cache from {cache_file}: {e}")
+
+
+def save_call_cache(block: str, cache_file: str = CALL_CACHE_FILE) -> None:
+    """Persist cached eth_call results for the given snapshot block (older blocks are dropped)."""
+    try:
+        entries = [[key[0], key[1], key[2], result] for key, result in _call_cache.items() if key[0] == block]
+        serialization.dump_file(cache_file, {"block": block, "entries": entries})
+        print(f"✓ Saved {len(entries)} eth_call results for block {int(block, 16)} to {cache_file}")
+    except Exception as e:
+        print(f"⚠ Could not save eth_call cache to {cache_file}: {e}")
+
+
+def encode_address_call(selector: str, address: str) -> str:
+    """
+    Build eth_call data for a contract function taking a single address argument.
+
+    Args:
+        selector: 4-byte function selector with 0x prefix (e.g. '0x66e305fd')
+        address: Address argument (with or without 0x prefix)
+
+    Returns:
+        Hex-encoded call data (selector followed by the address padded to 32 bytes)
+    """
+    address_param = address[2:] if address.startswith('0x') else address
+    return selector + address_param.lower().zfill(64)
+
+
+def build_eth_call(contract_address: str, data: str, request_id: int = 1, block: str = 'latest') -> dict:
+    """
+    Build a JSON-RPC eth_call request object.
+
+    Args:
+        contract_address: The contract address to call
+        data: Hex-encoded call data
+        request_id: JSON-RPC request id used to match the response
+        block: Block tag or hex block number the call is executed against
+
+    Returns:
+        JSON-RPC request dictionary
+    """
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "eth_call",
+        "params": [
+            {
+                "to": contract_address,
+                "data": data
+            },
+            block
+        ]
+    }
+
+
+def eth_call(rpc_endpoint: str, contract_address: str, data: str, block: str = 'latest', timeout: int = 10) -> Optional[str]:
+    """
+    Execute a single eth_call, served from the call cache when pinned to a block number.
+
+    Returns:
+        Hex result or None if the call failed
+    """
+    key = _cache_key(block, contract_address, data)
+    if key in _call_cache:
+        return _call_cache[key]
+
+    result = _send_batch(rpc_endpoint, contract_address, [(1, data)], block, timeout).get(1)
+    if result is REVERTED:
+        return None
+    if key and result is not None:
+        _call_cache[key] = result
+    return result
+
+
+def _is_batch_size_error(error) -> bool:
+    """Detect an error object saying the batch is too large (and not, e.g., a rate limit)."""
+    if not isinstance(error, dict):
+        return False
+    message = str(error.get("message", "")).lower()
+    if any(hint in message for hint in NOT_BATCH_SIZE_HINTS):
+        return False
+    if error.get("code") == LIMIT_EXCEEDED_CODE and "batch" not in message:
+        return False
+    return any(hint in message for hint in BATCH_TOO_LARGE_HINTS)
+
+
+def _is_batch_rejected(response: requests.Response, call_count: int) -> bool:
+    """
+    Detect a provider rejecting a JSON-RPC batch because it is too large.
+    Providers answer with HTTP 413, or with a single error object instead of an array
+    whose message points at the batch size. Other errors (rate limits, authentication)
+    are not fixed by splitting the batch, so they are not treated as a rejection.
+    """
+    if call_count <= 1:
+        return False
+    if response.status_code == 413:
+        return True
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    if isinstance(data, dict) and data.get("error"):
+        return _is_batch_size_error(data["error"])
+    return False
+
+
+def _build_batch_payload(contract_address: str, chunk: List[Tuple[int, str]], block: str):
+    """Build the JSON-RPC payload for a chunk of eth_calls (a single object for one call)."""
+    if len(chunk) == 1:
+        request_id, data = chunk[0]
+        return build_eth_call(contract_address, data, request_id, block)
+    return [build_eth_call(contract_address, data, request_id, block) for request_id, data in chunk]
+
+
+def _is_revert_error(error) -> bool:
+    """Detect an eth_call error object reporting that the contract reverted."""
+    if not isinstance(error, dict):
+        return False
+    if error.get("code") == EXECUTION_REVERTED_CODE:
+        return True
+    return "execution reverted" in str(error.get("message", "")).lower()
+
+
+def _map_batch_results(chunk: List[Tuple[int, str]], data) -> Dict[int, Optional[str]]:
+    """Map JSON-RPC responses back to the chunk's calls by id (None where a call failed, REVERTED where it reverted)."""
+    items = data if isinstance(data, list) else [data]
+
+    results: Dict[int, Optional[str]] = {request_id: None for request_id, _ in chunk}
+    for item in items:
+        if not isinstance(item, dict) or item.get("id") not in results:
+            continue
+        if "result" in item:
+            results[item["id"]] = item["result"]
+        else:
+            print(f"  ⚠ RPC error for call {item['id']}: {item.get('error')}")
+            if _is_revert_error(item.get("error")):
+                results[item["id"]] = REVERTED
+    return results
+
+
+def _split_chunk(chunk: List[Tuple[int, str]]) -> Tuple[List[Tuple[int, str]], List[Tuple[int, str]]]:
+    middle = len(chunk) // 2
+    print(f"  ⚠ Provider rejected batch of {len(chunk)} calls, splitting into {middle} + {len(chunk) - middle}")
+    return chunk[:middle], chunk[middle:]
+
+
+def _send_batch(rpc_endpoint: str, contract_address: str, chunk: List[Tuple[int, str]], block: str, timeout: int) -> Dict[int, Optional[str]]:
+    """
+    Send one chunk of eth_calls as a JSON-RPC batch and map the responses back by id.
+    Splits the chunk in half and retries when the provider rejects it for its size.
+    """
+    payload = _build_batch_payload(contract_address, chunk, block)
+    response = get_endpoint_pool(rpc_endpoint).post(json=payload, timeout=timeout)
+
+    if _is_batch_rejected(response, len(chunk)):
+        first, second = _split_chunk(chunk)
+        results = _send_batch(rpc_endpoint, contract_address, first, block, timeout)
+        results.update(_send_batch(rpc_endpoint, contract_address, second, block, timeout))
+        return results
+
+    response.raise_for_status()
+    return _map_batch_results(chunk, response.json())
+
+
+def _quiet_http_loggers() -> None:
+    """
+    Keep httpx from logging every request: it logs the full URL at INFO, and provider URLs
+    often embed an API key (scripts like telegram_notifier.py set the root logger to INFO).
+    """
+    for name in ('httpx', 'httpcore'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+
+class AsyncRpcClient:
+    """
+    Asyncio JSON-RPC client with bounded concurrency.
+
+    All requests share one keep-alive httpx connection pool, at most `concurrency` requests
+    are in flight at a time, and every request has its own timeout.
+    """
+
+    def __init__(self, rpc_endpoint: str, concurrency: int = DEFAULT_CONCURRENCY, timeout: int = 30):
+        self.rpc_endpoint = rpc_endpoint
+        self.pool = get_endpoint_pool(rpc_endpoint)
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(max(1, concurrency))
+        _quiet_http_loggers()
+        # Hedged duplicates go to another endpoint, so leave room for one connection per endpoint
+        max_connections = max(1, concurrency) * len(self.pool.endpoints)
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=httpx.Timeout(timeout),
+            headers=http_client.DEFAULT_HEADERS,
+        )
+
+    async def __aenter__(self) -> 'AsyncRpcClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.client.aclose()
+
+    async def send_batch(self, contract_address: str, chunk: List[Tuple[int, str]], block: str) -> Dict[int, Optional[str]]:
+        """Async counterpart of _send_batch: send one chunk, splitting it when rejected as too large."""
+        payload = _build_batch_payload(contract_address, chunk, block)
+        async with self.semaphore:
+            response = await self.pool.post_async(self.client, json=payload, timeout=self.timeout)
+
+        if _is_batch_rejected(response, len(chunk)):
+            first, second = _split_chunk(chunk)
+            halves = await asyncio.gather(
+                self.send_batch(contract_address, first, block),
+                self.send_batch(contract_address, second, block),
+            )
+            return {**halves[0], **halves[1]}
+
+        response.raise_for_status()
+        return _map_batch_results(chunk, response.json())
+
+    async def send_batches(self, contract_address: str, chunks: List[List[Tuple[int, str]]], block: str, total: int) -> Dict[int, Optional[str]]:
+        """Send all chunks concurrently and merge their results by call id."""
+        results: Dict[int, Optional[str]] = {}
+        processed = 0
+
+        async def send(chunk: List[Tuple[int, str]]) -> None:
+            nonlocal processed
+            try:
+                results.update(await self.send_batch(contract_address, chunk, block))
+            except Exception as e:
+                print(f"  ⚠ Error sending batch of {len(chunk)} calls: {e}")
+            processed += len(chunk)
+            if len(chunk) > 1 or processed % 10 == 0 or processed == total:
+                print(f"  Processed {processed}/{total} calls...")
+
+        await asyncio.gather(*(send(chunk) for chunk in chunks))
+        return results
+
+
+async def _send_batches_async(rpc_endpoint: str, contract_address: str, chunks: List[List[Tuple[int, str]]], block: str, timeout: int, concurrency: int, total: int) -> Dict[int, Optional[str]]:
+    async with AsyncRpcClient(rpc_endpoint, concurrency=concurrency, timeout=timeout) as client:
+        return await client.send_batches(contract_address, chunks, block, total)
+
+
+def batch_eth_call(rpc_endpoint: str, contract_address: str, call_data: List[str], batch_size: int = DEFAULT_BATCH_SIZE, block: str = 'latest', timeout: int = 30, concurrency: int = 1) -> List[Optional[str]]:
+    """
+    Execute many eth_calls against one contract using JSON-RPC batch requests.
+
+    Args:
+        rpc_endpoint: RPC endpoint URL
+        contract_address: The contract address to call
+        call_data: List of hex-encoded call data, one entry per call
+        batch_size: Maximum number of calls per JSON-RPC batch (1 disables batching)
+        block: Block tag or hex block number the calls are executed against
+        timeout: HTTP timeout in seconds for each batch request
+        concurrency: Maximum number of requests in flight (1 sends batches sequentially)
+
+    Returns:
+        List of hex results aligned with call_data, None where a call failed and
+        REVERTED where the contract reverted
+    """
+    batch_size = max(1, batch_size)
+    results: List[Optional[str]] = [None] * len(call_data)
+    chunks = [
+        [(start + offset, data) for offset, data in enumerate(call_data[start:start + batch_size])]
+        for start in range(0, len(call_data), batch_size)
+    ]
+
+    if concurrency > 1 and len(chunks) > 1:
+        chunk_results = asyncio.run(_send_batches_async(rpc_endpoint, contract_address, chunks, block, timeout, concurrency, len(call_data)))
+        for request_id, result in chunk_results.items():
+            results[request_id] = result
+        return results
+
+    for chunk in chunks:
+        try:
+            chunk_results = _send_batch(rpc_endpoint, contract_address, chunk, block, timeout)
+            for request_id, result in chunk_results.items():
+                results[request_id] = result
+        except Exception as e:
+            print(f"  ⚠ Error sending batch of {len(chunk)} calls: {e}")
+
+        # Progress indicator per batch (every 10 calls when batching is disabled)
+        processed = chunk[-1][0] + 1
+        if batch_size > 1 or processed % 10 == 0 or processed == len(call_data):
+            print(f"  Processed {processed}/{len(call_data)} calls...")
+
+    return results
+
+
+def _strip_hex(value: str) -> str:
+    return value[2:] if value.startswith('0x') else value
+
+
+def _word(value: int) -> str:
+    return format(value, '064x')
+
+
+def _encode_call3(target: str, allow_failure: bool, data: str) -> str:
+    """ABI-encode a single Call3 tuple (address target, bool allowFailure, bytes callData)."""
+    data_hex = _strip_hex(data)
+    padded_data = data_hex + '0' * (-len(data_hex) % 64)
+    # The bytes field is dynamic: its offset is relative to the start of the tuple (3 head words)
+    return _strip_hex(target).lower().zfill(64) + _word(int(allow_failure)) + _word(0x60) + _word(len(data_hex) // 2) + padded_data
+
+
+def encode_aggregate3(calls: List[Tuple[str, bool, str]]) -> str:
+    """
+    ABI-encode a Multicall3 aggregate3 call.
+
+    Args:
+        calls: List of (target, allow_failure, call_data) tuples
+
+    Returns:
+        Hex-encoded call data for aggregate3((address,bool,bytes)[])
+    """
+    encoded_calls = [_encode_call3(target, allow_failure, data) for target, allow_failure, data in calls]
+
+    # Tuple offsets are relative to the first word after the array length
+    offsets = []
+    position = 32 * len(encoded_calls)
+    for encoded in encoded_calls:
+        offsets.append(_word(position))
+        position += len(encoded) // 2
+
+    return AGGREGATE3_SELECTOR + _word(0x20) + _word(len(encoded_calls)) + ''.join(offsets) + ''.join(encoded_calls)
+
+
+def decode_aggregate3(result: str) -> List[Tuple[bool, str]]:
+    """
+    Decode the (bool success, bytes returnData)[] returned by aggregate3.
+
+    Args:
+        result: Hex-encoded eth_call result
+
+    Returns:
+        List of (success, hex_return_data) tuples in call order
+    """
+    raw = bytes.fromhex(_strip_hex(result))
+
+    def word(position: int) -> int:
+        return int.from_bytes(raw[position:position + 32], 'big')
+
+    array_start = word(0)
+    count = word(array_start)
+    base = array_start + 32
+
+    decoded = []
+    for i in range(count):
+        tuple_start = base + word(base + 32 * i)
+        success = word(tuple_start) != 0
+        data_start = tuple_start + word(tuple_start + 32)
+        length = word(data_start)
+        return_data = raw[data_start + 32:data_start + 32 + length]
+        decoded.append((success, '0x' + return_data.hex()))
+    return decoded
+
+
+def _chunk_by_calldata_size(call_data: List[str], max_calldata_bytes: int) -> List[List[int]]:
+    """Group call indexes so that each encoded aggregate3 call stays under max_calldata_bytes."""
+    # Selector + array offset + array length
+    header_size = 4 + 32 + 32
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    current_size = header_size
+
+    for index, data in enumerate(call_data):
+        data_size = len(_strip_hex(data)) // 2
+        # Tuple offset + 4 tuple words (target, allowFailure, bytes offset, bytes length) + padded data
+        call_size = 32 + 4 * 32 + (data_size + 31) // 32 * 32
+        if current and current_size + call_size > max_calldata_bytes:
+            chunks.append(current)
+            current = []
+            current_size = header_size
+        current.append(index)
+        current_size += call_size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def multicall_eth_call(rpc_endpoint: str, contract_address: str, call_data: List[str], batch_size: int = DEFAULT_BATCH_SIZE, max_calldata_bytes: int = DEFAULT_MULTICALL_MAX_CALLDATA_BYTES, multicall_address: str = MULTICALL3_ADDRESS, block: str = 'latest', timeout: int = 30, concurrency: int = 1) -> List[Optional[str]]:
+    """
+    Execute many eth_calls against one contract through Multicall3 aggregate3.
+
+    Calls are grouped into aggregate3 calls of at most max_calldata_bytes each (with
+    allowFailure set, so one reverting call does not fail its group), and the aggregate
+    calls themselves are sent as JSON-RPC batches. A group whose aggregate call fails as
+    a whole is retried as plain eth_calls against the contract.
+
+    Args:
+        rpc_endpoint: RPC endpoint URL
+        contract_address: The contract address to call
+        call_data: List of hex-encoded call data, one entry per call
+        batch_size: Maximum number of aggregate3 calls per JSON-RPC batch
+        max_calldata_bytes: Maximum calldata size of a single aggregate3 call
+        multicall_address: Address of the Multicall3 contract
+        block: Block tag or hex block number the calls are executed against
+        timeout: HTTP timeout in seconds for each batch request
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        List of hex results aligned with call_data, None where a call failed and
+        REVERTED where the contract reverted (returned with success == False)
+    """
+    results: List[Optional[str]] = [None] * len(call_data)
+    chunks = _chunk_by_calldata_size(call_data, max_calldata_bytes)
+    print(f"  Aggregating {len(call_data)} calls into {len(chunks)} Multicall3 call(s)...")
+
+    aggregate_data = [
+        encode_aggregate3([(contract_address, True, call_data[index]) for index in chunk])
+        for chunk in chunks
+    ]
+    aggregate_results = batch_eth_call(rpc_endpoint, multicall_address, aggregate_data, batch_size=batch_size, block=block, timeout=timeout, concurrency=concurrency)
+
+    for chunk, aggregate_result in zip(chunks, aggregate_results):
+        decoded = None
+        if isinstance(aggregate_result, str) and aggregate_result != '0x':
+            try:
+                decoded = decode_aggregate3(aggregate_result)
+            except Exception as e:
+                print(f"  ⚠ Could not decode Multicall3 result: {e}")
+
+        if decoded is None or len(decoded) != len(chunk):
+            print(f"  ⚠ Multicall3 call failed for {len(chunk)} calls, falling back to direct eth_calls")
+            fallback = batch_eth_call(rpc_endpoint, contract_address, [call_data[index] for index in chunk], batch_size=batch_size, block=block, timeout=timeout, concurrency=concurrency)
+            for index, result in zip(chunk, fallback):
+                results[index] = result
+            continue
+
+        for index, (success, return_data) in zip(chunk, decoded):
+            results[index] = return_data if success else REVERTED
+
+    return results
+
+
+def eth_call_many(rpc_endpoint: str, contract_address: str, call_data: List[str], batch_size: int = DEFAULT_BATCH_SIZE, use_multicall: bool = False, max_calldata_bytes: int = DEFAULT_MULTICALL_MAX_CALLDATA_BYTES, block: str = 'latest', concurrency: int = 1) -> List[Optional[str]]:
+    """
+    Execute many eth_calls against one contract, through Multicall3 or plain JSON-RPC batches.
+    Calls pinned to a block number are served from the call cache when possible, and with
+    concurrency > 1 the requests fan out in parallel through the async client.
+
+    Returns:
+        List of hex results aligned with call_data, None where a call failed (transport,
+        timeout or rate limit) and REVERTED where the contract reverted
+    """
+    results: List[Optional[str]] = [None] * len(call_data)
+    pending: List[int] = []
+    for index, data in enumerate(call_data):
+        key = _cache_key(block, contract_address, data)
+        if key in _call_cache:
+            results[index] = _call_cache[key]
+        else:
+            pending.append(index)
+
+    if len(pending) < len(call_data):
+        print(f"  {len(call_data) - len(pending)}/{len(call_data)} calls served from cache for block {int(block, 16)}")
+    if not pending:
+        return results
+
+    pending_data = [call_data[index] for index in pending]
+    if use_multicall:
+        fetched = multicall_eth_call(rpc_endpoint, contract_address, pending_data, batch_size=batch_size, max_calldata_bytes=max_calldata_bytes, block=block, concurrency=concurrency)
+    else:
+        fetched = batch_eth_call(rpc_endpoint, contract_address, pending_data, batch_size=batch_size, block=block, concurrency=concurrency)
+
+    for index, result in zip(pending, fetched):
+        results[index] = result
+        key = _cache_key(block, contract_address, call_data[index])
+        if key and isinstance(result, str):
+            _call_cache[key] = result
+    return results
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Serialization for REO Dashboard
+Encodes and decodes the JSON state files with the fastest available backend: msgspec,
+then orjson, then the standard library json module.
+
+State files are written compact by default. Indented, human-readable files are opt-in,
+either for all writes (STATE_JSON_PRETTY=true) or as an export:
+
+    python3 serialization.py active_indexers.json [output.json]
+"""
+
+import json
+import os
+import sys
+from typing import Any, Optional
+
+try:
+    import msgspec
+    BACKEND = 'msgspec'
+except ImportError:
+    msgspec = None
+    try:
+        import orjson
+        BACKEND = 'orjson'
+    except ImportError:
+        orjson = None
+        BACKEND = 'json'
+
+# Encoders raise one of these for values their fast path does not support (e.g. ints above 64 bits)
+_FALLBACK_ERRORS = (TypeError, ValueError, OverflowError)
+
+# Raised by loads() for malformed JSON, whatever the backend
+DECODE_ERRORS = (ValueError, msgspec.DecodeError) if msgspec is not None else (ValueError,)
+
+_pretty: Optional[bool] = None
+
+
+def configure(pretty: Optional[bool]) -> None:
+    """
+    Set whether state files are written indented.
+
+    Args:
+        pretty: True for indented output, False for compact, None to read STATE_JSON_PRETTY again
+    """
+    global _pretty
+    _pretty = pretty
+
+
+def _use_pretty(pretty: Optional[bool]) -> bool:
+    global _pretty
+    if pretty is not None:
+        return pretty
+    if _pretty is None:
+        _pretty = os.getenv("STATE_JSON_PRETTY", "false").lower() in ("true", "1", "yes")
+    return _pretty
+
+
+def _stdlib_dumps(obj: Any, pretty: bool) -> bytes:
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps(obj: Any, pretty: Optional[bool] = None) -> bytes:
+    """
+    Encode an object as UTF-8 JSON.
+
+    Args:
+        obj: JSON-compatible object
+        pretty: Indent the output (defaults to the configured setting)
+
+    Returns:
+        Encoded JSON
+    """
+    pretty = _use_pretty(pretty)
+    try:
+        if msgspec is not None:
+            data = msgspec.json.encode(obj)
+            return msgspec.json.format(data, indent=2) if pretty else data
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            return orjson.dumps(obj, option=option)
+    except _FALLBACK_ERRORS:
+        pass
+    return _stdlib_dumps(obj, pretty)
+
+
+def loads(data: Any) -> Any:
+    """
+    Decode JSON.
+
+    The document is decoded untyped with every backend, so keys written by newer or older
+    versions are kept and survive the next write.
+
+    Args:
+        data: JSON as bytes or str
+
+    Returns:
+        Decoded object
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_file(path: str, obj: Any, pretty: Optional[bool] = None) -> None:
+    """
+    Write an object to a JSON file.
+
+    Args:
+        path: Path of the file
+        obj: JSON-compatible object
+        pretty: Indent the output (defaults to the configured setting)
+    """
+    pretty = _use_pretty(pretty)
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, pretty))
+        if pretty:
+            f.write(b'\n')
+
+
+def load_file(path: str) -> Any:
+    """
+    Read a JSON file.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        Decoded object
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def export(path: str, output_path: Optional[str] = None) -> None:
+    """Write an indented, human-readable copy of a state file (to stdout if no output path is given)."""
+    data = dumps(load_file(path), pretty=True)
+    if output_path is None:
+        sys.stdout.write(data.decode('utf-8') + '\n')
+        return
+    with open(output_path, 'wb') as f:
+        f.write(data + b'\n')
+    print(f"✓ Exported {path} to {output_path}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: python3 serialization.py <state file> [output file]")
+        sys.exit(1)
+    export(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+State Store for REO Dashboard
+Embedded SQLite store for the indexer set, per-run snapshots, status changes, ENS names,
+transactions and Telegram subscribers, shared by the dashboard generator, the notifier,
+the bot and the announcement script. Enabled with STATE_DB; without it the JSON files
+are used as before.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+import activity_log
+import serialization
+
+SCHEMA_VERSION = 2
+
+# Runs whose snapshots are kept (STATE_DB_KEEP_RUNS); the current and previous run are always kept
+DEFAULT_KEEP_RUNS = 30
+MIN_KEEP_RUNS = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at INTEGER NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    position INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    status TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, address)
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_address ON snapshots(address, run_id);
+CREATE TABLE IF NOT EXISTS indexers (
+    address TEXT PRIMARY KEY,
+    run_id INTEGER NOT NULL,
+    status TEXT,
+    last_status_change_date TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_indexers_status ON indexers(status);
+CREATE TABLE IF NOT EXISTS status_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id INTEGER NOT NULL DEFAULT 0,
+    logged_at INTEGER,
+    address TEXT NOT NULL,
+    previous_status TEXT,
+    new_status TEXT,
+    date_status_change TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_status_changes_address ON status_changes(address);
+CREATE INDEX IF NOT EXISTS idx_status_changes_run ON status_changes(run_id);
+CREATE TABLE IF NOT EXISTS ens_names (
+    address TEXT PRIMARY KEY,
+    name TEXT,
+    resolved_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    hash TEXT PRIMARY KEY,
+    block_number INTEGER,
+    timestamp INTEGER,
+    saved_at INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_saved_at ON transactions(saved_at);
+CREATE TABLE IF NOT EXISTS subscribers (
+    chat_id INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    active INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_subscribers_active ON subscribers(active);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Files imported into a new database, so enabling STATE_DB keeps the existing state
+ACTIVE_INDEXERS_FILE = 'active_indexers.json'
+PREVIOUS_RUN_FILE = 'active_indexers_previous_run.json'
+ENS_CACHE_FILE = 'ens_resolution.json'
+LAST_TRANSACTION_FILE = 'last_transaction.json'
+SUBSCRIBERS_FILE = 'subscribers_telegram.json'
+LAST_NOTIFICATION_FILE = 'last_telegram_notification.json'
+
+_store: Optional['StateStore'] = None
+_configured = False
+_store_lock = threading.Lock()
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(value, 0) if isinstance(value, str) else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _read_json(path: str) -> Optional[dict]:
+    if not os.path.exists(path):
+        return None
+    try:
+        return serialization.load_file(path)
+    except Exception as e:
+        print(f"⚠ Could not read {path}: {e}")
+        return None
+
+
+class StateStore:
+    """
+    Repository over the SQLite state database.
+
+    Every write runs in a single transaction, and lookups by address, run or status go
+    through indexes instead of parsing whole files. The database uses WAL journaling so
+    the bot can read and write subscribers while the dashboard generator runs.
+
+    Only the latest keep_runs runs keep their snapshots; older runs are deleted when a run
+    is saved. Their status changes stay in the status_changes table.
+    """
+
+    def __init__(self, db_path: str, keep_runs: int = DEFAULT_KEEP_RUNS):
+        self.db_path = db_path
+        self.keep_runs = max(keep_runs, MIN_KEEP_RUNS)
+        is_new = not os.path.exists(db_path)
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.RLock()
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA foreign_keys=ON")
+            self._migrate()
+            self.conn.executescript(SCHEMA)
+        if is_new:
+            self.import_json_files()
+        self.set_meta("schema_version", SCHEMA_VERSION)
+
+    def _migrate(self) -> None:
+        """Bring a database created by an earlier version up to the current schema."""
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(status_changes)")}
+        if columns and "run_id" not in columns:
+            # Schema version 1 had no run IDs; its changes are treated as run 0
+            self.conn.execute("ALTER TABLE status_changes ADD COLUMN run_id INTEGER NOT NULL DEFAULT 0")
+            self.conn.execute("ALTER TABLE status_changes ADD COLUMN logged_at INTEGER")
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+    # ========== Metadata ==========
+
+    def get_meta(self, key: str, default=None):
+        """Return a JSON value from the metadata table."""
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM metadata WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row else default
+
+    def set_meta(self, key: str, value) -> None:
+        """Store a JSON value in the metadata table."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                (key, json.dumps(value))
+            )
+
+    # ========== Runs and indexers ==========
+
+    def save_run(self, data: dict, run_id: Optional[int] = None) -> int:
+        """
+        Store a run's indexer set as a snapshot and make it the current indexer set.
+
+        Runs older than the latest keep_runs runs are deleted in the same transaction.
+
+        Args:
+            data: Indexer data in the active_indexers.json format ({"metadata", "indexers"})
+            run_id: Existing run to overwrite (a new run is created if not given)
+
+        Returns:
+            The run's ID
+        """
+        indexers = data.get("indexers", [])
+        metadata = json.dumps(data.get("metadata", {}))
+        with self.lock, self.conn:
+            if run_id is None:
+                cursor = self.conn.execute(
+                    "INSERT INTO runs (created_at, metadata) VALUES (?, ?)",
+                    (int(time.time()), metadata)
+                )
+                run_id = cursor.lastrowid
+            else:
+                self.conn.execute("UPDATE runs SET metadata = ? WHERE run_id = ?", (metadata, run_id))
+                self.conn.execute("DELETE FROM snapshots WHERE run_id = ?", (run_id,))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO snapshots (run_id, position, address, status, data) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (run_id, position, indexer.get("address", "").lower(), indexer.get("status"), json.dumps(indexer))
+                    for position, indexer in enumerate(indexers)
+                ]
+            )
+            self.conn.execute("DELETE FROM indexers")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO indexers (address, run_id, status, last_status_change_date, data) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (indexer.get("address", "").lower(), run_id, indexer.get("status"), indexer.get("last_status_change_date"), json.dumps(indexer))
+                    for indexer in indexers
+                ]
+            )
+            self._prune_runs()
+        return run_id
+
+    def _prune_runs(self) -> None:
+        """Delete the snapshots and metadata of the runs before the latest keep_runs runs (call inside a transaction)."""
+        row = self.conn.execute(
+            "SELECT run_id FROM runs ORDER BY run_id DESC LIMIT 1 OFFSET ?", (self.keep_runs - 1,)
+        ).fetchone()
+        if row is None:
+            return
+        self.conn.execute("DELETE FROM snapshots WHERE run_id < ?", (row["run_id"],))
+        self.conn.execute("DELETE FROM runs WHERE run_id < ?", (row["run_id"],))
+
+    def get_run_ids(self, limit: int = 2) -> List[int]:
+        """Return the IDs of the latest runs, newest first."""
+        with self.lock:
+            rows = self.conn.execute("SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?", (limit,)).fetchall()
+        return [row["run_id"] for row in rows]
+
+    def load_run(self, run_id: Optional[int] = None) -> Optional[dict]:
+        """
+        Load a run's snapshot in the active_indexers.json format.
+
+        Args:
+            run_id: Run to load (defaults to the latest run)
+
+        Returns:
+            {"metadata": ..., "indexers": [...]} or None if there is no such run
+        """
+        if run_id is None:
+            run_ids = self.get_run_ids(1)
+            if not run_ids:
+                return None
+            run_id = run_ids[0]
+        with self.lock:
+            run = self.conn.execute("SELECT metadata FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if run is None:
+                return None
+            rows = self.conn.execute(
+                "SELECT data FROM snapshots WHERE run_id = ? ORDER BY position", (run_id,)
+            ).fetchall()
+        return {
+            "metadata": json.loads(run["metadata"]),
+            "indexers": [json.loads(row["data"]) for row in rows],
+        }
+
+    def load_previous_run(self, run_id: Optional[int] = None) -> Optional[dict]:
+        """
+        Load the run before a run.
+
+        Args:
+            run_id: Run whose predecessor to load (defaults to the next, not yet stored run,
+                i.e. the latest stored run is returned)
+        """
+        with self.lock:
+            if run_id is None:
+                row = self.conn.execute("SELECT MAX(run_id) FROM runs").fetchone()
+            else:
+                row = self.conn.execute("SELECT MAX(run_id) FROM runs WHERE run_id < ?", (run_id,)).fetchone()
+        return self.load_run(row[0]) if row[0] is not None else None
+
+    def get_indexer(self, address: str) -> Optional[dict]:
+        """Look up an indexer of the current indexer set by address."""
+        with self.lock:
+            row = self.conn.execute("SELECT data FROM indexers WHERE address = ?", (address.lower(),)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    # ========== Status changes ==========
+
+    def add_status_changes(self, changes: List[dict], metadata: Optional[dict] = None, run_id: int = 0) -> None:
+        """
+        Append a run's status change entries and update the activity log metadata in one transaction.
+
+        Args:
+            changes: Status change entries (address, previous_status, new_status, date_status_change)
+            metadata: Activity log metadata to store (optional)
+            run_id: Run the changes were detected in
+        """
+        logged_at = int(time.time())
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT INTO status_changes (run_id, logged_at, address, previous_status, new_status, date_status_change) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (change.get("run_id", run_id), change.get("logged_at", logged_at), change.get("address", ""), change.get("previous_status"), change.get("new_status"), change.get("date_status_change"))
+                    for change in changes
+                ]
+            )
+            if metadata is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO metadata (key, value) VALUES ('activity_log', ?)",
+                    (json.dumps(metadata),)
+                )
+
+    def get_status_changes(self, addresses: Optional[List[str]] = None, after_run_id: Optional[int] = None) -> List[dict]:
+        """
+        Return status change entries in the order they were logged.
+
+        Args:
+            addresses: Only return changes of these addresses (optional)
+            after_run_id: Only return changes of the runs after this run (optional)
+        """
+        sql = "SELECT address, previous_status, new_status, date_status_change, run_id, logged_at FROM status_changes WHERE 1 = 1"
+        params: list = []
+        if after_run_id is not None:
+            sql += " AND run_id > ?"
+            params.append(after_run_id)
+        if addresses is not None:
+            lowered = [address.lower() for address in addresses]
+            sql += f" AND lower(address) IN ({','.join('?' * len(lowered))})"
+            params.extend(lowered)
+        with self.lock:
+            rows = self.conn.execute(sql + " ORDER BY id", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def count_status_changes(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM status_changes").fetchone()[0]
+
+    def load_activity_log(self, after_run_id: Optional[int] = None) -> dict:
+        """
+        Return the activity log as {"metadata": ..., "status_changes": [...]}.
+
+        Args:
+            after_run_id: Only include changes of the runs after this run (optional)
+        """
+        return {
+            "metadata": self.get_meta("activity_log", {}),
+            "status_changes": self.get_status_changes(after_run_id=after_run_id),
+        }
+
+    # ========== ENS names ==========
+
+    def load_ens_entries(self) -> Dict[str, dict]:
+        """Return the ENS cache entries ({address: {"name", "resolved_at"}})."""
+        with self.lock:
+            rows = self.conn.execute("SELECT address, name, resolved_at FROM ens_names").fetchall()
+        return {row["address"]: {"name": row["name"], "resolved_at": row["resolved_at"]} for row in rows}
+
+    def save_ens_entries(self, entries: Dict[str, dict]) -> None:
+        """Insert or update ENS cache entries."""
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ens_names (address, name, resolved_at) VALUES (?, ?, ?)",
+                [
+                    (address.lower(), entry.get("name"), entry.get("resolved_at", 0))
+                    for address, entry in entries.items()
+                ]
+            )
+
+    # ========== Transactions ==========
+
+    def save_transaction(self, transaction: dict, saved_at: Optional[int] = None) -> None:
+        """Store a transaction; the most recently saved one is the last transaction."""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO transactions (hash, block_number, timestamp, saved_at, data) VALUES (?, ?, ?, ?, ?)",
+                (
+                    transaction.get("hash"),
+                    _to_int(transaction.get("blockNumber")),
+                    _to_int(transaction.get("timeStamp")),
+                    saved_at or int(time.time()),
+                    json.dumps(transaction),
+                )
+            )
+
+    def get_last_transaction(self) -> Optional[dict]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data FROM transactions ORDER BY saved_at DESC, rowid DESC LIMIT 1"
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    # ========== Subscribers ==========
+
+    def load_subscribers(self) -> dict:
+        """Return the subscribers in the subscribers_telegram.json format."""
+        with self.lock:
+            rows = self.conn.execute("SELECT data FROM subscribers ORDER BY position").fetchall()
+        return {
+            "subscribers": [json.loads(row["data"]) for row in rows],
+            "stats": self.get_meta("subscriber_stats", {"total_subscribers": 0, "total_notifications_sent": 0}),
+        }
+
+    def get_active_subscribers(self) -> List[dict]:
+        with self.lock:
+            rows = self.conn.execute("SELECT data FROM subscribers WHERE active = 1 ORDER BY position").fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def save_subscribers(self, data: dict) -> None:
+        """Replace the subscribers and their stats in one transaction."""
+        subscribers = data.get("subscribers", [])
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM subscribers")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO subscribers (chat_id, position, active, data) VALUES (?, ?, ?, ?)",
+                [
+                    (subscriber.get("chat_id"), position, int(bool(subscriber.get("active", False))), json.dumps(subscriber, ensure_ascii=False))
+                    for position, subscriber in enumerate(subscribers)
+                ]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('subscriber_stats', ?)",
+                (json.dumps(data.get("stats", {})),)
+            )
+
+    def increment_notifications_sent(self) -> None:
+        with self.lock:
+            stats = self.get_meta("subscriber_stats", {})
+            stats["total_notifications_sent"] = stats.get("total_notifications_sent", 0) + 1
+            self.set_meta("subscriber_stats", stats)
+
+    # ========== Migration ==========
+
+    def import_json_files(self, directory: str = '.') -> None:
+        """Import the state of the JSON files in a directory (used when the database is created)."""
+        def path(name: str) -> str:
+            return os.path.join(directory, name)
+
+        imported = []
+        for file_name in (PREVIOUS_RUN_FILE, ACTIVE_INDEXERS_FILE):
+            data = _read_json(path(file_name))
+            if data and data.get("indexers"):
+                self.save_run(data)
+                imported.append(file_name)
+
+        # The log numbers its runs independently of the database, so imported changes
+        # are filed under run 0 and the log's run IDs are dropped
+        if os.path.exists(path(activity_log.DEFAULT_LOG_FILE)):
+            log_metadata = activity_log.load_metadata(path(activity_log.DEFAULT_METADATA_FILE))
+            log_metadata.pop("last_run_id", None)
+            self.add_status_changes(
+                [
+                    dict(change, run_id=0)
+                    for change in activity_log.read_history(
+                        log_file=path(activity_log.DEFAULT_LOG_FILE),
+                        archive_dir=path(activity_log.DEFAULT_ARCHIVE_DIR)
+                    )
+                ],
+                log_metadata
+            )
+            imported.append(activity_log.DEFAULT_LOG_FILE)
+        else:
+            legacy_log = _read_json(path(activity_log.LEGACY_LOG_FILE))
+            if legacy_log:
+                self.add_status_changes(legacy_log.get("status_changes", []), legacy_log.get("metadata", {}))
+                imported.append(activity_log.LEGACY_LOG_FILE)
+
+        ens_cache = _read_json(path(ENS_CACHE_FILE))
+        if ens_cache:
+            entries = ens_cache.get("entries") or {
+                address: {"name": name, "resolved_at": 0}
+                for address, name in ens_cache.get("ens_resolutions", {}).items()
+            }
+            self.save_ens_entries(entries)
+            imported.append(ENS_CACHE_FILE)
+
+        transaction = _read_json(path(LAST_TRANSACTION_FILE))
+        if transaction and transaction.get("hash"):
+            self.save_transaction(transaction)
+            imported.append(LAST_TRANSACTION_FILE)
+
+        subscribers = _read_json(path(SUBSCRIBERS_FILE))
+        if subscribers:
+            self.save_subscribers(subscribers)
+            imported.append(SUBSCRIBERS_FILE)
+
+        last_notification = _read_json(path(LAST_NOTIFICATION_FILE))
+        if last_notification:
+            last_notification.pop("last_notified_run_id", None)
+            self.set_meta("last_notification", last_notification)
+            imported.append(LAST_NOTIFICATION_FILE)
+
+        if imported:
+            print(f"✓ Imported {', '.join(imported)} into {self.db_path}")
+
+
+def configure(db_path: Optional[str], keep_runs: Optional[int] = None) -> Optional[StateStore]:
+    """
+    Open the state database used by get_store().
+
+    Args:
+        db_path: Path to the SQLite database (created on first use), or None to use the JSON files
+        keep_runs: Number of runs whose snapshots are kept (defaults to STATE_DB_KEEP_RUNS)
+
+    Returns:
+        The opened store, or None if db_path is not set
+    """
+    global _store, _configured
+    with _store_lock:
+        if _store is not None:
+            if db_path and os.path.abspath(db_path) == os.path.abspath(_store.db_path):
+                return _store
+            _store.close()
+        if keep_runs is None:
+            keep_runs = int(os.getenv("STATE_DB_KEEP_RUNS", str(DEFAULT_KEEP_RUNS)))
+        _store = StateStore(db_path, keep_runs) if db_path else None
+        _configured = True
+        return _store
+
+
+def get_store() -> Optional[StateStore]:
+    """Return the shared store, opening STATE_DB on first use (None when STATE_DB is not set)."""
+    if not _configured:
+        configure(os.getenv("STATE_DB"))
+    return _store
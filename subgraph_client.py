@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Subgraph Client for REO Dashboard
+GraphQL helpers used to query The Graph's network and ENS subgraphs.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+import http_client
+
+# Maximum page size accepted by graph-node for a single entity query
+DEFAULT_PAGE_SIZE = 1000
+
+
+def query(url: str, graphql_query: str, variables: Optional[dict] = None, timeout: int = 30) -> dict:
+    """
+    Execute a GraphQL query against a subgraph.
+
+    Args:
+        url: Subgraph query URL
+        graphql_query: GraphQL query string
+        variables: Query variables (optional)
+        timeout: HTTP timeout in seconds
+
+    Returns:
+        The response's data object
+
+    Raises:
+        requests.RequestException: If the HTTP request fails
+        RuntimeError: If the subgraph returns GraphQL errors
+    """
+    payload = {"query": graphql_query}
+    if variables:
+        payload["variables"] = variables
+
+    response = http_client.post(
+        url,
+        json=payload,
+        headers={"Content-Type": "application/json"},
+        timeout=timeout
+    )
+    response.raise_for_status()
+
+    data = response.json()
+    if "errors" in data:
+        raise RuntimeError(f"GraphQL Error: {data['errors']}")
+    return data.get("data") or {}
+
+
+def paginate(url: str, graphql_query: str, entity: str, variables: Optional[dict] = None, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = True) -> Iterator[List[dict]]:
+    """
+    Walk all entities of a query page by page, using id_gt cursors.
+
+    The query must take `$first: Int!` and `$lastId: String!` variables and select
+    `id` with `orderBy: id, orderDirection: asc` and `where: {id_gt: $lastId}`.
+    Cursors do not degrade like `skip` does, so this scales with the entity count.
+    With prefetch enabled, the next page is requested while the caller processes the
+    current one.
+
+    Args:
+        url: Subgraph query URL
+        graphql_query: GraphQL query string with $first and $lastId variables
+        entity: Name of the entity field in the response (e.g. 'indexers')
+        variables: Additional query variables (optional)
+        page_size: Number of entities per page
+        prefetch: If True, fetch the next page in the background
+
+    Yields:
+        Lists of entities, one per page, in id order
+    """
+    def fetch(last_id: str) -> List[dict]:
+        page_variables = dict(variables or {}, first=page_size, lastId=last_id)
+        return query(url, graphql_query, page_variables).get(entity) or []
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch, "")
+        while pending is not None:
+            page = pending.result()
+            if not page:
+                return
+
+            # A full page means there may be more
+            has_more = len(page) == page_size
+            pending = executor.submit(fetch, page[-1]["id"]) if has_more and prefetch else None
+            yield page
+            if has_more and not prefetch:
+                pending = executor.submit(fetch, page[-1]["id"])
@@ -4,7 +4,6 @@ Telegram Bot for REO Dashboard Notifications
 Handles user subscriptions and manages the subscriber database.
 """
 
-import json
 import os
 import logging
 from datetime import datetime
@@ -12,6 +11,9 @@ from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 from dotenv import load_dotenv
 
+import serialization
+import state_store
+
 # Load environment variables
 load_dotenv()
 
@@ -37,6 +39,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request URL at INFO, and Telegram API URLs contain the bot token
+logging.getLogger('httpx').setLevel(logging.WARNING)
+logging.getLogger('httpcore').setLevel(logging.WARNING)
+
 # Set up activity logger for tracking subscriber actions
 activity_logger = logging.getLogger('activity')
 activity_logger.setLevel(logging.INFO)
@@ -46,8 +52,9 @@ activity_logger.addHandler(activity_handler)
 
 
 def load_subscribers():
-    """Load subscribers from JSON file."""
-    if not os.path.exists(SUBSCRIBERS_FILE):
+    """Load subscribers from JSON file (or the state database when STATE_DB is set)."""
+    store = state_store.get_store()
+    if store is None and not os.path.exists(SUBSCRIBERS_FILE):
         return {
             "subscribers": [],
             "stats": {
@@ -57,8 +64,9 @@ def load_subscribers():
         }
     
     try:
-        with open(SUBSCRIBERS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if store is not None:
+            return store.load_subscribers()
+        return serialization.load_file(SUBSCRIBERS_FILE)
     except Exception as e:
         logger.error(f"Error loading subscribers: {e}")
         return {
@@ -71,10 +79,14 @@ def load_subscribers():
 
 
 def save_subscribers(data):
-    """Save subscribers to JSON file."""
+    """Save subscribers to JSON file (or the state database when STATE_DB is set)."""
     try:
-        with open(SUBSCRIBERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        store = state_store.get_store()
+        if store is not None:
+            store.save_subscribers(data)
+            return True
+        
+        serialization.dump_file(SUBSCRIBERS_FILE, data)
         return True
     except Exception as e:
         logger.error(f"Error saving subscribers: {e}")
@@ -4,7 +4,6 @@ Telegram Notifier for REO Dashboard
 Sends notifications to all subscribed users about oracle updates and status changes.
 """
 
-import json
 import os
 import logging
 from datetime import datetime, timezone
@@ -13,13 +12,20 @@ from telegram import Bot
 from telegram.error import TelegramError
 from dotenv import load_dotenv
 
+import serialization
+import state_store
+from activity_log import DEFAULT_ARCHIVE_DIR, DEFAULT_INDEX_FILE, DEFAULT_LOG_FILE, DEFAULT_METADATA_FILE, load_metadata, migrate_legacy_log, read_changes_since
+
 # Load environment variables
 load_dotenv()
 
 # Configuration
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 SUBSCRIBERS_FILE = 'subscribers_telegram.json'
-ACTIVITY_LOG_FILE = 'activity_log_indexers_status_changes.json'
+ACTIVITY_LOG_FILE = DEFAULT_LOG_FILE
+ACTIVITY_LOG_METADATA_FILE = DEFAULT_METADATA_FILE
+ACTIVITY_LOG_INDEX_FILE = DEFAULT_INDEX_FILE
+ACTIVITY_LOG_ARCHIVE_DIR = os.getenv('ACTIVITY_LOG_ARCHIVE_DIR', DEFAULT_ARCHIVE_DIR)
 ACTIVE_INDEXERS_FILE = 'active_indexers.json'
 LAST_NOTIFICATION_FILE = 'last_telegram_notification.json'
 DASHBOARD_URL = 'http://dashboards.thegraph.foundation/reo/'
@@ -31,30 +37,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request URL at INFO; Telegram API URLs contain the bot token and RPC URLs API keys
+logging.getLogger('httpx').setLevel(logging.WARNING)
+logging.getLogger('httpcore').setLevel(logging.WARNING)
+
 
 def load_subscribers():
-    """Load active subscribers from JSON file."""
+    """Load active subscribers from JSON file (or the state database when STATE_DB is set)."""
+    store = state_store.get_store()
+    if store is not None:
+        return store.get_active_subscribers()
+    
     if not os.path.exists(SUBSCRIBERS_FILE):
         return []
     
     try:
-        with open(SUBSCRIBERS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Return only active subscribers
-            return [sub for sub in data.get("subscribers", []) if sub.get("active", False)]
+        data = serialization.load_file(SUBSCRIBERS_FILE)
+        # Return only active subscribers
+        return [sub for sub in data.get("subscribers", []) if sub.get("active", False)]
     except Exception as e:
         logger.error(f"Error loading subscribers: {e}")
         return []
 
 
-def load_activity_log():
-    """Load activity log to check for status changes."""
-    if not os.path.exists(ACTIVITY_LOG_FILE):
-        return None
+def load_activity_log(after_run_id=None):
+    """
+    Load the status changes logged since the last notified run.
     
+    The log's run index is used to seek straight to those runs, so older history is
+    never read. Without a notified run, only the changes of the latest run are loaded.
+    """
+    store = state_store.get_store()
     try:
-        with open(ACTIVITY_LOG_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if store is not None:
+            metadata = store.get_meta('activity_log', {})
+        else:
+            migrate_legacy_log(ACTIVITY_LOG_FILE, ACTIVITY_LOG_METADATA_FILE)
+            if not os.path.exists(ACTIVITY_LOG_METADATA_FILE):
+                return None
+            metadata = load_metadata(ACTIVITY_LOG_METADATA_FILE)
+        
+        if after_run_id is None:
+            after_run_id = max(metadata.get("last_run_id", 0) - 1, 0)
+        
+        if store is not None:
+            status_changes = store.get_status_changes(after_run_id=after_run_id)
+        else:
+            status_changes = list(read_changes_since(after_run_id, ACTIVITY_LOG_FILE, ACTIVITY_LOG_INDEX_FILE, ACTIVITY_LOG_ARCHIVE_DIR))
+        return {"metadata": metadata, "status_changes": status_changes}
     except Exception as e:
         logger.error(f"Error loading activity log: {e}")
         return None
@@ -62,58 +92,74 @@ def load_activity_log():
 
 def load_active_indexers():
     """Load active indexers data."""
+    store = state_store.get_store()
+    if store is not None:
+        return store.load_run()
+    
     if not os.path.exists(ACTIVE_INDEXERS_FILE):
         return None
     
     try:
-        with open(ACTIVE_INDEXERS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return serialization.load_file(ACTIVE_INDEXERS_FILE)
     except Exception as e:
         logger.error(f"Error loading active indexers: {e}")
         return None
 
 
+def load_last_notification():
+    """Load the record of the last notification (empty if none was sent yet)."""
+    store = state_store.get_store()
+    if store is not None:
+        return store.get_meta('last_notification', {})
+    
+    if not os.path.exists(LAST_NOTIFICATION_FILE):
+        return {}
+    
+    return serialization.load_file(LAST_NOTIFICATION_FILE)
+
+
 def check_last_notification():
     """
     Check if we already sent a notification today.
     Returns True if we can send (no notification today yet), False otherwise.
     """
-    if not os.path.exists(LAST_NOTIFICATION_FILE):
-        return True  # No record, so we can send
-    
     try:
-        with open(LAST_NOTIFICATION_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            last_date = data.get('last_notification_date')
-            
-            if not last_date:
-                return True
-            
-            # Get today's date in UTC
-            today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-            
-            # If last notification was today, skip
-            if last_date == today:
-                logger.info(f"Notification already sent today ({today})")
-                return False
-            
+        data = load_last_notification()
+        last_date = data.get('last_notification_date')
+        
+        if not last_date:
             return True
+        
+        # Get today's date in UTC
+        today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+        
+        # If last notification was today, skip
+        if last_date == today:
+            logger.info(f"Notification already sent today ({today})")
+            return False
+        
+        return True
     except Exception as e:
         logger.error(f"Error checking last notification: {e}")
         return True  # On error, allow sending
 
 
-def save_notification_timestamp():
-    """Save the current date as the last notification date."""
+def save_notification_timestamp(last_run_id=None):
+    """Save the current date, and the last run whose changes were sent, as the last notification."""
     try:
         today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
         data = {
             'last_notification_date': today,
             'last_notification_timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
         }
+        if last_run_id is not None:
+            data['last_notified_run_id'] = last_run_id
         
-        with open(LAST_NOTIFICATION_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        store = state_store.get_store()
+        if store is not None:
+            store.set_meta('last_notification', data)
+        else:
+            serialization.dump_file(LAST_NOTIFICATION_FILE, data)
         
         logger.info(f"Saved notification timestamp for {today}")
     except Exception as e:
@@ -123,16 +169,19 @@ def save_notification_timestamp():
 def update_notification_stats():
     """Update the notification counter in subscribers file."""
     try:
+        store = state_store.get_store()
+        if store is not None:
+            store.increment_notifications_sent()
+            return
+        
         if not os.path.exists(SUBSCRIBERS_FILE):
             return
         
-        with open(SUBSCRIBERS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = serialization.load_file(SUBSCRIBERS_FILE)
         
         data["stats"]["total_notifications_sent"] = data.get("stats", {}).get("total_notifications_sent", 0) + 1
         
-        with open(SUBSCRIBERS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        serialization.dump_file(SUBSCRIBERS_FILE, data)
     except Exception as e:
         logger.error(f"Error updating notification stats: {e}")
 
@@ -336,8 +385,13 @@ async def send_notifications_async():
         print("ℹ️ No active Telegram subscribers")
         return False
     
-    # Load data
-    activity_log = load_activity_log()
+    # Load data: only the changes of the runs since the last notification
+    try:
+        last_notified_run_id = load_last_notification().get('last_notified_run_id')
+    except Exception as e:
+        logger.error(f"Error loading last notification: {e}")
+        last_notified_run_id = None
+    activity_log = load_activity_log(last_notified_run_id)
     indexers_data = load_active_indexers()
     
     if not indexers_data:
@@ -394,7 +448,8 @@ async def send_notifications_async():
     # Update stats and save notification timestamp
     if success_count > 0:
         update_notification_stats()
-        save_notification_timestamp()
+        last_run_id = activity_log.get("metadata", {}).get("last_run_id") if activity_log else None
+        save_notification_timestamp(last_run_id)
     
     print(f"✅ Telegram notifications sent: {success_count} successful, {fail_count} failed")
     logger.info(f"Notifications sent: {success_count} successful, {fail_count} failed")
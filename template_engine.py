@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Template Engine for REO Dashboard
+A small compiled-template engine for the dashboard page.
+
+Templates live in templates/ and use a minimal Jinja-like syntax:
+
+    {{ name }} / {{ row.field }}      insert a value (not escaped; escape it before rendering)
+    {% for row in rows %}...{% endfor %}
+    {% if name %}...{% else %}...{% endif %}
+    {# comment #}                     dropped from the output
+
+As in Jinja, a single newline at the end of the template file is not rendered.
+
+A template is parsed once into a Python function. The compiled code object is cached in
+memory and on disk (marshal, keyed by the template's content and the Python version), so
+later runs skip parsing and compilation entirely.
+"""
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+# Directory of the page templates
+DEFAULT_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+# Compiled templates are cached in this subdirectory of the template directory
+CACHE_DIR_NAME = '.cache'
+
+# Bump when the generated code changes, so stale cache files are not used
+ENGINE_VERSION = '1'
+
+_TOKEN_PATTERN = re.compile(r'(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})', re.DOTALL)
+_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$')
+
+_templates: Dict[str, 'Template'] = {}
+
+
+class TemplateError(Exception):
+    """Raised for a syntax error in a template."""
+
+
+def _get(obj: Any, key: str) -> Any:
+    if isinstance(obj, dict):
+        return obj[key]
+    return getattr(obj, key)
+
+
+def _compile_source(source: str, name: str) -> str:
+    """Translate a template into the Python source of a render(_ctx) function."""
+    if source.endswith('\n'):
+        source = source[:-1]
+    lines = ["def render(_ctx):", " _out = []", " _append = _out.append"]
+    loop_vars: List[str] = []
+    blocks: List[str] = []
+
+    def expression(text: str) -> str:
+        text = text.strip()
+        if not _NAME_PATTERN.match(text):
+            raise TemplateError(f"{name}: unsupported expression '{text}'")
+        first, *keys = text.split('.')
+        code = f"_v_{first}" if first in loop_vars else f"_ctx[{first!r}]"
+        for key in keys:
+            code = f"_get({code}, {key!r})"
+        return code
+
+    def emit(code: str) -> None:
+        lines.append(' ' * (len(blocks) + 1) + code)
+
+    for token in _TOKEN_PATTERN.split(source):
+        if not token:
+            continue
+        if token.startswith('{#'):
+            continue
+        if token.startswith('{{'):
+            emit(f"_append(str({expression(token[2:-2])}))")
+            continue
+        if not token.startswith('{%'):
+            emit(f"_append({token!r})")
+            continue
+
+        words = token[2:-2].split()
+        tag = words[0] if words else ''
+        if tag == 'for' and len(words) == 4 and words[2] == 'in':
+            emit(f"for _v_{words[1]} in {expression(words[3])}:")
+            loop_vars.append(words[1])
+            blocks.append('for')
+        elif tag == 'if' and len(words) == 2:
+            emit(f"if {expression(words[1])}:")
+            blocks.append('if')
+        elif tag == 'else' and blocks and blocks[-1] == 'if':
+            emit("pass")
+            lines.append(' ' * len(blocks) + "else:")
+        elif tag in ('endfor', 'endif') and blocks and blocks[-1] == tag[3:]:
+            # Keep empty blocks valid Python
+            emit("pass")
+            if blocks.pop() == 'for':
+                loop_vars.pop()
+        else:
+            raise TemplateError(f"{name}: unexpected tag '{token}'")
+
+    if blocks:
+        raise TemplateError(f"{name}: unclosed '{blocks[-1]}' block")
+    lines.append(" return ''.join(_out)")
+    return '\n'.join(lines) + '\n'
+
+
+class Template:
+    """A compiled template; render() fills it with a context."""
+
+    def __init__(self, code, name: str):
+        namespace: Dict[str, Any] = {'_get': _get}
+        exec(code, namespace)
+        self.name = name
+        self._render: Callable[[dict], str] = namespace['render']
+
+    def render(self, **context: Any) -> str:
+        """Render the template with the given variables."""
+        return self._render(context)
+
+
+def compile_template(source: str, name: str = '<template>'):
+    """Compile template source to a code object."""
+    return compile(_compile_source(source, name), f"<template {name}>", 'exec')
+
+
+def load_template(name: str, template_dir: str = DEFAULT_TEMPLATE_DIR, cache_dir: Optional[str] = None) -> Template:
+    """
+    Load a compiled template, compiling and caching it if its source changed.
+
+    Args:
+        name: File name of the template in template_dir (e.g. 'dashboard.html')
+        template_dir: Directory of the templates
+        cache_dir: Directory of the compiled templates (default: <template_dir>/.cache)
+
+    Returns:
+        The compiled template
+
+    Raises:
+        TemplateError: If the template has a syntax error
+    """
+    path = os.path.join(template_dir, name)
+    with open(path, 'rb') as f:
+        source = f.read()
+
+    digest = hashlib.sha256(source + ENGINE_VERSION.encode() + importlib.util.MAGIC_NUMBER).hexdigest()[:16]
+    memory_key = f"{path}:{digest}"
+    if memory_key in _templates:
+        return _templates[memory_key]
+
+    cache_dir = cache_dir or os.path.join(template_dir, CACHE_DIR_NAME)
+    cache_file = os.path.join(cache_dir, f"{name}.{digest}.marshal")
+    code = None
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as f:
+                code = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            code = None
+
+    if code is None:
+        code = compile_template(source.decode('utf-8'), name)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_file = f"{cache_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                marshal.dump(code, f)
+            os.replace(tmp_file, cache_file)
+            # Drop the compiled versions of earlier revisions of the template
+            for old_file in os.listdir(cache_dir):
+                if old_file.startswith(f"{name}.") and old_file.endswith('.marshal') and old_file != os.path.basename(cache_file):
+                    os.remove(os.path.join(cache_dir, old_file))
+        except OSError as e:
+            # The cache only saves time; a read-only checkout still renders
+            print(f"⚠ Could not cache compiled template {name}: {e}")
+
+    template = Template(code, name)
+    _templates[memory_key] = template
+    return template
+
+
+def render(name: str, template_dir: str = DEFAULT_TEMPLATE_DIR, **context: Any) -> str:
+    """Load a template and render it with the given variables."""
+    return load_template(name, template_dir).render(**context)
@@ -0,0 +1,292 @@
+// Search, filter and sort of the dashboard page (templates/dashboard.html), published as app.<hash>.js
+
+// Table data, loaded from the data file (see loadData)
+let originalData = [];
+let currentData = [];
+let sortColumn = -1;
+let sortDirection = 'asc';
+let activeFilter = null;
+
+// Search functionality
+const searchInput = document.getElementById('searchInput');
+const tableBody = document.getElementById('tableBody');
+const totalCount = document.getElementById('totalCount');
+const filteredCount = document.getElementById('filteredCount');
+
+// Apply both search and filter
+function applyFilters() {
+    const searchTerm = searchInput.value.toLowerCase();
+
+    currentData = originalData.filter(row => {
+        // Check search term
+        const matchesSearch = row[0].toLowerCase().includes(searchTerm) || 
+                             row[1].toLowerCase().includes(searchTerm);
+
+        // Check status filter (row[7] is the status string)
+        const matchesFilter = !activeFilter || row[7] === activeFilter;
+
+        return matchesSearch && matchesFilter;
+    });
+
+    renderTable();
+    updateStats();
+}
+
+searchInput.addEventListener('input', applyFilters);
+
+// Filter by status functionality
+function filterByStatus(status) {
+    // Toggle filter
+    if (activeFilter === status) {
+        activeFilter = null;
+        // Remove active class from all buttons
+        document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
+    } else {
+        activeFilter = status;
+        // Remove active class from all buttons
+        document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
+        // Add active class to clicked button
+        document.querySelector(`.filter-btn.${status}`).classList.add('active');
+    }
+
+    applyFilters();
+}
+
+// Reset filter
+function resetFilter() {
+    activeFilter = null;
+    searchInput.value = '';
+    // Remove active class from all buttons
+    document.querySelectorAll('.filter-btn').forEach(btn => btn.classList.remove('active'));
+    applyFilters();
+}
+
+// Sorting functionality
+function sortTable(column) {
+    if (sortColumn === column) {
+        sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
+    } else {
+        sortColumn = column;
+        sortDirection = 'asc';
+    }
+
+    // Special handling when sorting by ENS name column (index 1)
+    if (column === 1) {
+        // Separate rows with ENS from rows without ENS
+        const withENS = [];
+        const withoutENS = [];
+
+        currentData.forEach(row => {
+            const ens = row[1].toLowerCase();
+            if (ens === '' || ens === 'no ens') {
+                withoutENS.push(row);
+            } else {
+                withENS.push(row);
+            }
+        });
+
+        // Sort only the rows with ENS
+        withENS.sort((a, b) => {
+            const aENS = a[1].toLowerCase();
+            const bENS = b[1].toLowerCase();
+
+            if (aENS < bENS) return sortDirection === 'asc' ? -1 : 1;
+            if (aENS > bENS) return sortDirection === 'asc' ? 1 : -1;
+            return 0;
+        });
+
+        // Combine: sorted ENS rows + unsorted no-ENS rows at the end
+        if (sortDirection === 'asc') {
+            currentData = [...withENS, ...withoutENS];
+        } else {
+            // In descending order, put no-ENS at beginning
+            currentData = [...withoutENS, ...withENS];
+        }
+
+        renderTable();
+        updateSortHeaders();
+        return;
+    }
+
+    // For all other columns, use regular sort
+    currentData.sort((a, b) => {
+        // Special handling when sorting by status column (index 2)
+        if (column === 2) {
+            // Use the plain text status (row[7]) for sorting
+            const aStatus = a[7].toLowerCase();
+            const bStatus = b[7].toLowerCase();
+
+            if (aStatus < bStatus) return sortDirection === 'asc' ? -1 : 1;
+            if (aStatus > bStatus) return sortDirection === 'asc' ? 1 : -1;
+            return 0;
+        }
+
+        // For other columns, always maintain status priority first
+        // Status order: eligible (0), grace (1), ineligible (2)
+        const getStatusPriority = (statusString) => {
+            if (statusString === 'eligible') return 0;
+            if (statusString === 'grace') return 1;
+            if (statusString === 'ineligible') return 2;
+            return 3;
+        };
+
+        const aStatusPriority = getStatusPriority(a[7]);
+        const bStatusPriority = getStatusPriority(b[7]);
+
+        // If status priority differs, sort by priority
+        if (aStatusPriority !== bStatusPriority) {
+            return aStatusPriority - bStatusPriority;
+        }
+
+        // Within same status group, sort by the selected column
+        let aVal = a[column];
+        let bVal = b[column];
+
+        // All columns are now text, so convert to lowercase for comparison
+        aVal = aVal.toLowerCase();
+        bVal = bVal.toLowerCase();
+
+        if (aVal < bVal) return sortDirection === 'asc' ? -1 : 1;
+        if (aVal > bVal) return sortDirection === 'asc' ? 1 : -1;
+        return 0;
+    });
+
+    renderTable();
+    updateSortHeaders();
+}
+
+function renderTable() {
+    const rowsHTML = [];
+    currentData.forEach((row, index) => {
+        // Rows hold the raw strings (for search and sort); escape them for the markup here
+        const [address, ensName, , lastRenewedShort, lastRenewedFull, eligibleUntilShort, eligibleUntilFull, , lastRenewedOnTx] = row.map(escapeHtml);
+        const status = STATUS_BADGES[row[7]] || STATUS_BADGES.ineligible;
+        const ensDisplay = ensName || 'No ENS';
+        const ensClass = ensName ? 'ens-name' : 'empty-ens';
+        const explorerUrl = `https://thegraph.com/explorer/profile/${address}?view=Indexing&chain=arbitrum-one`;
+
+        // Format Last Renewed cell with transaction link (no tooltip)
+        let lastRenewedCell;
+        if (lastRenewedShort === 'Never') {
+            lastRenewedCell = lastRenewedShort;
+        } else {
+            // If we have a transaction hash, make the date a link with external icon
+            if (lastRenewedOnTx) {
+                lastRenewedCell = `<a href="https://sepolia.arbiscan.io/tx/${lastRenewedOnTx}" target="_blank" class="transaction-hash">${lastRenewedShort}<svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg></a>`;
+            } else {
+                lastRenewedCell = lastRenewedShort;
+            }
+        }
+
+        // Format Eligible Until cell with hover tooltip
+        let eligibleUntilCell = '';
+        if (eligibleUntilShort) {
+            eligibleUntilCell = `<span class="date-hover" data-full-date="${eligibleUntilFull}">${eligibleUntilShort}</span>`;
+        }
+
+        const rowHTML = `
+            <tr>
+                <td><a href="${explorerUrl}" target="_blank" class="address-link"><span class="address">${address}</span><svg class="external-link-icon" viewBox="0 0 16 16" fill="currentColor"><path d="M14 2.5a.5.5 0 0 0-.5-.5h-6a.5.5 0 0 0 0 1h4.793L8.146 7.146a.5.5 0 0 0 .708.708L13 3.707V8.5a.5.5 0 0 0 1 0v-6z"/><path d="M4.5 4a.5.5 0 0 0-.5.5v8a.5.5 0 0 0 .5.5h8a.5.5 0 0 0 .5-.5V9a.5.5 0 0 0-1 0v3H5V5h3a.5.5 0 0 0 0-1h-3.5z"/></svg></a></td>
+                <td><span class="${ensClass}">${ensDisplay}</span></td>
+                <td>${status}</td>
+                <td>${lastRenewedCell}</td>
+                <td>${eligibleUntilCell}</td>
+            </tr>
+        `;
+        rowsHTML.push(rowHTML);
+    });
+    tableBody.innerHTML = rowsHTML.join('');
+}
+
+function updateSortHeaders() {
+    const headers = document.querySelectorAll('th.sortable');
+    headers.forEach((header, index) => {
+        header.className = 'sortable';
+        if (index === sortColumn) {
+            header.classList.add(sortDirection === 'asc' ? 'sort-asc' : 'sort-desc');
+        }
+    });
+}
+
+function updateStats() {
+    totalCount.textContent = originalData.length;
+    filteredCount.textContent = currentData.length;
+}
+
+// Add click handlers to sortable headers
+document.querySelectorAll('th.sortable').forEach((header, index) => {
+    header.addEventListener('click', () => sortTable(index));
+});
+
+const STATUS_BADGES = {
+    eligible: '<span class="legend-badge good">eligible</span>',
+    grace: '<span class="legend-badge grace">grace</span>',
+    ineligible: '<span class="legend-badge ineligible">ineligible</span>'
+};
+
+function escapeHtml(value) {
+    const entities = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'};
+    return String(value ?? '').replace(/[&<>"']/g, char => entities[char]);
+}
+
+// Convert an indexer of the data file to a table row in the column order used above. Values
+// stay raw so search and sort see what the user sees; renderTable() escapes them.
+function toRow(indexer) {
+    const status = String(indexer.status || 'ineligible');
+    return [
+        indexer.address,
+        indexer.ens_name,
+        status,
+        indexer.eligibility_renewal_time_short,
+        indexer.eligibility_renewal_time_readable,
+        indexer.eligible_until_short,
+        indexer.eligible_until_readable,
+        status,
+        indexer.last_renewed_on_tx
+    ].map(value => String(value ?? ''));
+}
+
+function showMetadata(metadata) {
+    document.getElementById('activeCount').textContent = metadata.total_count ?? originalData.length;
+    document.getElementById('eligibleCount').textContent = metadata.eligible_count ?? 0;
+    document.getElementById('graceCount').textContent = metadata.grace_count ?? 0;
+    document.getElementById('ineligibleCount').textContent = metadata.ineligible_count ?? 0;
+    if (metadata.eligibility_period) {
+        const graceDays = Math.floor(metadata.eligibility_period / 86400);
+        document.querySelector('.filter-btn.grace').dataset.tooltip = `Grace period is ${graceDays} days`;
+    }
+}
+
+// Load the indexer data file named by the table's data-src (indexers.<hash>.json)
+function loadData() {
+    fetch(document.getElementById('indexersTable').dataset.src)
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        })
+        .then(data => {
+            originalData = (data.indexers || []).map(toRow);
+            showMetadata(data.metadata || {});
+            applyFilters();
+        })
+        .catch(error => {
+            // Browsers do not let a page opened from disk fetch files next to it
+            const hint = location.protocol === 'file:' ? ' - serve this directory over HTTP, e.g. python3 -m http.server' : '';
+            tableBody.innerHTML = `<tr><td colspan="5" class="table-message">Could not load the indexer data (${escapeHtml(error.message)})${hint}</td></tr>`;
+        });
+}
+
+// Load the time of the last run; the file keeps its name, so always revalidate it
+function loadStatus() {
+    const lastUpdate = document.getElementById('lastUpdate');
+    fetch(lastUpdate.dataset.src, {cache: 'no-cache'})
+        .then(response => response.ok ? response.json() : {})
+        .then(status => {
+            lastUpdate.textContent = status.retrieved || '-';
+        })
+        .catch(() => {});
+}
+
+// Initialize
+loadData();
+loadStatus();